@@ -0,0 +1,246 @@
+"""
+Benchmark the generation throughput per field and locale.
+
+Runs generate_data for every field in field_definitions and every locale of
+the generator page, measures rows per second and peak memory and writes the
+results to a JSON file. Two result files can be compared to spot regressions
+between commits.
+
+Usage:
+    python benchmarks/benchmark_generation.py
+    python benchmarks/benchmark_generation.py --sizes 1000 100000 --locales de_DE
+    python benchmarks/benchmark_generation.py --compare old.json --output new.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import faker  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from data_generator import BLOCK_SIZE, SUPPORTED_LOCALES, generate_data  # noqa: E402
+from field_definitions import field_definitions  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+# Relative slowdown from which a case is reported as a regression
+REGRESSION_THRESHOLD = 0.1
+
+
+def get_git_commit():
+    """Get the current git commit hash, None outside of a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure_case(field_name, locale, num_records, measure_memory=True, seed=0):
+    """
+    Measure the generation of one field for one locale.
+
+    The timing run is done without tracemalloc, which would slow down the
+    Python-level generators. The peak memory is measured in a second run.
+
+    Args:
+        field_name (str): Field to generate
+        locale (str): Locale to use for generation
+        num_records (int): Number of records to generate
+        measure_memory (bool): Whether to measure the peak memory
+        seed (int): Random seed for the generation
+
+    Returns:
+        dict: Measured values of the case
+    """
+    selected_fields = {field_name: {}}
+
+    # Warm up caches (Faker instances, value pools) outside of the measurement
+    generate_data(selected_fields, num_records=10, locale=locale, seed=seed)
+
+    gc.collect()
+    start = time.perf_counter()
+    generate_data(selected_fields, num_records=num_records, locale=locale, seed=seed)
+    seconds = time.perf_counter() - start
+
+    peak_memory = None
+    if measure_memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            generate_data(
+                selected_fields, num_records=num_records, locale=locale, seed=seed
+            )
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "field": field_name,
+        "locale": locale,
+        "rows": num_records,
+        "seconds": seconds,
+        "rows_per_second": num_records / seconds if seconds > 0 else None,
+        "peak_memory_bytes": peak_memory,
+    }
+
+
+def run_benchmarks(fields, locales, sizes, measure_memory=True):
+    """
+    Run all benchmark cases and print a line per case.
+
+    Args:
+        fields (list): Field names to benchmark
+        locales (list): Locales to benchmark
+        sizes (list): Numbers of records to benchmark
+        measure_memory (bool): Whether to measure the peak memory
+
+    Returns:
+        dict: Benchmark metadata and the list of results
+    """
+    results = []
+    for num_records in sizes:
+        for locale in locales:
+            for field_name in fields:
+                result = measure_case(field_name, locale, num_records, measure_memory)
+                results.append(result)
+
+                memory = result["peak_memory_bytes"]
+                memory_str = f"{memory / (1024 * 1024):8.1f} MB" if memory else "     n/a"
+                print(
+                    f"{num_records:>9} {locale:<6} {field_name:<15} "
+                    f"{result['rows_per_second']:>14,.0f} rows/s {memory_str}",
+                    flush=True,
+                )
+
+    return {
+        "metadata": {
+            "commit": get_git_commit(),
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "faker": faker.VERSION,
+            "block_size": BLOCK_SIZE,
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare two benchmark runs case by case.
+
+    Args:
+        baseline (dict): Earlier benchmark results
+        current (dict): New benchmark results
+        threshold (float): Relative slowdown reported as regression
+
+    Returns:
+        list: (field, locale, rows, ratio) for every slower case, where ratio
+            is the new throughput relative to the baseline
+    """
+    baseline_rates = {
+        (result["field"], result["locale"], result["rows"]): result["rows_per_second"]
+        for result in baseline["results"]
+    }
+
+    regressions = []
+    for result in current["results"]:
+        key = (result["field"], result["locale"], result["rows"])
+        old_rate = baseline_rates.get(key)
+        if not old_rate or not result["rows_per_second"]:
+            continue
+
+        ratio = result["rows_per_second"] / old_rate
+        if ratio < 1 - threshold:
+            regressions.append((*key, ratio))
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Numbers of records to generate",
+    )
+    parser.add_argument(
+        "--locales",
+        nargs="+",
+        default=SUPPORTED_LOCALES,
+        help="Locales to benchmark",
+    )
+    parser.add_argument(
+        "--fields",
+        nargs="+",
+        default=list(field_definitions),
+        help="Fields to benchmark",
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmark_results.json",
+        help="JSON file the results are written to",
+    )
+    parser.add_argument(
+        "--compare",
+        help="Earlier JSON result file to compare the throughput against",
+    )
+    parser.add_argument(
+        "--skip-memory",
+        action="store_true",
+        help="Do not measure the peak memory (halves the run time)",
+    )
+    args = parser.parse_args()
+
+    unknown_fields = set(args.fields) - set(field_definitions)
+    if unknown_fields:
+        parser.error(f"unknown fields: {', '.join(sorted(unknown_fields))}")
+
+    report = run_benchmarks(
+        args.fields, args.locales, args.sizes, measure_memory=not args.skip_memory
+    )
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        regressions = compare_results(baseline, report)
+        for field_name, locale, num_records, ratio in regressions:
+            print(
+                f"Regression: {field_name} ({locale}, {num_records} rows) "
+                f"at {ratio:.0%} of the baseline throughput"
+            )
+        if not regressions:
+            print("No regressions compared to the baseline")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,99 +1,480 @@
+import time
+import zlib
 import pandas as pd
 import numpy as np
-from faker import Faker
-import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from faker_factory import borrow_faker
 from field_definitions import field_definitions
+from value_pools import DEFAULT_POOL_SIZE, sample_value_pool
 
+# Rows are generated in blocks of this size. Every block draws its random
+# values from seeds derived from the master seed and the block index, so the
+# output for a fixed seed does not depend on how the rows are chunked.
+# Permutations are applied within a block.
+BLOCK_SIZE = 10_000
 
-def generate_data(selected_fields, num_records=10, locale="de_DE", seed=None):
+# Data locales offered on the generator page
+SUPPORTED_LOCALES = [
+    "en_US",
+    "en_GB",
+    "fr_FR",
+    "de_DE",
+    "es_ES",
+    "it_IT",
+    "ja_JP",
+    "zh_CN",
+    "pt_BR",
+    "ru_RU",
+]
+
+# Supported result types of generate_data and generate_data_iter
+OUTPUT_FORMATS = ("pandas", "arrow")
+
+# Extra spawn key component for the seeds of shared permutations
+PERMUTATION_SPAWN_KEY = 2**32
+
+
+def generate_data(
+    selected_fields,
+    num_records=10,
+    locale="de_DE",
+    seed=None,
+    workers=None,
+    compact_dtypes=False,
+    output="pandas",
+    profile=None,
+):
     """
     Generate synthetic data based on selected fields and their configurations.
 
+    Besides the field parameters, a field configuration may contain
+    "permutation_group": permuted fields with the same group name are shuffled
+    with the same permutation, so the relation between them is kept.
+
     Args:
         selected_fields (dict): Dictionary mapping field names to their configurations
         num_records (int): Number of records to generate
         locale (str): Locale to use for generation
         seed (int, optional): Random seed for reproducibility
+        workers (int, optional): Number of processes to generate the blocks
+            in parallel. The result does not depend on the number of workers.
+        compact_dtypes (bool): Emit low-cardinality fields (e.g. gender,
+            country) as pandas.Categorical columns instead of strings
+        output (str): "pandas" for a DataFrame or "arrow" for a pyarrow.Table
+            that is built directly from the generated columns
+        profile (callable, optional): Profiling hook, called once per field
+            and block with a dict of "field", "block", "rows", "seconds" and
+            "bytes". See build_profile_report for a per-field summary.
 
     Returns:
-        pandas.DataFrame: DataFrame containing the generated data
+        pandas.DataFrame or pyarrow.Table: The generated data
     """
-    # Set seed if provided
-    if seed is not None:
-        random.seed(seed)
-        np.random.seed(seed)
+    chunks = list(
+        generate_data_iter(
+            selected_fields,
+            num_records=num_records,
+            chunk_size=max(num_records, 1),
+            locale=locale,
+            seed=seed,
+            workers=workers,
+            compact_dtypes=compact_dtypes,
+            output=output,
+            profile=profile,
+        )
+    )
 
-    # Initialize faker with the selected locale
-    fake = Faker(locale)
-    if seed is not None:
-        Faker.seed(seed)
+    if not chunks:
+        # No rows or no valid fields, return an empty result with the columns
+        column_names = [
+            field_definitions[field_name].get("display_name", field_name)
+            for field_name in selected_fields
+            if field_name in field_definitions
+        ]
+        if output == "arrow":
+            import pyarrow as pa
 
-    # Initialize empty dataframe
-    df = pd.DataFrame()
+            return pa.table({name: pa.array([], pa.string()) for name in column_names})
+        return pd.DataFrame(columns=column_names)
 
-    # Generate data for each selected field
+    return chunks[0]
+
+
+def generate_data_iter(
+    selected_fields,
+    num_records=10,
+    chunk_size=BLOCK_SIZE,
+    locale="de_DE",
+    seed=None,
+    workers=None,
+    compact_dtypes=False,
+    output="pandas",
+    profile=None,
+):
+    """
+    Generate synthetic data as a sequence of DataFrame chunks.
+
+    Only one chunk (plus at most one block) is held in memory at a time. For a
+    fixed seed the concatenated chunks are identical to the result of
+    generate_data, independent of the chunk size.
+
+    Args:
+        selected_fields (dict): Dictionary mapping field names to their configurations
+        num_records (int): Total number of records to generate
+        chunk_size (int): Number of records per yielded chunk
+        locale (str): Locale to use for generation
+        seed (int, optional): Random seed for reproducibility
+        workers (int, optional): Number of processes to generate the blocks
+            in parallel. Each block is one shard; the shards are yielded in
+            order, so the output does not depend on the number of workers.
+        compact_dtypes (bool): Emit low-cardinality fields as
+            pandas.Categorical columns. All chunks share the same categories.
+        output (str): "pandas" for DataFrame chunks or "arrow" for
+            pyarrow.Table chunks
+        profile (callable, optional): Profiling hook, see generate_data
+
+    Yields:
+        pandas.DataFrame or pyarrow.Table: Chunks with up to chunk_size
+            records. The index of each DataFrame chunk continues the index of
+            the previous one. DataFrame chunks carry the known maximum value
+            length per column in attrs["max_lengths"] (see get_max_lengths).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"output must be one of {', '.join(OUTPUT_FORMATS)}")
+
+    # Keep only the fields we know how to generate
+    fields = [
+        (field_name, field_config)
+        for field_name, field_config in selected_fields.items()
+        if field_name in field_definitions
+    ]
+    if not fields or num_records <= 0:
+        return
+
+    max_lengths = get_max_lengths(dict(fields))
+
+    # Without a seed, draw fresh entropy once so all blocks share one root
+    entropy = seed if seed is not None else np.random.SeedSequence().entropy
+
+    pending = []
+    pending_rows = 0
+    start = 0
+    generated_rows = 0
+
+    blocks = _iter_blocks(
+        fields,
+        num_records,
+        locale,
+        entropy,
+        workers,
+        compact_dtypes,
+        output,
+        profile is not None,
+    )
+    for block, field_stats in blocks:
+        if profile is not None:
+            for stats in field_stats:
+                profile(stats)
+
+        pending.append(block)
+        pending_rows += len(block)
+        generated_rows += len(block)
+
+        is_last_block = generated_rows == num_records
+        if pending_rows < chunk_size and not is_last_block:
+            continue
+
+        # Emit all full chunks (and the remainder after the last block)
+        buffered = _concat_blocks(pending)
+        offset = 0
+        while pending_rows - offset >= chunk_size or (
+            is_last_block and offset < pending_rows
+        ):
+            rows = min(chunk_size, pending_rows - offset)
+            chunk = _slice_block(buffered, offset, rows, start)
+            if isinstance(chunk, pd.DataFrame) and max_lengths:
+                chunk.attrs["max_lengths"] = max_lengths
+            yield chunk
+
+            start += rows
+            offset += rows
+
+        if offset < pending_rows:
+            pending = [_slice_block(buffered, offset, pending_rows - offset, 0)]
+        else:
+            pending = []
+        pending_rows -= offset
+
+
+def get_max_lengths(selected_fields):
+    """
+    Get the maximum value length of the fields whose length is known in advance.
+
+    Args:
+        selected_fields (dict): Dictionary mapping field names to their configurations
+
+    Returns:
+        dict: Maximum number of characters per column (display name), only
+            for fields with a "max_length" in their definition
+    """
+    max_lengths = {}
     for field_name, field_config in selected_fields.items():
-        if field_name not in field_definitions:
+        definition = field_definitions.get(field_name)
+        if definition is None:
             continue
 
+        max_length = definition.get("max_length")
+        if callable(max_length):
+            max_length = max_length(field_config)
+
+        if max_length is not None:
+            max_lengths[definition.get("display_name", field_name)] = max_length
+
+    return max_lengths
+
+
+def build_profile_report(records):
+    """
+    Summarize the measurements of a profiled generation per field.
+
+    Args:
+        records (list): Dicts passed to the profile hook of generate_data
+
+    Returns:
+        pandas.DataFrame: One row per field in generation order with the
+            columns field, rows, seconds, rows_per_second, bytes and
+            time_share (share of the total generation time)
+    """
+    columns = ["field", "rows", "seconds", "rows_per_second", "bytes", "time_share"]
+    if not records:
+        return pd.DataFrame(columns=columns)
+
+    report = (
+        pd.DataFrame(records)
+        .groupby("field", sort=False)[["rows", "seconds", "bytes"]]
+        .sum()
+        .reset_index()
+    )
+    report["rows_per_second"] = report["rows"] / report["seconds"].where(
+        report["seconds"] > 0
+    )
+    total_seconds = report["seconds"].sum()
+    report["time_share"] = (
+        report["seconds"] / total_seconds if total_seconds > 0 else 0.0
+    )
+
+    return report[columns]
+
+
+def _concat_blocks(blocks):
+    """Concatenate DataFrame or pyarrow.Table blocks"""
+    if isinstance(blocks[0], pd.DataFrame):
+        return pd.concat(blocks, ignore_index=True)
+
+    import pyarrow as pa
+
+    return pa.concat_tables(blocks)
+
+
+def _slice_block(block, offset, rows, start):
+    """Take rows from a DataFrame or pyarrow.Table, DataFrames get index start"""
+    if isinstance(block, pd.DataFrame):
+        chunk = block.iloc[offset : offset + rows]
+        chunk.index = pd.RangeIndex(start, start + rows)
+        return chunk
+
+    return block.slice(offset, rows)
+
+
+def _iter_blocks(
+    fields, num_records, locale, entropy, workers, compact_dtypes, output, profile
+):
+    """
+    Generate the blocks of a dataset in order, optionally in worker processes.
+
+    Args:
+        fields (list): List of (field_name, field_config) tuples
+        num_records (int): Total number of records
+        locale (str): Locale to use for generation
+        entropy: Root entropy the block seeds are derived from
+        workers (int, optional): Number of worker processes
+        compact_dtypes (bool): Emit low-cardinality fields as categoricals
+        output (str): "pandas" or "arrow"
+        profile (bool): Whether to measure each field
+
+    Yields:
+        tuple: (block, field_stats) with the generated pandas.DataFrame or
+            pyarrow.Table and the list of field measurements (None if
+            profile is False)
+    """
+    block_sizes = (
+        (block_index, min(BLOCK_SIZE, num_records - block_start))
+        for block_index, block_start in enumerate(range(0, num_records, BLOCK_SIZE))
+    )
+
+    if not workers or workers <= 1 or num_records <= BLOCK_SIZE:
+        # Borrow a cached faker for the selected locale
+        with borrow_faker(locale) as fake:
+            for block_index, block_rows in block_sizes:
+                field_stats = [] if profile else None
+                block = _generate_block(
+                    fake,
+                    fields,
+                    block_index,
+                    block_rows,
+                    entropy,
+                    compact_dtypes,
+                    output,
+                    field_stats,
+                )
+                yield block, field_stats
+        return
+
+    # Keep a bounded number of blocks in flight so memory stays bounded
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = deque()
+    try:
+        for block_index, block_rows in block_sizes:
+            futures.append(
+                executor.submit(
+                    _generate_block_in_worker,
+                    fields,
+                    locale,
+                    block_index,
+                    block_rows,
+                    entropy,
+                    compact_dtypes,
+                    output,
+                    profile,
+                )
+            )
+            if len(futures) >= 2 * workers:
+                yield futures.popleft().result()
+
+        while futures:
+            yield futures.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _generate_block_in_worker(
+    fields, locale, block_index, num_records, entropy, compact_dtypes, output, profile
+):
+    """Generate one block in a worker process, returns (block, field_stats)"""
+    field_stats = [] if profile else None
+    with borrow_faker(locale) as fake:
+        block = _generate_block(
+            fake,
+            fields,
+            block_index,
+            num_records,
+            entropy,
+            compact_dtypes,
+            output,
+            field_stats,
+        )
+    return block, field_stats
+
+
+def _block_seed(entropy, block_index, field_index):
+    """Derive the seed sequence for one field of one block"""
+    return np.random.SeedSequence(entropy, spawn_key=(block_index, field_index))
+
+
+def _group_permutation(entropy, block_index, group, num_records):
+    """
+    Derive the shared permutation index of a permutation group for one block.
+
+    The seed depends on the group name, not on the position of the fields, so
+    the permutation does not change when other fields are added or removed.
+    """
+    group_key = zlib.crc32(str(group).encode("utf-8"))
+    seed_sequence = np.random.SeedSequence(
+        entropy, spawn_key=(block_index, PERMUTATION_SPAWN_KEY, group_key)
+    )
+    return np.random.default_rng(seed_sequence).permutation(num_records)
+
+
+def _generate_block(
+    fake,
+    fields,
+    block_index,
+    num_records,
+    entropy,
+    compact_dtypes,
+    output,
+    field_stats=None,
+):
+    """
+    Generate one block of rows for the given fields.
+
+    Args:
+        fake (Faker): Faker instance for the selected locale (reseeded per field)
+        fields (list): List of (field_name, field_config) tuples
+        block_index (int): Position of the block within the dataset
+        num_records (int): Number of records in this block
+        entropy: Root entropy the block seeds are derived from
+        compact_dtypes (bool): Emit low-cardinality fields as categoricals
+        output (str): "pandas" or "arrow"
+        field_stats (list, optional): If given, a measurement dict per field
+            is appended to it
+
+    Returns:
+        pandas.DataFrame or pyarrow.Table: The generated block
+    """
+    # Collect the columns first and build the frame once at the end
+    columns = {}
+
+    # Permutation index per permutation group, shared by its fields
+    group_permutations = {}
+
+    # Generation time per column name, only measured when profiling
+    field_seconds = {}
+
+    # Generate data for each selected field
+    for field_index, (field_name, field_config) in enumerate(fields):
+        if field_stats is not None:
+            field_start = time.perf_counter()
+
         # Get the field definition
         definition = field_definitions[field_name]
+        compact = compact_dtypes and definition.get("low_cardinality", False)
+
+        # Seed Faker and NumPy for this field of this block only
+        seed_sequence = _block_seed(entropy, block_index, field_index)
+        fake.seed_instance(int(seed_sequence.generate_state(1, np.uint64)[0]))
+        rng = np.random.default_rng(seed_sequence)
 
         # Generate the data based on the generator function
         generator_function = definition["generator"]
 
-        # Generate the column
-        if callable(generator_function):
+        # Generate the column, preferring the vectorized batch form if available
+        batch_function = definition.get("batch_generator")
+        if batch_function is not None:
+            column_data = batch_function(
+                fake, field_config, num_records, rng, start=block_index * BLOCK_SIZE
+            )
+        elif callable(generator_function):
             column_data = [
                 generator_function(fake, field_config) for _ in range(num_records)
             ]
         else:
             # Use the field name as the faker method
             try:
-                if generator_function == "state":
-                    # Handle state generation differently based on locale
-                    if locale == "en_US":
-                        column_data = [fake.state() for _ in range(num_records)]
-                    elif locale == "de_DE":
-                        # German states
-                        german_states = [
-                            "Baden-Württemberg",
-                            "Bayern",
-                            "Berlin",
-                            "Brandenburg",
-                            "Bremen",
-                            "Hamburg",
-                            "Hessen",
-                            "Mecklenburg-Vorpommern",
-                            "Niedersachsen",
-                            "Nordrhein-Westfalen",
-                            "Rheinland-Pfalz",
-                            "Saarland",
-                            "Sachsen",
-                            "Sachsen-Anhalt",
-                            "Schleswig-Holstein",
-                            "Thüringen",
-                        ]
-                        column_data = [
-                            random.choice(german_states) for _ in range(num_records)
-                        ]
-                    else:
-                        # For other locales, use a generic approach
-                        column_data = [f"Region {i+1}" for i in range(num_records)]
-                elif generator_function == "random_element" and field_name == "gender":
-                    # Handle gender field
-                    if locale.startswith("de"):
-                        column_data = [
-                            random.choice(["männlich", "weiblich", "divers"])
-                            for _ in range(num_records)
-                        ]
-                    else:
-                        column_data = [
-                            random.choice(["male", "female", "other"])
-                            for _ in range(num_records)
-                        ]
+                if definition.get("value_pool", False):
+                    # Sample from the cached pool of this locale and method
+                    column_data = sample_value_pool(
+                        fake.locales[0],
+                        generator_function,
+                        num_records,
+                        rng,
+                        pool_size=field_config.get("pool_size", DEFAULT_POOL_SIZE),
+                        weights=field_config.get("pool_weights"),
+                        as_categorical=compact,
+                    )
                 else:
-                    # Standard case for other fields
                     faker_method = getattr(fake, generator_function)
                     column_data = [faker_method() for _ in range(num_records)]
             except AttributeError as e:
@@ -104,22 +485,63 @@ def generate_data(selected_fields, num_records=10, locale="de_DE", seed=None):
                     for _ in range(num_records)
                 ]
 
-        # Add the column to the dataframe
-        df[definition.get("display_name", field_name)] = column_data
+        # Shuffle the column within the block if permutation is enabled.
+        # Fields with the same permutation group share one permutation index,
+        # which keeps the relation between them while breaking it to others.
+        if field_config.get("permutate", False):
+            group = field_config.get("permutation_group")
+            if group:
+                if group not in group_permutations:
+                    group_permutations[group] = _group_permutation(
+                        entropy, block_index, group, num_records
+                    )
+                permutation = group_permutations[group]
+            else:
+                permutation = rng.permutation(num_records)
 
-    # Apply permutations if needed
-    # This is a simplified version - you might need to adjust based on your requirements
-    for field_name, field_config in selected_fields.items():
-        if field_name not in field_definitions:
-            continue
+            # Apply the permutation in a single gather
+            if isinstance(column_data, list):
+                column_data = np.asarray(column_data, dtype=object)
+            column_data = column_data[permutation]
 
-        # Check if permutation is enabled for this field
-        if field_config.get("permutate", False):
-            column_name = field_definitions[field_name].get("display_name", field_name)
-            if column_name in df.columns:
-                # Shuffle the column data
-                shuffled = df[column_name].values.copy()
-                np.random.shuffle(shuffled)
-                df[column_name] = shuffled
-
-    return df
+        # Store low-cardinality fields as categoricals with fixed categories
+        category_getter = definition.get("categories")
+        if compact and category_getter and not isinstance(column_data, pd.Categorical):
+            categories = category_getter(fake, field_config)
+            if categories is not None:
+                column_data = pd.Categorical(column_data, categories=categories)
+
+        column_name = definition.get("display_name", field_name)
+        columns[column_name] = column_data
+
+        if field_stats is not None:
+            field_seconds[column_name] = (field_name, time.perf_counter() - field_start)
+
+    if output == "arrow":
+        import pyarrow as pa
+
+        block = pa.table({name: pa.array(values) for name, values in columns.items()})
+    else:
+        block = pd.DataFrame(columns)
+
+    if field_stats is not None:
+        for column_name, (field_name, seconds) in field_seconds.items():
+            field_stats.append(
+                {
+                    "field": field_name,
+                    "block": block_index,
+                    "rows": num_records,
+                    "seconds": seconds,
+                    "bytes": _column_nbytes(block, column_name),
+                }
+            )
+
+    return block
+
+
+def _column_nbytes(block, column_name):
+    """Memory size of a column in bytes, including the Python string objects"""
+    if isinstance(block, pd.DataFrame):
+        return int(block[column_name].memory_usage(deep=True, index=False))
+
+    return block.column(column_name).nbytes
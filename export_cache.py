@@ -0,0 +1,123 @@
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Maximum total size of the cached export artifacts (least recently used
+# artifacts are evicted first)
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+# Cached artifacts keyed by (fingerprint, export function, options), ordered
+# from least to most recently used
+_export_cache = OrderedDict()
+_export_cache_bytes = 0
+_export_cache_lock = threading.Lock()
+
+
+def dataset_fingerprint(df):
+    """
+    Compute a content hash of a DataFrame.
+
+    The hash covers the column names, dtypes, index and values, so two
+    DataFrames with the same fingerprint produce the same exports.
+
+    Args:
+        df (pandas.DataFrame): DataFrame to fingerprint
+
+    Returns:
+        str: Hexadecimal fingerprint
+
+    Raises:
+        TypeError: If the DataFrame contains unhashable values (e.g. lists)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([str(column) for column in df.columns]).encode("utf-8"))
+    digest.update(repr([str(dtype) for dtype in df.dtypes]).encode("utf-8"))
+    digest.update(np.int64(len(df)).tobytes())
+
+    # One 64-bit hash per row, covering the index and all columns
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest.update(row_hashes.tobytes())
+
+    return digest.hexdigest()
+
+
+def cached_export(
+    df, export_function, fingerprint=None, max_bytes=DEFAULT_CACHE_BYTES, **options
+):
+    """
+    Export a DataFrame, reusing the result of an earlier identical export.
+
+    Artifacts are keyed by the dataset fingerprint, the export function and
+    its options. Artifacts larger than the cache budget are not cached.
+
+    Args:
+        df (pandas.DataFrame): DataFrame to export
+        export_function (callable): Exporter called as
+            export_function(df, **options), e.g. export_utils.export_to_csv
+        fingerprint (str, optional): Fingerprint of df, computed with
+            dataset_fingerprint if not given (pass it to avoid rehashing)
+        max_bytes (int): Maximum total size of the cached artifacts
+        **options: Options passed to the export function
+
+    Returns:
+        The result of the export function (str or bytes)
+    """
+    if fingerprint is None:
+        try:
+            fingerprint = dataset_fingerprint(df)
+        except TypeError:
+            # Unhashable values, export without caching
+            return export_function(df, **options)
+
+    key = (fingerprint, export_function, tuple(sorted(options.items())))
+
+    with _export_cache_lock:
+        artifact = _export_cache.get(key)
+        if artifact is not None:
+            _export_cache.move_to_end(key)
+            return artifact
+
+    artifact = export_function(df, **options)
+    _store_artifact(key, artifact, max_bytes)
+
+    return artifact
+
+
+def clear_export_cache():
+    """Remove all cached export artifacts"""
+    global _export_cache_bytes
+
+    with _export_cache_lock:
+        _export_cache.clear()
+        _export_cache_bytes = 0
+
+
+def get_export_cache_size():
+    """Get the number of cached artifacts and their total size in bytes"""
+    with _export_cache_lock:
+        return len(_export_cache), _export_cache_bytes
+
+
+def _store_artifact(key, artifact, max_bytes):
+    """Add an artifact to the cache and evict the least recently used ones"""
+    global _export_cache_bytes
+
+    size = sys.getsizeof(artifact)
+    if size > max_bytes:
+        return
+
+    with _export_cache_lock:
+        previous = _export_cache.pop(key, None)
+        if previous is not None:
+            _export_cache_bytes -= sys.getsizeof(previous)
+
+        _export_cache[key] = artifact
+        _export_cache_bytes += size
+
+        while _export_cache_bytes > max_bytes:
+            _, evicted = _export_cache.popitem(last=False)
+            _export_cache_bytes -= sys.getsizeof(evicted)
@@ -1,6 +1,184 @@
 import pandas as pd
+import numpy as np
 import re
-from io import StringIO
+import io
+import gzip
+import itertools
+from contextlib import contextmanager
+
+# Compression formats of the streaming exporters (None writes uncompressed)
+COMPRESSIONS = (None, "gzip", "zstd")
+
+# File name suffix per compression format
+COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# Compression codecs of the Parquet export (None writes uncompressed)
+PARQUET_COMPRESSIONS = ("snappy", "zstd", "gzip", "brotli", "lz4", None)
+
+# Compression codecs of the Arrow IPC export (None writes uncompressed)
+ARROW_IPC_COMPRESSIONS = (None, "lz4", "zstd")
+
+# Maximum share of distinct values for which string columns are
+# dictionary-encoded in the Arrow IPC export, judged from a first batch of
+# at least DICTIONARY_SAMPLE_ROWS rows
+DICTIONARY_MAX_DISTINCT_RATIO = 0.5
+DICTIONARY_SAMPLE_ROWS = 1_000
+
+# Maximum number of rows (including the header) and columns of an Excel sheet
+XLSX_MAX_ROWS = 1_048_576
+XLSX_MAX_COLUMNS = 16_384
+
+# Number of rows converted to Python cell values at once for the Excel export
+XLSX_CONVERT_ROWS = 10_000
+
+# Number of rows per INSERT statement of the SQL export
+DEFAULT_SQL_BATCH_SIZE = 100
+
+# Approximate number of rows whose SQL values are formatted at once
+SQL_FORMAT_ROWS = 10_000
+
+# Supported SQL dialects of export_to_sql
+SQL_DIALECTS = ("generic", "postgresql", "mysql", "sqlite")
+
+# Rows per INSERT statement for SQLite, which loads large statements faster
+SQLITE_BATCH_SIZE = 500
+
+# Escape sequences of the PostgreSQL COPY text format and MySQL LOAD DATA
+# (the backslash has to be escaped first)
+COPY_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+# Representation of NULL in COPY and LOAD DATA files
+COPY_NULL = "\\N"
+
+
+def iter_frames(data):
+    """
+    Iterate over the DataFrames contained in the export input
+
+    Args:
+        data (pandas.DataFrame or iterable): A DataFrame or an iterable of
+            DataFrame chunks (e.g. from data_generator.generate_data_iter)
+
+    Yields:
+        pandas.DataFrame: The DataFrame itself or each chunk in order
+    """
+    if isinstance(data, pd.DataFrame):
+        yield data
+    else:
+        yield from data
+
+
+def rebatch_frames(frames, batch_size):
+    """
+    Regroup DataFrame chunks into batches of exactly batch_size rows
+
+    Args:
+        frames (iterable): Iterable of DataFrame chunks
+        batch_size (int): Number of rows per batch
+
+    Yields:
+        pandas.DataFrame: Batches of batch_size rows; the last one may be shorter
+    """
+    pending = []
+    pending_rows = 0
+
+    for frame in frames:
+        offset = 0
+        while offset < len(frame):
+            rows = min(batch_size - pending_rows, len(frame) - offset)
+            pending.append(frame.iloc[offset : offset + rows])
+            pending_rows += rows
+            offset += rows
+
+            if pending_rows == batch_size:
+                yield pending[0] if len(pending) == 1 else pd.concat(pending)
+                pending = []
+                pending_rows = 0
+
+    if pending:
+        yield pending[0] if len(pending) == 1 else pd.concat(pending)
+
+
+@contextmanager
+def compressed_writer(file, compression=None):
+    """
+    Wrap a binary file object so that everything written to it is compressed
+
+    The wrapped file object is not closed, only the compressed stream is
+    finished when the context is left.
+
+    Args:
+        file: Binary file-like object (file, socket file, BytesIO, ...)
+        compression (str, optional): None, "gzip" or "zstd" (requires the
+            optional zstandard package)
+
+    Yields:
+        Binary file-like object to write the uncompressed data to
+
+    Raises:
+        ValueError: If the compression format is not supported
+        ImportError: If zstd is requested but zstandard is not installed
+    """
+    if compression not in COMPRESSIONS:
+        raise ValueError(
+            f"compression must be one of {', '.join(str(c) for c in COMPRESSIONS)}"
+        )
+
+    if compression is None:
+        yield file
+        return
+
+    if compression == "gzip":
+        writer = gzip.GzipFile(fileobj=file, mode="wb")
+    else:
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd compression requires the zstandard package (pip install zstandard)"
+            ) from e
+        writer = zstandard.ZstdCompressor().stream_writer(file, closefd=False)
+
+    try:
+        yield writer
+    finally:
+        # Writes the end of the compressed stream, file itself stays open
+        writer.close()
+
+
+def write_csv(data, file, compression=None, encoding="utf-8"):
+    """
+    Stream DataFrame chunks as CSV into a binary file object
+
+    Every chunk is written as soon as it arrives, so the memory use does not
+    depend on the total number of rows.
+
+    Args:
+        data (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+        file: Binary file-like object to write to (it is not closed)
+        compression (str, optional): None, "gzip" or "zstd"
+        encoding (str): Text encoding of the CSV data
+
+    Returns:
+        int: Number of data rows written
+    """
+    rows = 0
+    with compressed_writer(file, compression) as binary:
+        # newline="" keeps the line endings pandas writes unchanged
+        text = io.TextIOWrapper(
+            binary, encoding=encoding, newline="", write_through=True
+        )
+        try:
+            # Write the header only with the first chunk
+            for chunk_index, chunk in enumerate(iter_frames(data)):
+                chunk.to_csv(text, index=False, header=chunk_index == 0)
+                rows += len(chunk)
+            text.flush()
+        finally:
+            # Release the binary stream without closing it
+            text.detach()
+
+    return rows
 
 
 def export_to_csv(df):
@@ -8,21 +186,34 @@ def export_to_csv(df):
     Export DataFrame to CSV format
 
     Args:
-        df (pandas.DataFrame): DataFrame to export
+        df (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
 
     Returns:
         str: CSV string
     """
-    # Create a string buffer
-    csv_buffer = StringIO()
+    csv_buffer = io.BytesIO()
+    write_csv(df, csv_buffer)
+
+    return csv_buffer.getvalue().decode("utf-8")
+
+
+def export_to_bytes(data, writer, **options):
+    """
+    Run a streaming exporter into memory
 
-    # Write the dataframe to the buffer
-    df.to_csv(csv_buffer, index=False)
+    Args:
+        data (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+        writer (callable): Streaming exporter called as
+            writer(data, file, **options), e.g. write_csv
+        **options: Options passed to the writer (e.g. compression)
 
-    # Get the CSV string
-    csv_string = csv_buffer.getvalue()
+    Returns:
+        bytes: The written file content
+    """
+    buffer = io.BytesIO()
+    writer(data, buffer, **options)
 
-    return csv_string
+    return buffer.getvalue()
 
 
 def export_to_json(df):
@@ -30,15 +221,525 @@ def export_to_json(df):
     Export DataFrame to JSON format
 
     Args:
-        df (pandas.DataFrame): DataFrame to export
+        df (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
 
     Returns:
         str: JSON string
     """
-    # Convert dataframe to JSON records
-    json_records = df.to_json(orient="records", indent=2)
+    if isinstance(df, pd.DataFrame):
+        # Convert dataframe to JSON records
+        return df.to_json(orient="records", indent=2)
+
+    # Convert each chunk and merge the record lists into one JSON array
+    record_blocks = []
+    for chunk in iter_frames(df):
+        if not chunk.empty:
+            # Strip the surrounding "[\n" and "\n]" of each chunk
+            record_blocks.append(chunk.to_json(orient="records", indent=2)[2:-2])
+
+    if not record_blocks:
+        return "[]"
+
+    return "[\n" + ",\n".join(record_blocks) + "\n]"
+
+
+def write_ndjson(data, file, compression=None):
+    """
+    Stream DataFrame chunks as JSON Lines (one compact record per line)
+
+    Unlike export_to_json, every line can be read on its own, so consumers
+    can process the file incrementally.
+
+    Args:
+        data (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+        file: Binary file-like object to write to (it is not closed)
+        compression (str, optional): None, "gzip" or "zstd"
+
+    Returns:
+        int: Number of records written
+    """
+    rows = 0
+    with compressed_writer(file, compression) as binary:
+        for chunk in iter_frames(data):
+            if chunk.empty:
+                continue
+
+            binary.write(chunk.to_json(orient="records", lines=True).encode("utf-8"))
+            rows += len(chunk)
+
+    return rows
+
+
+def export_to_ndjson(df):
+    """
+    Export DataFrame to JSON Lines format
+
+    Args:
+        df (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+
+    Returns:
+        str: One JSON record per line
+    """
+    ndjson_buffer = io.BytesIO()
+    write_ndjson(df, ndjson_buffer)
+
+    return ndjson_buffer.getvalue().decode("utf-8")
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is only needed for the Parquet and Arrow exports"""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Arrow IPC exports require the pyarrow package (pip install pyarrow)"
+        ) from e
+
+    return pa
+
+
+def iter_arrow_tables(data):
+    """
+    Iterate over the export input as pyarrow Tables
+
+    Args:
+        data: A DataFrame or pyarrow.Table, or an iterable of DataFrame or
+            pyarrow.Table chunks (e.g. from data_generator.generate_data_iter)
+
+    Yields:
+        pyarrow.Table: Each chunk as a Table without the pandas index
+    """
+    pa = _import_pyarrow()
+
+    chunks = [data] if isinstance(data, (pd.DataFrame, pa.Table)) else data
+    for chunk in chunks:
+        if isinstance(chunk, pd.DataFrame):
+            chunk = pa.Table.from_pandas(chunk, preserve_index=False)
+        yield chunk
+
+
+def rebatch_tables(tables, batch_size):
+    """
+    Regroup pyarrow Tables into Tables of exactly batch_size rows
+
+    Args:
+        tables (iterable): Iterable of pyarrow Tables with the same schema
+        batch_size (int): Number of rows per Table
+
+    Yields:
+        pyarrow.Table: Tables of batch_size rows; the last one may be shorter
+    """
+    pa = _import_pyarrow()
+
+    pending = []
+    pending_rows = 0
+
+    for table in tables:
+        pending.append(table)
+        pending_rows += table.num_rows
+
+        if pending_rows >= batch_size:
+            buffered = pa.concat_tables(pending)
+            offset = 0
+            while pending_rows - offset >= batch_size:
+                yield buffered.slice(offset, batch_size)
+                offset += batch_size
+
+            pending = [buffered.slice(offset)]
+            pending_rows -= offset
+
+    if pending_rows:
+        yield pa.concat_tables(pending)
+
+
+def _conform_table(table, schema):
+    """
+    Cast a Table to the schema of the first chunk if it differs
+
+    The streaming writers fix the schema of the file with the first chunk,
+    so a later chunk can only be cast to it, not widen it.
+
+    Raises:
+        ValueError: If the columns differ or a column cannot be cast
+    """
+    if table.schema.equals(schema, check_metadata=False):
+        return table
+
+    pa = _import_pyarrow()
+
+    if table.column_names != schema.names:
+        raise ValueError(
+            f"chunk columns {table.column_names} differ from the columns "
+            f"{schema.names} of the first chunk"
+        )
+
+    columns = []
+    for field, column in zip(schema, table.columns):
+        if column.type != field.type:
+            try:
+                column = column.cast(field.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise ValueError(
+                    f"column '{field.name}' has type {column.type} in a later chunk, "
+                    f"which cannot be cast to the type {field.type} of the first "
+                    f"chunk; give the column the same dtype in every chunk"
+                ) from e
+        columns.append(column)
+
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def write_parquet(
+    data, file, compression="snappy", use_dictionary=True, row_group_size=None
+):
+    """
+    Stream DataFrame chunks into a Parquet file
+
+    The schema is taken from the first chunk. Every chunk is written as soon
+    as it arrives, so only one row group is held in memory at a time.
+
+    Args:
+        data: DataFrame, pyarrow.Table or an iterable of such chunks
+        file: Binary file-like object or path to write to
+        compression (str, optional): One of PARQUET_COMPRESSIONS
+        use_dictionary (bool): Dictionary-encode the column values in the file
+        row_group_size (int, optional): Number of rows per row group. By
+            default every chunk becomes (at least) one row group.
+
+    Returns:
+        int: Number of rows written
+
+    Raises:
+        ValueError: If a later chunk cannot be cast to the schema of the first
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    if compression not in PARQUET_COMPRESSIONS:
+        raise ValueError(
+            f"compression must be one of {', '.join(str(c) for c in PARQUET_COMPRESSIONS)}"
+        )
+
+    tables = iter_arrow_tables(data)
+    if row_group_size is not None:
+        tables = rebatch_tables(tables, row_group_size)
+
+    first = next(tables, None)
+    if first is None:
+        # Without any chunk there are no columns either
+        first = pa.table({})
+
+    rows = 0
+    with pq.ParquetWriter(
+        file,
+        first.schema,
+        compression=compression or "none",
+        use_dictionary=use_dictionary,
+    ) as writer:
+        for table in itertools.chain([first], tables):
+            table = _conform_table(table, first.schema)
+            writer.write_table(table, row_group_size=row_group_size)
+            rows += table.num_rows
+
+    return rows
+
+
+def export_to_parquet(
+    df, compression="snappy", use_dictionary=True, row_group_size=None
+):
+    """
+    Export DataFrame to Parquet format
+
+    Args:
+        df: DataFrame, pyarrow.Table or an iterable of such chunks
+        compression (str, optional): One of PARQUET_COMPRESSIONS
+        use_dictionary (bool): Dictionary-encode the column values in the file
+        row_group_size (int, optional): Number of rows per row group
+
+    Returns:
+        bytes: Parquet file content
+    """
+    parquet_buffer = io.BytesIO()
+    write_parquet(
+        df,
+        parquet_buffer,
+        compression=compression,
+        use_dictionary=use_dictionary,
+        row_group_size=row_group_size,
+    )
+
+    return parquet_buffer.getvalue()
+
+
+def _encode_dictionaries(batch, dictionaries, encode_strings):
+    """
+    Dictionary-encode the columns of a RecordBatch with growing dictionaries
+
+    Arrow IPC files only allow a dictionary to grow (delta) between batches,
+    so every encoded column keeps one dictionary for the whole file: values
+    seen before keep their index, new values are appended. Only the
+    distinct values of the batch are looked up, so the cost does not grow
+    with the size of the dictionary.
+
+    String columns whose first batch (of at least DICTIONARY_SAMPLE_ROWS
+    rows) has more than DICTIONARY_MAX_DISTINCT_RATIO distinct values
+    (e.g. UUIDs) are written without dictionary for the whole file, as the
+    dictionary would be as large as the column.
+
+    Args:
+        batch (pyarrow.RecordBatch): Batch to encode
+        dictionaries (dict): Encoding state per column index ({value: index}
+            and the dictionary array, or None for unencoded string columns),
+            updated in place
+        encode_strings (bool): Also encode string columns, not only columns
+            that are dictionary-encoded already (e.g. categoricals)
+
+    Returns:
+        pyarrow.RecordBatch: Batch with int32 dictionary-encoded columns
+    """
+    pa = _import_pyarrow()
+
+    arrays = []
+    for column_index, array in enumerate(batch.columns):
+        if encode_strings and pa.types.is_string(array.type):
+            if column_index in dictionaries and dictionaries[column_index] is None:
+                arrays.append(array)
+                continue
+
+            encoded = array.dictionary_encode()
+            if column_index not in dictionaries and (
+                len(array) >= DICTIONARY_SAMPLE_ROWS
+                and len(encoded.dictionary) > DICTIONARY_MAX_DISTINCT_RATIO * len(array)
+            ):
+                # High cardinality, keep the column unencoded in every batch
+                dictionaries[column_index] = None
+                arrays.append(array)
+                continue
+            array = encoded
+        if not pa.types.is_dictionary(array.type):
+            arrays.append(array)
+            continue
+
+        state = dictionaries.get(column_index)
+        if state is None:
+            state = {
+                "codes": {},
+                "dictionary": pa.array([], type=array.type.value_type),
+            }
+            dictionaries[column_index] = state
+        codes = state["codes"]
+
+        # Map the indices of the batch dictionary to the shared dictionary
+        batch_values = array.dictionary.to_pylist()
+        mapping = np.empty(len(batch_values), dtype=np.int32)
+        new_values = []
+        for position, value in enumerate(batch_values):
+            code = codes.get(value)
+            if code is None:
+                code = len(codes)
+                codes[value] = code
+                new_values.append(value)
+            mapping[position] = code
+
+        if new_values:
+            state["dictionary"] = pa.concat_arrays(
+                [
+                    state["dictionary"],
+                    pa.array(new_values, type=array.type.value_type),
+                ]
+            )
+
+        indices = array.indices.fill_null(0).to_numpy()
+        is_null = array.is_null().to_numpy(zero_copy_only=False)
+        if len(mapping):
+            indices = mapping[indices]
+
+        arrays.append(
+            pa.DictionaryArray.from_arrays(
+                pa.array(indices, type=pa.int32(), mask=is_null),
+                state["dictionary"],
+            )
+        )
+
+    return pa.RecordBatch.from_arrays(arrays, names=batch.schema.names)
+
+
+def write_arrow_ipc(
+    data, file, compression=None, dictionary_encode=False, batch_size=None
+):
+    """
+    Stream DataFrame chunks into an Arrow IPC file (Feather version 2)
+
+    The schema is taken from the first chunk. Each chunk is written as one
+    or more record batches as soon as it arrives.
+
+    Args:
+        data: DataFrame, pyarrow.Table or an iterable of such chunks
+        file: Binary file-like object or path to write to
+        compression (str, optional): One of ARROW_IPC_COMPRESSIONS
+        dictionary_encode (bool): Dictionary-encode string columns.
+            Categorical columns are always written dictionary-encoded.
+        batch_size (int, optional): Maximum number of rows per record batch
+
+    Returns:
+        int: Number of rows written
+
+    Raises:
+        ValueError: If a later chunk cannot be cast to the schema of the first
+    """
+    pa = _import_pyarrow()
+    import pyarrow.ipc as ipc
+
+    if compression not in ARROW_IPC_COMPRESSIONS:
+        raise ValueError(
+            f"compression must be one of {', '.join(str(c) for c in ARROW_IPC_COMPRESSIONS)}"
+        )
+
+    def iter_batches():
+        schema = None
+        for table in iter_arrow_tables(data):
+            if schema is None:
+                schema = table.schema
+            yield from _conform_table(table, schema).to_batches(
+                max_chunksize=batch_size
+            )
+
+    dictionaries = {}
+    batches = (
+        _encode_dictionaries(batch, dictionaries, dictionary_encode)
+        for batch in iter_batches()
+    )
+
+    first = next(batches, None)
+    schema = first.schema if first is not None else pa.schema([])
+
+    options = ipc.IpcWriteOptions(compression=compression, emit_dictionary_deltas=True)
+    rows = 0
+    with ipc.new_file(file, schema, options=options) as writer:
+        if first is not None:
+            for batch in itertools.chain([first], batches):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+
+    return rows
+
+
+def export_to_arrow_ipc(df, compression=None, dictionary_encode=False, batch_size=None):
+    """
+    Export DataFrame to the Arrow IPC file format (Feather version 2)
+
+    Args:
+        df: DataFrame, pyarrow.Table or an iterable of such chunks
+        compression (str, optional): One of ARROW_IPC_COMPRESSIONS
+        dictionary_encode (bool): Dictionary-encode string columns
+        batch_size (int, optional): Maximum number of rows per record batch
+
+    Returns:
+        bytes: Arrow IPC file content
+    """
+    ipc_buffer = io.BytesIO()
+    write_arrow_ipc(
+        df,
+        ipc_buffer,
+        compression=compression,
+        dictionary_encode=dictionary_encode,
+        batch_size=batch_size,
+    )
+
+    return ipc_buffer.getvalue()
+
+
+def _xlsx_rows(chunk):
+    """Yield the rows of a DataFrame chunk as lists of cell values for openpyxl"""
+    # Convert XLSX_CONVERT_ROWS rows at a time so that only one slice exists
+    # as Python objects while it is appended
+    for start in range(0, len(chunk), XLSX_CONVERT_ROWS):
+        part = chunk.iloc[start : start + XLSX_CONVERT_ROWS]
 
-    return json_records
+        # Object dtype turns categoricals and NumPy scalars into plain Python
+        # values; missing values (NaN, None, NaT, pd.NA) become empty cells
+        values = part.astype(object)
+        values = values.where(part.notna(), None)
+
+        yield from values.to_numpy().tolist()
+
+
+def write_xlsx(data, file, sheet_name="Daten"):
+    """
+    Stream DataFrame chunks into an Excel workbook (.xlsx)
+
+    openpyxl's write-only mode writes every row to a temporary file as soon
+    as it is appended, so the memory use does not depend on the number of
+    rows. When a sheet reaches Excel's limit of XLSX_MAX_ROWS rows, the
+    export continues on a new sheet ("Daten 2", "Daten 3", ...) that
+    repeats the header.
+
+    Args:
+        data (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+        file: Binary file-like object or path to write to
+        sheet_name (str): Name of the first sheet
+
+    Returns:
+        int: Number of data rows written
+
+    Raises:
+        ValueError: If the data has more columns than an Excel sheet allows
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = None
+    sheet_rows = 0
+    header = None
+    rows = 0
+
+    for chunk in iter_frames(data):
+        if header is None:
+            if len(chunk.columns) > XLSX_MAX_COLUMNS:
+                raise ValueError(
+                    f"Excel sheets can hold at most {XLSX_MAX_COLUMNS} columns"
+                )
+            header = [str(column) for column in chunk.columns]
+
+        for row in _xlsx_rows(chunk):
+            if sheet is None or sheet_rows == XLSX_MAX_ROWS:
+                sheet_number = len(workbook.worksheets) + 1
+                sheet = workbook.create_sheet(
+                    sheet_name if sheet_number == 1 else f"{sheet_name} {sheet_number}"
+                )
+                sheet.append(header)
+                sheet_rows = 1
+
+            sheet.append(row)
+            sheet_rows += 1
+            rows += 1
+
+    if sheet is None:
+        # A workbook needs at least one sheet, keep the header if known
+        sheet = workbook.create_sheet(sheet_name)
+        if header:
+            sheet.append(header)
+
+    workbook.save(file)
+
+    return rows
+
+
+def export_to_xlsx(df, sheet_name="Daten"):
+    """
+    Export DataFrame to Excel format (.xlsx)
+
+    Args:
+        df (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+        sheet_name (str): Name of the first sheet
+
+    Returns:
+        bytes: Excel file content
+    """
+    xlsx_buffer = io.BytesIO()
+    write_xlsx(df, xlsx_buffer, sheet_name=sheet_name)
+
+    return xlsx_buffer.getvalue()
 
 
 def sanitize_table_name(name):
@@ -83,85 +784,506 @@ def format_value_for_sql(value):
         return "'" + val_str + "'"
 
 
-def export_to_sql(df, table_name="testdaten"):
+def format_sql_values(values, nan_as_null=False):
     """
-    Export DataFrame to SQL INSERT statements
+    Format a column of values for SQL INSERT statements at once
+
+    Gives the same result as calling format_value_for_sql on every element.
+    NumPy integer and boolean scalars are no Python int instances, so they
+    are quoted like strings, as format_value_for_sql does.
 
     Args:
-        df (pandas.DataFrame): DataFrame to export
+        values (numpy.ndarray): One-dimensional array of values
+        nan_as_null (bool): Write NULL instead of nan (and other missing
+            values like NaT) so the statement is valid SQL
+
+    Returns:
+        numpy.ndarray: Object array with the SQL-formatted values
+    """
+    kind = values.dtype.kind
+
+    if kind in "iub":
+        return "'" + values.astype(str).astype(object) + "'"
+
+    if values.dtype == np.float64:
+        # Same shortest representation as str() of the float values
+        formatted = values.astype(str).astype(object)
+        if nan_as_null:
+            formatted[np.isnan(values)] = "NULL"
+        return formatted
+
+    if kind == "O" and set(map(type, values)) <= {str, type(None)}:
+        is_null = np.equal(values, None)
+        strings = values[~is_null]
+
+        # Escaping is only needed if any value contains a quote or semicolon
+        joined = "".join(strings)
+        if "'" in joined or ";" in joined:
+            strings = np.array(
+                [value.replace("'", "''").replace(";", "") for value in strings],
+                dtype=object,
+            )
+
+        formatted = np.full(len(values), "NULL", dtype=object)
+        formatted[~is_null] = "'" + strings + "'"
+        return formatted
+
+    if kind in "mM":
+        # Like pandas, box the values as Timestamp / Timedelta
+        values = pd.array(values)
+
+    # Mixed or other types (dates, numbers in object columns, ...)
+    if nan_as_null:
+        return np.array(
+            [
+                (
+                    "NULL"
+                    if pd.api.types.is_scalar(value) and pd.isna(value)
+                    else format_value_for_sql(value)
+                )
+                for value in values
+            ],
+            dtype=object,
+        )
+
+    return np.array([format_value_for_sql(value) for value in values], dtype=object)
+
+
+def format_sql_rows(df, nan_as_null=False):
+    """
+    Format the rows of a DataFrame as SQL value tuples
+
+    The values are taken from DataFrame.values like DataFrame.iterrows does,
+    so the column types are combined the same way (e.g. integer columns
+    become floats next to float columns).
+
+    Args:
+        df (pandas.DataFrame): Rows to format
+        nan_as_null (bool): Write NULL for missing values, see format_sql_values
+
+    Returns:
+        list: One "(value, value, ...)" string per row
+    """
+    if len(df.columns) == 0:
+        return ["()"] * len(df)
+
+    values = df.values
+    rows = "(" + format_sql_values(values[:, 0], nan_as_null)
+    for column_index in range(1, values.shape[1]):
+        rows = rows + ", " + format_sql_values(values[:, column_index], nan_as_null)
+
+    return (rows + ")").tolist()
+
+
+def format_copy_values(series):
+    """
+    Format a column as text for PostgreSQL COPY or MySQL LOAD DATA
+
+    Missing values become \\N, booleans 1 and 0, and tabs, line breaks and
+    backslashes in strings are escaped with a backslash.
+
+    Args:
+        series (pandas.Series): Column to format
+
+    Returns:
+        numpy.ndarray: Object array with one text value per row
+    """
+    is_null = series.isna().to_numpy()
+    has_nulls = is_null.any()
+    present = series[~is_null] if has_nulls else series
+
+    if pd.api.types.is_bool_dtype(present.dtype):
+        text = np.where(present.to_numpy(dtype=bool), "1", "0").astype(object)
+    elif pd.api.types.is_numeric_dtype(present.dtype):
+        text = present.to_numpy().astype(str).astype(object)
+    else:
+        # Convert like pandas does (e.g. "2024-01-31 00:00:00" for dates)
+        text = present.astype(str).to_numpy(dtype=object)
+
+        # Escaping is only needed if any value contains a special character
+        joined = "".join(text)
+        escapes = [escape for escape in COPY_ESCAPES if escape[0] in joined]
+        if escapes:
+            for index, value in enumerate(text):
+                for char, replacement in escapes:
+                    value = value.replace(char, replacement)
+                text[index] = value
+
+    if not has_nulls:
+        return text
+
+    formatted = np.full(len(series), COPY_NULL, dtype=object)
+    formatted[~is_null] = text
+    return formatted
+
+
+def format_copy_rows(df):
+    """
+    Format the rows of a DataFrame as tab-separated COPY / LOAD DATA lines
+
+    Args:
+        df (pandas.DataFrame): Rows to format
+
+    Returns:
+        list: One line (without line break) per row
+    """
+    if len(df.columns) == 0:
+        return [""] * len(df)
+
+    rows = format_copy_values(df.iloc[:, 0])
+    for column_index in range(1, len(df.columns)):
+        rows = rows + "\t" + format_copy_values(df.iloc[:, column_index])
+
+    return rows.tolist()
+
+
+def write_tsv(data, file, compression=None):
+    """
+    Stream DataFrame chunks as tab-separated lines into a binary file object
+
+    The file has no header and uses the escaping of MySQL LOAD DATA and the
+    PostgreSQL COPY text format, so it can be loaded with the script of
+    export_to_sql(..., dialect="mysql").
+
+    Args:
+        data (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+        file: Binary file-like object to write to (it is not closed)
+        compression (str, optional): None, "gzip" or "zstd"
+
+    Returns:
+        int: Number of rows written
+    """
+    rows = 0
+    with compressed_writer(file, compression) as binary:
+        for frame in rebatch_frames(iter_frames(data), SQL_FORMAT_ROWS):
+            lines = format_copy_rows(frame)
+            binary.write(("\n".join(lines) + "\n").encode("utf-8"))
+            rows += len(lines)
+
+    return rows
+
+
+def export_to_tsv(df):
+    """
+    Export DataFrame to a tab-separated file for MySQL LOAD DATA
+
+    Args:
+        df (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+
+    Returns:
+        str: Tab-separated lines without header
+    """
+    tsv_buffer = io.BytesIO()
+    write_tsv(df, tsv_buffer)
+
+    return tsv_buffer.getvalue().decode("utf-8")
+
+
+def sanitize_column_name(name):
+    """
+    Sanitize a column name to be SQL-safe
+
+    Args:
+        name (str): Raw column name
+
+    Returns:
+        str: Sanitized column name
+    """
+    return re.sub(r"[^\w]", "_", name).lower()
+
+
+def get_max_text_length(column):
+    """
+    Get the length of the longest value of a column converted to text
+
+    Gives the same result as column.astype(str).str.len().max(), but
+    without creating a text copy of the column: string columns are measured
+    in a single pass and categorical columns by their categories.
+
+    Args:
+        column (pandas.Series): Column to measure
+
+    Returns:
+        int: Maximum number of characters (0 for an empty column)
+    """
+    if len(column) == 0:
+        return 0
+
+    dtype = column.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        # Only measure the categories that occur in the column
+        codes = column.cat.codes.to_numpy()
+        used = np.bincount(codes[codes >= 0], minlength=len(dtype.categories)) > 0
+        categories = dtype.categories[used]
+        max_length = (
+            int(categories.astype(str).str.len().max()) if len(categories) else 0
+        )
+        # Missing values are written as "nan"
+        return max(max_length, 3) if column.hasnans else max_length
+
+    if dtype == object:
+        values = column.to_numpy()
+        if set(map(type, values)) <= {str}:
+            return max(map(len, values))
+        return max(len(str(value)) for value in values)
+
+    if isinstance(dtype, pd.StringDtype):
+        max_length = column.str.len().max()
+        max_length = 0 if pd.isna(max_length) else int(max_length)
+        # Missing values are written as "<NA>"
+        return max(max_length, 4) if column.hasnans else max_length
+
+    return int(column.astype(str).str.len().max())
+
+
+def infer_sql_column_type(column, max_length=None):
+    """
+    Infer the SQL type of a DataFrame column
+
+    Args:
+        column (pandas.Series): Column to infer the type for
+        max_length (int, optional): Known maximum text length of the column
+            (e.g. from the field definitions), skips measuring the values
+
+    Returns:
+        str: INTEGER, FLOAT or VARCHAR(n)
+    """
+    if pd.api.types.is_numeric_dtype(column.dtype):
+        if pd.api.types.is_integer_dtype(column.dtype):
+            return "INTEGER"
+        return "FLOAT"
+
+    # Check typical length to determine VARCHAR size
+    if max_length is None:
+        max_length = get_max_text_length(column)
+    return f"VARCHAR({max(255, max_length)})"
+
+
+def iter_sql_lines(
+    df,
+    table_name="testdaten",
+    batch_size=None,
+    dialect="generic",
+    data_file_name=None,
+):
+    """
+    Generate the SQL script of export_to_sql line by line
+
+    The rows are only formatted when the lines are consumed, so taking the
+    first lines (e.g. with itertools.islice for a preview) is cheap even for
+    large DataFrames. Every line ends with a line break; values containing
+    line breaks are part of their row's line.
+
+    Args:
+        df (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
         table_name (str): Name of the table to insert into
+        batch_size (int, optional): Number of rows per INSERT statement,
+            defaults to 100 (generic) or 500 (sqlite)
+        dialect (str): One of SQL_DIALECTS
+        data_file_name (str, optional): Name of the tab-separated data file
+            of the MySQL script, defaults to "<table name>.tsv"
 
     Returns:
-        str: SQL INSERT statements
+        iterator: Lines of the SQL script
+
+    Raises:
+        ValueError: If the dialect or the batch size is invalid
     """
+    # Validate eagerly instead of on the first consumed line
+    if dialect not in SQL_DIALECTS:
+        raise ValueError(f"dialect must be one of {', '.join(SQL_DIALECTS)}")
+    if batch_size is None:
+        batch_size = (
+            SQLITE_BATCH_SIZE if dialect == "sqlite" else DEFAULT_SQL_BATCH_SIZE
+        )
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    return _generate_sql_lines(df, table_name, batch_size, dialect, data_file_name)
+
+
+def _generate_sql_lines(df, table_name, batch_size, dialect, data_file_name):
+    """Generate the lines of the SQL script, see iter_sql_lines"""
+    # Use the first chunk to determine the columns and their types
+    frames = iter_frames(df)
+    df = next(frames, pd.DataFrame())
+
     # Sanitize table name
     sanitized_table_name = sanitize_table_name(table_name)
 
-    # Create string buffer for SQL statements
-    sql_buffer = StringIO()
-
     # Write CREATE TABLE statement
-    sql_buffer.write(f"-- SQL Script für {sanitized_table_name}\n")
-    sql_buffer.write(
-        f"-- Generiert am {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    )
+    yield f"-- SQL Script für {sanitized_table_name}\n"
+    yield f"-- Generiert am {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    yield "\n"
 
     # Start with table creation
     columns = df.columns.tolist()
-    sql_buffer.write(f"CREATE TABLE IF NOT EXISTS {sanitized_table_name} (\n")
-
-    # Add columns (using VARCHAR for simplicity, in a real scenario you would infer types)
-    column_definitions = []
-    for col in columns:
-        sanitized_col = re.sub(r"[^\w]", "_", col).lower()
+    yield f"CREATE TABLE IF NOT EXISTS {sanitized_table_name} (\n"
 
-        # Determine column type based on DataFrame dtypes
-        if pd.api.types.is_numeric_dtype(df[col].dtype):
-            if pd.api.types.is_integer_dtype(df[col].dtype):
-                col_type = "INTEGER"
-            else:
-                col_type = "FLOAT"
-        else:
-            # Check typical length to determine VARCHAR size
-            max_length = df[col].astype(str).str.len().max()
-            col_type = f"VARCHAR({max(255, max_length)})"
+    # Add columns with types based on the DataFrame dtypes. Known maximum
+    # lengths (set by data_generator in attrs) spare measuring the values.
+    max_lengths = df.attrs.get("max_lengths", {})
+    column_definitions = [
+        f"    {sanitize_column_name(col)} "
+        f"{infer_sql_column_type(df[col], max_lengths.get(col))}"
+        for col in columns
+    ]
+    for index, definition in enumerate(column_definitions):
+        yield definition + (",\n" if index < len(column_definitions) - 1 else "\n")
+    if not column_definitions:
+        yield "\n"
 
-        column_definitions.append(f"    {sanitized_col} {col_type}")
-
-    sql_buffer.write(",\n".join(column_definitions))
-    sql_buffer.write("\n);\n\n")
+    yield ");\n"
+    yield "\n"
 
     # Add a note that we're truncating the table
-    sql_buffer.write("-- Löschen existierender Daten (optional)\n")
-    sql_buffer.write(f"DELETE FROM {sanitized_table_name};\n\n")
+    yield "-- Löschen existierender Daten (optional)\n"
+    yield f"DELETE FROM {sanitized_table_name};\n"
+    yield "\n"
 
     # Start INSERT statements
-    sql_buffer.write("-- Datensätze einfügen\n")
+    yield "-- Datensätze einfügen\n"
+
+    # Column names for INSERT
+    columns_str = ", ".join(sanitize_column_name(col) for col in columns)
+    frames = itertools.chain([df], frames)
+
+    if dialect == "mysql":
+        if data_file_name is None:
+            data_file_name = f"{sanitized_table_name}.tsv"
+        escaped_file_name = data_file_name.replace("\\", "\\\\").replace("'", "\\'")
+
+        # The rows are read from the separate data file
+        yield f"LOAD DATA LOCAL INFILE '{escaped_file_name}'\n"
+        yield f"INTO TABLE {sanitized_table_name}\n"
+        yield "CHARACTER SET utf8mb4\n"
+        yield "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'\n"
+        yield "LINES TERMINATED BY '\\n'\n"
+        yield f"({columns_str});\n"
+        return
+
+    if dialect == "postgresql":
+        # All rows in one COPY block, terminated by a line with \.
+        yield f"COPY {sanitized_table_name} ({columns_str}) FROM STDIN;\n"
+        for frame in rebatch_frames(frames, SQL_FORMAT_ROWS):
+            if frame.columns.tolist() != columns:
+                frame = frame[columns]
+            for row in format_copy_rows(frame):
+                yield row + "\n"
+        yield "\\.\n"
+        return
 
-    # Generate batch inserts (for better performance)
-    batch_size = 100  # Insert in batches of 100
-    total_rows = len(df)
+    if dialect == "sqlite":
+        # One transaction instead of one per statement
+        yield "BEGIN TRANSACTION;\n"
+        yield "\n"
 
-    for i in range(0, total_rows, batch_size):
-        batch = df.iloc[i : min(i + batch_size, total_rows)]
+    insert_str = f"INSERT INTO {sanitized_table_name} ({columns_str}) VALUES\n"
 
-        # Column names for INSERT
-        sanitized_columns = [re.sub(r"[^\w]", "_", col).lower() for col in columns]
-        columns_str = ", ".join(sanitized_columns)
+    # Format the values of many rows at once, in slices that are a multiple
+    # of the batch size so every INSERT statement is taken from one slice
+    slice_rows = batch_size * max(1, SQL_FORMAT_ROWS // batch_size)
 
-        # Start the batch INSERT
-        sql_buffer.write(f"INSERT INTO {sanitized_table_name} ({columns_str}) VALUES\n")
+    for frame in rebatch_frames(frames, slice_rows):
+        if frame.columns.tolist() != columns:
+            frame = frame[columns]
 
-        # Add each row
-        values_list = []
-        for _, row in batch.iterrows():
-            # Format the values for SQL
-            formatted_values = [format_value_for_sql(row[col]) for col in columns]
-            values_str = f"({', '.join(formatted_values)})"
-            values_list.append(values_str)
+        # SQLite would read nan as a column name
+        rows = format_sql_rows(frame, nan_as_null=dialect == "sqlite")
 
-        # Join all values with commas
-        sql_buffer.write(",\n".join(values_list))
-        sql_buffer.write(";\n\n")
+        # Generate batch inserts (for better performance)
+        for start in range(0, len(rows), batch_size):
+            yield insert_str
+            batch = rows[start : start + batch_size]
+            for row in batch[:-1]:
+                yield row + ",\n"
+            yield batch[-1] + ";\n"
+            yield "\n"
 
-    return sql_buffer.getvalue()
+    if dialect == "sqlite":
+        yield "COMMIT;\n"
+
+
+def write_sql(
+    data,
+    file,
+    table_name="testdaten",
+    batch_size=None,
+    dialect="generic",
+    data_file_name=None,
+    compression=None,
+    encoding="utf-8",
+):
+    """
+    Stream the SQL script of export_to_sql into a binary file object
+
+    Args:
+        data (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+        file: Binary file-like object to write to (it is not closed)
+        table_name (str): Name of the table to insert into
+        batch_size (int, optional): Number of rows per INSERT statement
+        dialect (str): One of SQL_DIALECTS
+        data_file_name (str, optional): Name of the data file of the MySQL script
+        compression (str, optional): None, "gzip" or "zstd"
+        encoding (str): Text encoding of the script
+    """
+    lines = iter_sql_lines(
+        data,
+        table_name=table_name,
+        batch_size=batch_size,
+        dialect=dialect,
+        data_file_name=data_file_name,
+    )
+
+    with compressed_writer(file, compression) as binary:
+        # Write the lines in blocks to keep the number of write calls low
+        while True:
+            block = "".join(itertools.islice(lines, SQL_FORMAT_ROWS))
+            if not block:
+                break
+            binary.write(block.encode(encoding))
+
+
+def export_to_sql(
+    df,
+    table_name="testdaten",
+    batch_size=None,
+    dialect="generic",
+    data_file_name=None,
+):
+    """
+    Export DataFrame to SQL INSERT statements
+
+    Column types are inferred from the first chunk if DataFrame chunks are
+    passed instead of a single DataFrame. The VARCHAR lengths are taken from
+    df.attrs["max_lengths"] where available (see data_generator).
+
+    Depending on the dialect the rows are loaded differently:
+        - "generic": INSERT statements for (almost) every database
+        - "postgresql": one COPY ... FROM STDIN block (for psql)
+        - "mysql": a LOAD DATA statement reading the rows from a separate
+          tab-separated file created with export_to_tsv / write_tsv
+        - "sqlite": large multi-row INSERT statements in one transaction,
+          missing values are written as NULL
+
+    Args:
+        df (pandas.DataFrame or iterable): DataFrame or DataFrame chunks to export
+        table_name (str): Name of the table to insert into
+        batch_size (int, optional): Number of rows per INSERT statement,
+            defaults to 100 (generic) or 500 (sqlite)
+        dialect (str): One of SQL_DIALECTS
+        data_file_name (str, optional): Name of the tab-separated data file
+            of the MySQL script, defaults to "<table name>.tsv"
+
+    Returns:
+        str: SQL script
+    """
+    return "".join(
+        iter_sql_lines(
+            df,
+            table_name=table_name,
+            batch_size=batch_size,
+            dialect=dialect,
+            data_file_name=data_file_name,
+        )
+    )
@@ -0,0 +1,84 @@
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import faker.generator
+from faker import Faker
+
+# Maximum number of locales with cached Faker instances (least recently used
+# locales are evicted first)
+MAX_CACHED_LOCALES = 16
+
+# Maximum number of idle Faker instances kept per locale
+MAX_IDLE_INSTANCES = 4
+
+# Idle Faker instances per locale, ordered from least to most recently used
+_idle_fakers = OrderedDict()
+_idle_fakers_lock = threading.Lock()
+
+
+@contextmanager
+def borrow_faker(locale, seed=None):
+    """
+    Borrow a cached Faker instance for the given locale.
+
+    Creating a Faker instance loads all providers of the locale, which is
+    expensive. Instances are therefore kept in a process-wide cache and handed
+    out exclusively: while a caller holds an instance, no other caller (or
+    thread) gets it. Every borrowed instance starts with the random state
+    shared by all Faker instances, so seeding with Faker.seed works as with a
+    new instance, while seed_instance (or the seed argument) only affects the
+    borrowed instance.
+
+    Args:
+        locale (str): Faker locale (e.g. "de_DE")
+        seed (int, optional): Seed for the random state of this instance
+
+    Yields:
+        Faker: Faker instance for the locale
+    """
+    fake = _acquire_faker(locale)
+    try:
+        if seed is not None:
+            fake.seed_instance(seed)
+        yield fake
+    finally:
+        _release_faker(locale, fake)
+
+
+def clear_faker_cache():
+    """Remove all cached Faker instances"""
+    with _idle_fakers_lock:
+        _idle_fakers.clear()
+
+
+def _acquire_faker(locale):
+    """Take an idle Faker instance from the cache or create a new one"""
+    fake = None
+    with _idle_fakers_lock:
+        idle = _idle_fakers.get(locale)
+        if idle:
+            fake = idle.pop()
+            _idle_fakers.move_to_end(locale)
+
+    if fake is None:
+        fake = Faker(locale)
+
+    return fake
+
+
+def _release_faker(locale, fake):
+    """Reset a borrowed Faker instance and return it to the cache"""
+    # Drop the instance's own random state and the values seen by fake.unique
+    fake.random = faker.generator.random
+    fake.unique.clear()
+
+    with _idle_fakers_lock:
+        idle = _idle_fakers.setdefault(locale, [])
+        _idle_fakers.move_to_end(locale)
+        if len(idle) < MAX_IDLE_INSTANCES:
+            idle.append(fake)
+
+        # Evict the least recently used locales
+        while len(_idle_fakers) > MAX_CACHED_LOCALES:
+            _idle_fakers.popitem(last=False)
@@ -1,5 +1,29 @@
-import random
 import string
+from datetime import date, timedelta
+
+import numpy as np
+from faker.providers.address.en_US import Provider as UsAddressProvider
+
+GERMAN_STATES = [
+    "Baden-Württemberg",
+    "Bayern",
+    "Berlin",
+    "Brandenburg",
+    "Bremen",
+    "Hamburg",
+    "Hessen",
+    "Mecklenburg-Vorpommern",
+    "Niedersachsen",
+    "Nordrhein-Westfalen",
+    "Rheinland-Pfalz",
+    "Saarland",
+    "Sachsen",
+    "Sachsen-Anhalt",
+    "Schleswig-Holstein",
+    "Thüringen",
+]
+
+HEX_DIGITS = np.array(list("0123456789abcdef"))
 
 # Define field generators
 
@@ -14,8 +38,8 @@ def generate_username(fake, config):
         return fake.user_name()
     else:
         return "".join(
-            random.choice(string.ascii_lowercase)
-            for _ in range(random.randint(min_length, max_length))
+            fake.random.choice(string.ascii_lowercase)
+            for _ in range(fake.random.randint(min_length, max_length))
         )
 
 
@@ -31,7 +55,7 @@ def generate_password(fake, config):
     if include_special:
         chars += string.punctuation
 
-    return "".join(random.choice(chars) for _ in range(length))
+    return "".join(fake.random.choice(chars) for _ in range(length))
 
 
 def generate_full_name(fake, config):
@@ -90,11 +114,181 @@ def generate_phone_number(fake, config):
         return fake.phone_number()
 
 
+# Define batch generators
+#
+# A batch generator has the signature ``(fake, config, n, rng, start=0)`` and
+# returns a list or NumPy array with ``n`` values. ``rng`` is a
+# ``numpy.random.Generator`` and ``start`` the position of the first value
+# within the dataset, since generate_data calls it once per block of rows.
+# generate_data prefers the batch form and only falls back to the per-row
+# generator when a field does not define one.
+
+
+def _join_characters(char_matrix):
+    """Join each row of a 2D array of single characters into one string"""
+    num_rows, width = char_matrix.shape
+    if width == 0:
+        return np.full(num_rows, "", dtype=object)
+    char_matrix = np.ascontiguousarray(char_matrix, dtype="<U1")
+    return char_matrix.view(f"<U{width}").ravel()
+
+
+def _shift_years(day, years):
+    """Move a date by a number of years, mapping 29 February to 28 February"""
+    try:
+        return day.replace(year=day.year + years)
+    except ValueError:
+        return day.replace(year=day.year + years, day=28)
+
+
+def generate_username_batch(fake, config, n, rng, start=0):
+    """Generate n usernames based on configuration"""
+    min_length = config.get("min_length", 6)
+    max_length = config.get("max_length", 12)
+    with_numbers = config.get("with_numbers", True)
+
+    if with_numbers:
+        return [fake.user_name() for _ in range(n)]
+
+    lengths = rng.integers(min_length, max_length + 1, size=n)
+    letters = np.array(list(string.ascii_lowercase))
+    names = _join_characters(letters[rng.integers(0, 26, size=(n, max_length))])
+    return [name[:length] for name, length in zip(names.tolist(), lengths.tolist())]
+
+
+def generate_password_batch(fake, config, n, rng, start=0):
+    """Generate n passwords based on configuration"""
+    length = config.get("length", 12)
+    include_special = config.get("include_special", True)
+    include_digits = config.get("include_digits", True)
+
+    chars = string.ascii_letters
+    if include_digits:
+        chars += string.digits
+    if include_special:
+        chars += string.punctuation
+
+    chars = np.array(list(chars))
+    return _join_characters(chars[rng.integers(0, len(chars), size=(n, length))])
+
+
+def generate_date_of_birth_batch(fake, config, n, rng, start=0):
+    """Generate n dates of birth with the same age bounds as Faker"""
+    min_age = config.get("min_age", 18)
+    max_age = config.get("max_age", 90)
+
+    if min_age > max_age:
+        raise ValueError("minimum_age must be less than or equal to maximum_age.")
+
+    today = date.today()
+    start_date = _shift_years(today, -(max_age + 1)) + timedelta(days=1)
+    end_date = _shift_years(today, -min_age)
+
+    offsets = rng.integers(0, (end_date - start_date).days + 1, size=n)
+    dates = np.datetime64(start_date, "D") + offsets
+    return np.datetime_as_string(dates, unit="D")
+
+
+def generate_uuid_batch(fake, config, n, rng, start=0):
+    """Generate n random (version 4) UUID strings"""
+    raw = np.frombuffer(rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+
+    # Set the version (4) and variant (RFC 4122) bits
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+
+    nibbles = np.empty((n, 32), dtype=np.uint8)
+    nibbles[:, 0::2] = raw >> 4
+    nibbles[:, 1::2] = raw & 0x0F
+    digits = HEX_DIGITS[nibbles]
+
+    dash = np.full((n, 1), "-")
+    return _join_characters(
+        np.hstack(
+            [
+                digits[:, :8],
+                dash,
+                digits[:, 8:12],
+                dash,
+                digits[:, 12:16],
+                dash,
+                digits[:, 16:20],
+                dash,
+                digits[:, 20:],
+            ]
+        )
+    )
+
+
+def generate_gender_batch(fake, config, n, rng, start=0):
+    """Generate n gender values in the language of the Faker locale"""
+    return rng.choice(get_gender_categories(fake, config), size=n)
+
+
+def generate_state_batch(fake, config, n, rng, start=0):
+    """Generate n states depending on the Faker locale"""
+    states = get_state_categories(fake, config)
+
+    if states is not None:
+        return rng.choice(states, size=n)
+    else:
+        # For other locales, use a generic approach numbered by row
+        return [f"Region {i+1}" for i in range(start, start + n)]
+
+
+# Define category getters
+#
+# A category getter has the signature ``(fake, config)`` and returns the list of
+# all values a low-cardinality field can take (or None if the set is not known
+# in advance). generate_data uses it for categorical columns.
+
+
+def get_gender_categories(fake, config):
+    """Get the gender values in the language of the Faker locale"""
+    if fake.locales[0].startswith("de"):
+        return ["männlich", "weiblich", "divers"]
+    else:
+        return ["male", "female", "other"]
+
+
+def get_state_categories(fake, config):
+    """Get the states of the Faker locale, None for locales without a list"""
+    locale = fake.locales[0]
+
+    if locale == "en_US":
+        return list(UsAddressProvider.states)
+    elif locale == "de_DE":
+        return GERMAN_STATES
+    else:
+        return None
+
+
+# Define maximum value lengths
+#
+# A "max_length" entry is either a fixed number of characters or a function
+# with the signature ``(config)`` returning it (or None if it is not known).
+# Exports use it to size text columns without scanning the data.
+
+
+def get_username_max_length(config):
+    """Get the maximum username length, None for Faker user names"""
+    if config.get("with_numbers", True):
+        return None
+    return config.get("max_length", 12)
+
+
+def get_password_max_length(config):
+    """Get the password length"""
+    return config.get("length", 12)
+
+
 # Define all available fields with their configurations
 field_definitions = {
     "username": {
         "display_name": "Benutzername",
         "generator": generate_username,
+        "batch_generator": generate_username_batch,
+        "max_length": get_username_max_length,
         "params": {
             "min_length": {
                 "type": "int",
@@ -136,6 +330,8 @@ field_definitions = {
     "password": {
         "display_name": "Passwort",
         "generator": generate_password,
+        "batch_generator": generate_password_batch,
+        "max_length": get_password_max_length,
         "params": {
             "length": {
                 "type": "int",
@@ -196,6 +392,7 @@ field_definitions = {
     "city": {
         "display_name": "Stadt",
         "generator": "city",
+        "value_pool": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -207,6 +404,9 @@ field_definitions = {
     "state": {
         "display_name": "Bundesland",
         "generator": "state",
+        "batch_generator": generate_state_batch,
+        "categories": get_state_categories,
+        "low_cardinality": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -218,6 +418,7 @@ field_definitions = {
     "zip_code": {
         "display_name": "Postleitzahl",
         "generator": "postcode",
+        "value_pool": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -229,6 +430,8 @@ field_definitions = {
     "country": {
         "display_name": "Land",
         "generator": "country",
+        "value_pool": True,
+        "low_cardinality": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -258,6 +461,8 @@ field_definitions = {
     "date_of_birth": {
         "display_name": "Geburtsdatum",
         "generator": generate_date_of_birth,
+        "batch_generator": generate_date_of_birth_batch,
+        "max_length": 10,
         "params": {
             "min_age": {
                 "type": "int",
@@ -283,6 +488,9 @@ field_definitions = {
     "gender": {
         "display_name": "Geschlecht",
         "generator": "random_element",
+        "batch_generator": generate_gender_batch,
+        "categories": get_gender_categories,
+        "low_cardinality": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -312,6 +520,7 @@ field_definitions = {
     "job_title": {
         "display_name": "Berufsbezeichnung",
         "generator": "job",
+        "value_pool": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -323,6 +532,7 @@ field_definitions = {
     "company": {
         "display_name": "Unternehmen",
         "generator": "company",
+        "value_pool": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -334,6 +544,7 @@ field_definitions = {
     "user_agent": {
         "display_name": "User-Agent",
         "generator": "user_agent",
+        "value_pool": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -345,6 +556,7 @@ field_definitions = {
     "ipv4": {
         "display_name": "IPv4-Adresse",
         "generator": "ipv4",
+        "max_length": 15,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -356,6 +568,7 @@ field_definitions = {
     "ipv6": {
         "display_name": "IPv6-Adresse",
         "generator": "ipv6",
+        "max_length": 39,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -367,6 +580,7 @@ field_definitions = {
     "mac_address": {
         "display_name": "MAC-Adresse",
         "generator": "mac_address",
+        "max_length": 17,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -378,6 +592,8 @@ field_definitions = {
     "uuid": {
         "display_name": "UUID",
         "generator": "uuid4",
+        "batch_generator": generate_uuid_batch,
+        "max_length": 36,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -389,6 +605,8 @@ field_definitions = {
     "color": {
         "display_name": "Farbe",
         "generator": "color_name",
+        "value_pool": True,
+        "low_cardinality": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -400,6 +618,8 @@ field_definitions = {
     "currency_code": {
         "display_name": "Währungscode",
         "generator": "currency_code",
+        "value_pool": True,
+        "low_cardinality": True,
         "params": {
             "permutate": {
                 "type": "bool",
@@ -4,11 +4,18 @@ import numpy as np
 import json
 import time
 import datetime
+import os
+import tempfile
 from io import StringIO, BytesIO
+from itertools import islice
 
-from data_generator import generate_data
+from data_generator import generate_data_iter, build_profile_report, SUPPORTED_LOCALES
 from field_definitions import field_definitions
-from export_utils import export_to_csv, export_to_json, export_to_sql
+from export_utils import (export_to_json, iter_sql_lines, write_sql, write_tsv,
+                          export_to_parquet, export_to_arrow_ipc, export_to_xlsx, write_csv,
+                          write_ndjson, sanitize_table_name, export_to_bytes,
+                          COMPRESSION_SUFFIXES)
+from export_cache import cached_export, dataset_fingerprint
 from database_utils import save_dataset_config, get_all_saved_datasets, get_dataset_by_id, delete_dataset, delete_dataset_range
 
 # Set page config
@@ -109,11 +116,29 @@ if 'load_dataset_id' in st.session_state:
     # Remove the load_dataset_id from session state to prevent reloading
     del st.session_state.load_dataset_id
 
+# Number of records generated per chunk (used for the progress bar)
+GENERATION_CHUNK_SIZE = 1000
+
+
+def remove_sql_export_files():
+    """Delete the temporary files of the last SQL export"""
+    sql_export = st.session_state.pop("sql_export", None)
+    if sql_export is None:
+        return
+
+    for path in sql_export["paths"].values():
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
 # Initialize variables that might be used in different app modes
 # These are needed to avoid "possibly unbound" errors
 num_records = 100
 locale = "de_DE"
 seed = None
+compact_dtypes = False
+profile_generation = False
 export_format = "CSV"
 
 # Sidebar for controls
@@ -129,10 +154,7 @@ with st.sidebar:
         help="Die Gesamtzahl der zu erzeugenden Dateneinträge")
 
     # Locale selection
-    locale_options = [
-        "en_US", "en_GB", "fr_FR", "de_DE", "es_ES", "it_IT", "ja_JP", "zh_CN",
-        "pt_BR", "ru_RU"
-    ]
+    locale_options = SUPPORTED_LOCALES
     locale = st.selectbox(
         "Daten-Locale",
         options=locale_options,
@@ -150,9 +172,21 @@ with st.sidebar:
                             max_value=999999,
                             value=42)
 
+    # Compact data types for low-cardinality fields
+    compact_dtypes = st.checkbox(
+        "Kompakte Datentypen verwenden",
+        value=False,
+        help="Felder mit wenigen verschiedenen Werten (z.B. Geschlecht, Land) werden als Kategorien gespeichert, was Speicher spart")
+
+    # Per-field measurements cost generation time, so they are opt-in
+    profile_generation = st.checkbox(
+        "Generierungsprofil erstellen",
+        value=False,
+        help="Misst Zeit und Speicher pro Feld; verlangsamt die Generierung")
+
     # Export format
     export_format = st.radio("Exportformat",
-                            options=["CSV", "JSON", "SQL"],
+                            options=["CSV", "JSON", "JSON Lines", "Excel", "SQL", "Parquet", "Arrow IPC"],
                             index=0)
 
     st.divider()
@@ -312,6 +346,9 @@ if reset_button:
     # Clear generated data if it exists
     if 'generated_df' in st.session_state:
         del st.session_state['generated_df']
+        st.session_state.pop('generated_fingerprint', None)
+        remove_sql_export_files()
+        st.session_state.pop('generation_profile', None)
 
         # Clear the animation container
         reset_dice_container.empty()
@@ -350,15 +387,35 @@ if generate_button:
             for field in selected_field_names
         }
 
-        # Generate the data
+        # Generate the data in chunks to show the progress
         try:
-            df = generate_data(selected_fields_config,
-                            num_records=num_records,
-                            locale=locale,
-                            seed=seed)
-
-            # Store the dataframe in session state
+            progress_bar = st.progress(0.0)
+            df_chunks = []
+            profile_records = []
+            profile_hook = profile_records.append if profile_generation else None
+            generated_records = 0
+            for chunk in generate_data_iter(selected_fields_config,
+                                            num_records=num_records,
+                                            chunk_size=GENERATION_CHUNK_SIZE,
+                                            locale=locale,
+                                            seed=seed,
+                                            compact_dtypes=compact_dtypes,
+                                            profile=profile_hook):
+                df_chunks.append(chunk)
+                generated_records += len(chunk)
+                progress_bar.progress(generated_records / num_records)
+            progress_bar.empty()
+
+            df = pd.concat(df_chunks)
+
+            # Store the dataframe and the per-field timings in session state
             st.session_state.generated_df = df
+            st.session_state.generated_fingerprint = dataset_fingerprint(df)
+            if profile_generation:
+                st.session_state.generation_profile = build_profile_report(
+                    profile_records)
+            else:
+                st.session_state.pop('generation_profile', None)
 
             # Clear the animation container
             dice_container.empty()
@@ -396,6 +453,27 @@ if 'generated_df' in st.session_state:
     # Display the dataframe
     st.dataframe(df, height=400)
 
+    # Show which fields took the most time to generate
+    if 'generation_profile' in st.session_state:
+        with st.expander("Generierungsprofil pro Feld anzeigen"):
+            profile_df = st.session_state.generation_profile.copy()
+            profile_df["field"] = profile_df["field"].map(
+                lambda field: field_definitions[field].get("display_name", field))
+            profile_df["time_share"] = profile_df["time_share"] * 100
+            st.dataframe(
+                profile_df.rename(columns={
+                    "field": "Feld",
+                    "rows": "Datensätze",
+                    "seconds": "Zeit (s)",
+                    "rows_per_second": "Datensätze/s",
+                    "bytes": "Speicher (Bytes)",
+                    "time_share": "Zeitanteil (%)",
+                }),
+                hide_index=True,
+                use_container_width=True)
+            st.caption(
+                "Felder mit hohem Zeitanteil machen die Konfiguration teuer.")
+
     # Create a download button
     download_col, save_col = st.columns(2)
 
@@ -404,43 +482,203 @@ if 'generated_df' in st.session_state:
 
         timestamp = time.strftime("%Y%m%d_%H%M%S")
 
+        # Exports of unchanged data are served from the export cache
+        fingerprint = st.session_state.get("generated_fingerprint")
+
         if export_format == "CSV":
-            csv_data = export_to_csv(df)
+            compress_csv = st.checkbox(
+                "CSV komprimieren (gzip)",
+                value=False,
+                help="Verkleinert die Datei, vor allem bei vielen Datensätzen")
+            compression = "gzip" if compress_csv else None
+
+            # Write the CSV bytes directly, without an intermediate string
+            csv_data = cached_export(df,
+                                    export_to_bytes,
+                                    fingerprint=fingerprint,
+                                    writer=write_csv,
+                                    compression=compression)
             st.download_button(label="CSV herunterladen",
                             data=csv_data,
-                            file_name=f"testdaten_{timestamp}.csv",
-                            mime="text/csv",
+                            file_name=f"testdaten_{timestamp}.csv{COMPRESSION_SUFFIXES[compression]}",
+                            mime="application/gzip" if compress_csv else "text/csv",
                             use_container_width=True)
         elif export_format == "JSON":
-            json_data = export_to_json(df)
+            json_data = cached_export(df,
+                                    export_to_json,
+                                    fingerprint=fingerprint)
             st.download_button(label="JSON herunterladen",
                             data=json_data,
                             file_name=f"testdaten_{timestamp}.json",
                             mime="application/json",
                             use_container_width=True)
+        elif export_format == "JSON Lines":
+            compress_ndjson = st.checkbox(
+                "JSON Lines komprimieren (gzip)",
+                value=False,
+                help="Verkleinert die Datei, vor allem bei vielen Datensätzen")
+            compression = "gzip" if compress_ndjson else None
+
+            # One compact record per line, readable record by record
+            ndjson_data = cached_export(df,
+                                        export_to_bytes,
+                                        fingerprint=fingerprint,
+                                        writer=write_ndjson,
+                                        compression=compression)
+            st.download_button(label="JSON Lines herunterladen",
+                            data=ndjson_data,
+                            file_name=f"testdaten_{timestamp}.jsonl{COMPRESSION_SUFFIXES[compression]}",
+                            mime="application/gzip" if compress_ndjson else "application/x-ndjson",
+                            use_container_width=True)
+        elif export_format == "Excel":
+            # Written row by row; more than 1.048.576 rows continue on further sheets
+            xlsx_data = cached_export(df,
+                                    export_to_xlsx,
+                                    fingerprint=fingerprint)
+            st.download_button(label="Excel herunterladen",
+                            data=xlsx_data,
+                            file_name=f"testdaten_{timestamp}.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            use_container_width=True)
+        elif export_format == "Parquet":
+            parquet_compressions = {
+                "Snappy": "snappy",
+                "Zstandard": "zstd",
+                "Gzip": "gzip",
+                "Keine": None,
+            }
+            compression_label = st.selectbox(
+                "Komprimierung",
+                options=list(parquet_compressions.keys()),
+                index=0)
+            use_dictionary = st.checkbox(
+                "Dictionary-Kodierung verwenden",
+                value=True,
+                help="Speichert wiederholte Werte nur einmal, was die Datei verkleinert")
+
+            parquet_data = cached_export(
+                df,
+                export_to_parquet,
+                fingerprint=fingerprint,
+                compression=parquet_compressions[compression_label],
+                use_dictionary=use_dictionary)
+            st.download_button(label="Parquet herunterladen",
+                            data=parquet_data,
+                            file_name=f"testdaten_{timestamp}.parquet",
+                            mime="application/vnd.apache.parquet",
+                            use_container_width=True)
+        elif export_format == "Arrow IPC":
+            arrow_compressions = {
+                "Keine": None,
+                "LZ4": "lz4",
+                "Zstandard": "zstd",
+            }
+            compression_label = st.selectbox(
+                "Komprimierung",
+                options=list(arrow_compressions.keys()),
+                index=0)
+            dictionary_encode = st.checkbox(
+                "Dictionary-Kodierung verwenden",
+                value=False,
+                help="Textspalten werden als Dictionary gespeichert, was bei wiederholten Werten Speicher spart")
+
+            arrow_data = cached_export(
+                df,
+                export_to_arrow_ipc,
+                fingerprint=fingerprint,
+                compression=arrow_compressions[compression_label],
+                dictionary_encode=dictionary_encode)
+            st.download_button(label="Arrow IPC herunterladen",
+                            data=arrow_data,
+                            file_name=f"testdaten_{timestamp}.arrow",
+                            mime="application/vnd.apache.arrow.file",
+                            use_container_width=True)
         else:  # SQL
             # Add option for table name
             table_name = st.text_input("Tabellen-Name (für SQL-Script)",
                                     value="testdaten")
 
-            # Display SQL dialect info
-            st.info(
-                "Das SQL-Script ist mit PostgreSQL, MySQL, SQLite und den meisten anderen SQL-Dialekten kompatibel."
-            )
+            # SQL dialect, determines how the rows are loaded
+            sql_dialects = {
+                "Standard (INSERT)": "generic",
+                "PostgreSQL (COPY)": "postgresql",
+                "MySQL (LOAD DATA)": "mysql",
+                "SQLite (Transaktion)": "sqlite",
+            }
+            dialect_label = st.selectbox("SQL-Dialekt",
+                                        options=list(sql_dialects.keys()),
+                                        index=0)
+            dialect = sql_dialects[dialect_label]
 
-            # Generate SQL
-            sql_data = export_to_sql(df, table_name=table_name)
+            # Display SQL dialect info
+            if dialect == "generic":
+                st.info(
+                    "Das SQL-Script ist mit PostgreSQL, MySQL, SQLite und den meisten anderen SQL-Dialekten kompatibel."
+                )
+            elif dialect == "postgresql":
+                st.info(
+                    "Das SQL-Script lädt die Daten mit COPY und wird mit psql ausgeführt (psql -f datei.sql)."
+                )
+            elif dialect == "mysql":
+                st.info(
+                    "Das SQL-Script lädt die Daten mit LOAD DATA aus der TSV-Datei, die im selben Verzeichnis liegen muss (local_infile muss aktiviert sein)."
+                )
+            else:
+                st.info(
+                    "Das SQL-Script fügt alle Datensätze in einer einzigen Transaktion ein."
+                )
 
-            # Preview SQL (first 20 lines)
+            # Preview SQL (first 20 lines), only these lines are generated
             with st.expander("SQL-Vorschau anzeigen"):
-                sql_preview = "\n".join(sql_data.split("\n")[:20]) + "\n..."
+                sql_lines = iter_sql_lines(df,
+                                        table_name=table_name,
+                                        dialect=dialect)
+                sql_preview = "".join(islice(sql_lines, 20)) + "..."
                 st.code(sql_preview, language="sql")
                 st.caption("Nur die ersten 20 Zeilen werden angezeigt.")
 
-            st.download_button(label="SQL herunterladen",
-                            data=sql_data,
-                            file_name=f"testdaten_{timestamp}.sql",
-                            mime="text/plain",
+            # The full script is only written on request, into a temporary
+            # file that is reused until the data or the options change
+            sql_key = (fingerprint, table_name, dialect)
+            sql_export = st.session_state.get("sql_export")
+            if sql_export is None or sql_export["key"] != sql_key:
+                if st.button("SQL-Script erstellen",
+                            use_container_width=True):
+                    remove_sql_export_files()
+                    paths = {}
+                    with tempfile.NamedTemporaryFile(suffix=".sql",
+                                                    delete=False) as sql_file:
+                        write_sql(df,
+                                sql_file,
+                                table_name=table_name,
+                                dialect=dialect)
+                        paths["sql"] = sql_file.name
+
+                    # The MySQL script reads the rows from a separate file
+                    if dialect == "mysql":
+                        with tempfile.NamedTemporaryFile(
+                                suffix=".tsv", delete=False) as tsv_file:
+                            write_tsv(df, tsv_file)
+                            paths["tsv"] = tsv_file.name
+
+                    sql_export = {"key": sql_key, "paths": paths}
+                    st.session_state.sql_export = sql_export
+
+            if sql_export is not None and sql_export["key"] == sql_key:
+                with open(sql_export["paths"]["sql"], "rb") as sql_file:
+                    st.download_button(label="SQL herunterladen",
+                                    data=sql_file,
+                                    file_name=f"testdaten_{timestamp}.sql",
+                                    mime="text/plain",
+                                    use_container_width=True)
+
+                if "tsv" in sql_export["paths"]:
+                    with open(sql_export["paths"]["tsv"], "rb") as tsv_file:
+                        st.download_button(
+                            label="TSV-Daten herunterladen",
+                            data=tsv_file,
+                            file_name=f"{sanitize_table_name(table_name)}.tsv",
+                            mime="text/tab-separated-values",
                             use_container_width=True)
 
     # Add option to save the configuration to the database
@@ -3,11 +3,21 @@ import pandas as pd
 import numpy as np
 import time
 import datetime
+import os
+import tempfile
 import base64
-from io import StringIO, BytesIO
+from io import StringIO
 
-from pseudonymize_utils import pseudonymize_data, get_pseudonymization_methods
-from export_utils import export_to_csv
+from pseudonymize_utils import (pseudonymize_data, pseudonymize_file, get_pseudonymization_methods,
+                                replacement_mapping_to_json, replacement_mapping_from_json,
+                                HMAC_SECRET_ENV, SHA256_HEX_LENGTH)
+from export_utils import export_to_csv, export_to_xlsx
+
+# CSV files from this size on are only previewed and pseudonymized chunk by chunk
+LARGE_CSV_BYTES = 50 * 1024 * 1024
+
+# Number of rows of a large CSV file that are loaded for the preview
+LARGE_CSV_PREVIEW_ROWS = 1000
 
 # Set page config
 st.set_page_config(
@@ -63,6 +73,20 @@ if 'pseudo_config' not in st.session_state:
     st.session_state.pseudo_config = {}
 if 'pseudo_selections' not in st.session_state:
     st.session_state.pseudo_selections = {}
+if 'replacement_mapping' not in st.session_state:
+    st.session_state.replacement_mapping = {}
+if 'csv_source' not in st.session_state:
+    st.session_state.csv_source = None
+if 'large_csv' not in st.session_state:
+    st.session_state.large_csv = False
+
+
+def remove_pseudonymized_file():
+    """Delete the temporary output file of the last chunked pseudonymization"""
+    path = st.session_state.pop("pseudonymized_file", None)
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+
 
 # 1. Data Upload Section
 st.header("1. Daten hochladen")
@@ -78,6 +102,11 @@ with upload_col1:
     
     if uploaded_file is not None:
         try:
+            # Read options of a CSV file, which is pseudonymized chunk by chunk;
+            # large files are only previewed
+            csv_source = None
+            large_csv = False
+            
             # Try to determine file type from extension
             file_extension = uploaded_file.name.split('.')[-1].lower()
             
@@ -102,8 +131,14 @@ with upload_col1:
                         help="Die Zeichenkodierung der Datei"
                     )
                 
-                # Parse the CSV file
-                data = pd.read_csv(uploaded_file, sep=delimiter, encoding=encoding)
+                # Parse the CSV file; large files are only previewed
+                csv_source = {"sep": delimiter, "encoding": encoding}
+                large_csv = uploaded_file.size >= LARGE_CSV_BYTES
+                if large_csv:
+                    data = pd.read_csv(uploaded_file, sep=delimiter, encoding=encoding,
+                                       nrows=LARGE_CSV_PREVIEW_ROWS)
+                else:
+                    data = pd.read_csv(uploaded_file, sep=delimiter, encoding=encoding)
                 
             else:  # Excel file
                 # Show sheet selection if it's an Excel file
@@ -121,6 +156,8 @@ with upload_col1:
             
             # Store the data in session state
             st.session_state.uploaded_data = data
+            st.session_state.csv_source = csv_source
+            st.session_state.large_csv = large_csv
             
             # Display success message and data preview
             st.success(f"✅ Datei '{uploaded_file.name}' erfolgreich geladen!")
@@ -128,18 +165,28 @@ with upload_col1:
             # Data stats
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Anzahl Datensätze", data.shape[0])
+                if large_csv:
+                    st.metric("Anzahl Datensätze (Vorschau)", data.shape[0])
+                else:
+                    st.metric("Anzahl Datensätze", data.shape[0])
             with col2:
                 st.metric("Anzahl Felder", data.shape[1])
             with col3:
-                memory_usage = data.memory_usage(deep=True).sum()
-                if memory_usage < 1024:
-                    memory_str = f"{memory_usage} Bytes"
-                elif memory_usage < 1024 * 1024:
-                    memory_str = f"{memory_usage/1024:.1f} KB"
+                if large_csv:
+                    st.metric("Dateigröße", f"{uploaded_file.size/(1024*1024):.1f} MB")
                 else:
-                    memory_str = f"{memory_usage/(1024*1024):.1f} MB"
-                st.metric("Speichernutzung", memory_str)
+                    memory_usage = data.memory_usage(deep=True).sum()
+                    if memory_usage < 1024:
+                        memory_str = f"{memory_usage} Bytes"
+                    elif memory_usage < 1024 * 1024:
+                        memory_str = f"{memory_usage/1024:.1f} KB"
+                    else:
+                        memory_str = f"{memory_usage/(1024*1024):.1f} MB"
+                    st.metric("Speichernutzung", memory_str)
+            
+            if large_csv:
+                st.info(f"Große Datei: Es werden nur die ersten {LARGE_CSV_PREVIEW_ROWS} Datensätze geladen. "
+                        "Die Pseudonymisierung verarbeitet die Datei blockweise.")
             
             # Preview the data
             st.subheader("Datenvorschau")
@@ -148,6 +195,8 @@ with upload_col1:
         except Exception as e:
             st.error(f"Fehler beim Laden der Datei: {str(e)}")
             st.session_state.uploaded_data = None
+            st.session_state.csv_source = None
+            st.session_state.large_csv = False
 
 with upload_col2:
     st.markdown("### Über Pseudonymisierung")
@@ -230,6 +279,30 @@ if st.session_state.uploaded_data is not None:
                     "char": mask_char if mask_char else "*"
                 }
             
+            elif method_name == "hmac" and selected_columns:
+                col1, col2 = st.columns(2)
+                with col1:
+                    hmac_secret = st.text_input(
+                        "Geheimer Schlüssel",
+                        value=st.session_state.pseudo_config.get("hmac", {}).get("secret") or "",
+                        type="password",
+                        help=f"Ohne Eingabe wird die Umgebungsvariable {HMAC_SECRET_ENV} verwendet"
+                    )
+                with col2:
+                    hmac_length = st.number_input(
+                        "Länge des Hash-Werts (Zeichen)",
+                        min_value=8,
+                        max_value=SHA256_HEX_LENGTH,
+                        value=st.session_state.pseudo_config.get("hmac", {}).get("length") or SHA256_HEX_LENGTH,
+                        help="Gekürzte Hash-Werte verkleinern die Ausgabe, erhöhen aber das Kollisionsrisiko"
+                    )
+                
+                # Store hmac configuration
+                st.session_state.pseudo_config["hmac"] = {
+                    "secret": hmac_secret or None,
+                    "length": hmac_length
+                }
+            
             elif method_name == "offset" and selected_columns:
                 col1, col2 = st.columns(2)
                 with col1:
@@ -258,9 +331,43 @@ if st.session_state.uploaded_data is not None:
                     help="Bei Aktivierung wird die Groß-/Kleinschreibung beim Ersetzen beibehalten"
                 )
                 
+                consistent = st.checkbox(
+                    "Konsistente Ersetzung",
+                    value=st.session_state.pseudo_config.get("replace", {}).get("consistent", False),
+                    help="Gleiche Originalwerte erhalten in allen Zeilen und Dateien denselben Ersatzwert, sodass Verknüpfungen erhalten bleiben"
+                )
+                
+                replace_secret = None
+                if consistent:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        replace_secret = st.text_input(
+                            "Geheimer Schlüssel für die Ersetzung",
+                            value=st.session_state.pseudo_config.get("replace", {}).get("secret") or "",
+                            type="password",
+                            help=f"Bestimmt die Ersatzwerte; ohne Eingabe wird die Umgebungsvariable {HMAC_SECRET_ENV} verwendet"
+                        )
+                    with col2:
+                        mapping_file = st.file_uploader(
+                            "Ersetzungstabelle laden (optional)",
+                            type=["json"],
+                            help="Eine früher heruntergeladene Ersetzungstabelle, deren Ersatzwerte bei gleicher Sprache und gleicher Formatbeibehaltung wiederverwendet werden"
+                        )
+                        if mapping_file is not None:
+                            try:
+                                # Merge, so replacements added since the upload are kept
+                                loaded_mapping = replacement_mapping_from_json(mapping_file.getvalue())
+                                for table_key, replacements in loaded_mapping.items():
+                                    st.session_state.replacement_mapping.setdefault(table_key, {}).update(replacements)
+                            except ValueError as e:
+                                st.error(f"Ungültige Ersetzungstabelle: {str(e)}")
+                
                 # Store replace configuration
                 st.session_state.pseudo_config["replace"] = {
-                    "preserve_format": preserve_format
+                    "preserve_format": preserve_format,
+                    "consistent": consistent,
+                    "secret": replace_secret or None,
+                    "mapping": st.session_state.replacement_mapping
                 }
     
     # Show a summary of the selected pseudonymization methods
@@ -289,13 +396,52 @@ if st.session_state.uploaded_data is not None:
             """, unsafe_allow_html=True)
             
             try:
-                # Apply pseudonymization using the utility function
-                pseudonymized_df = pseudonymize_data(
-                    st.session_state.uploaded_data,
-                    st.session_state.pseudo_selections,
-                    st.session_state.pseudo_config,
-                    locale="de_DE"  # Use default locale for consistency
-                )
+                # Drop the output file of an earlier chunked run
+                remove_pseudonymized_file()
+                
+                if st.session_state.large_csv and uploaded_file is not None:
+                    # Stream the large file chunk by chunk into a temporary file
+                    output_file = tempfile.NamedTemporaryFile(suffix=".csv", delete=False)
+                    with output_file:
+                        uploaded_file.seek(0)
+                        rows = pseudonymize_file(
+                            uploaded_file,
+                            output_file,
+                            st.session_state.pseudo_selections,
+                            st.session_state.pseudo_config,
+                            locale="de_DE",
+                            **st.session_state.csv_source
+                        )
+                    st.session_state.pseudonymized_file = output_file.name
+                    
+                    # Only the beginning of the result is shown
+                    pseudonymized_df = pd.read_csv(output_file.name, nrows=LARGE_CSV_PREVIEW_ROWS)
+                    success_message = f"✅ {rows} Datensätze erfolgreich pseudonymisiert!"
+                elif st.session_state.csv_source is not None and uploaded_file is not None:
+                    # Small CSV files take the same path, so that the values are
+                    # read as in the file and get the same pseudonyms as large ones
+                    with tempfile.TemporaryFile() as output_file:
+                        uploaded_file.seek(0)
+                        pseudonymize_file(
+                            uploaded_file,
+                            output_file,
+                            st.session_state.pseudo_selections,
+                            st.session_state.pseudo_config,
+                            locale="de_DE",
+                            **st.session_state.csv_source
+                        )
+                        output_file.seek(0)
+                        pseudonymized_df = pd.read_csv(output_file)
+                    success_message = "✅ Daten erfolgreich pseudonymisiert!"
+                else:
+                    # Apply pseudonymization using the utility function
+                    pseudonymized_df = pseudonymize_data(
+                        st.session_state.uploaded_data,
+                        st.session_state.pseudo_selections,
+                        st.session_state.pseudo_config,
+                        locale="de_DE"  # Use default locale for consistency
+                    )
+                    success_message = "✅ Daten erfolgreich pseudonymisiert!"
                 
                 # Store the result in session state
                 st.session_state.pseudonymized_data = pseudonymized_df
@@ -304,7 +450,7 @@ if st.session_state.uploaded_data is not None:
                 pseudo_animation.empty()
                 
                 # Show success message
-                st.success("✅ Daten erfolgreich pseudonymisiert!")
+                st.success(success_message)
                 
             except Exception as e:
                 # Clear the animation
@@ -336,37 +482,62 @@ if st.session_state.uploaded_data is not None:
         
         col1, col2 = st.columns(2)
         
+        # Result of a chunked pseudonymization, only previewed in memory
+        pseudonymized_file = st.session_state.get("pseudonymized_file")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        
         with col1:
             # CSV download
-            csv_data = export_to_csv(st.session_state.pseudonymized_data)
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            
-            st.download_button(
-                label="Als CSV herunterladen",
-                data=csv_data,
-                file_name=f"pseudonymisiert_{timestamp}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-        
-        with col2:
-            # Excel download
-            try:
-                excel_buffer = BytesIO()
-                st.session_state.pseudonymized_data.to_excel(excel_buffer, index=False)
-                excel_buffer.seek(0)  # Go back to the start of the buffer
-                excel_data = excel_buffer.getvalue()
+            if pseudonymized_file is not None:
+                with open(pseudonymized_file, "rb") as csv_file:
+                    st.download_button(
+                        label="Als CSV herunterladen",
+                        data=csv_file,
+                        file_name=f"pseudonymisiert_{timestamp}.csv",
+                        mime="text/csv",
+                        use_container_width=True
+                    )
+            else:
+                csv_data = export_to_csv(st.session_state.pseudonymized_data)
                 
                 st.download_button(
-                    label="Als Excel herunterladen",
-                    data=excel_data,
-                    file_name=f"pseudonymisiert_{timestamp}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    label="Als CSV herunterladen",
+                    data=csv_data,
+                    file_name=f"pseudonymisiert_{timestamp}.csv",
+                    mime="text/csv",
                     use_container_width=True
                 )
-            except Exception as e:
-                st.error(f"Excel-Export nicht verfügbar: {str(e)}")
-                st.info("Bitte verwenden Sie den CSV-Export als Alternative.")
+        
+        with col2:
+            if pseudonymized_file is not None:
+                st.info("Für große Dateien steht nur der CSV-Export zur Verfügung.")
+            else:
+                # Excel download
+                try:
+                    # Streamed row by row, so large files do not exhaust the memory
+                    excel_data = export_to_xlsx(st.session_state.pseudonymized_data)
+                    
+                    st.download_button(
+                        label="Als Excel herunterladen",
+                        data=excel_data,
+                        file_name=f"pseudonymisiert_{timestamp}.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        use_container_width=True
+                    )
+                except Exception as e:
+                    st.error(f"Excel-Export nicht verfügbar: {str(e)}")
+                    st.info("Bitte verwenden Sie den CSV-Export als Alternative.")
+        
+        # Mapping table of the consistent replacement, for reuse with other files
+        if st.session_state.replacement_mapping:
+            st.download_button(
+                label="Ersetzungstabelle herunterladen (JSON)",
+                data=replacement_mapping_to_json(st.session_state.replacement_mapping),
+                file_name=f"ersetzungstabelle_{timestamp}.json",
+                mime="application/json",
+                use_container_width=True
+            )
+            st.caption("⚠️ Die Ersetzungstabelle enthält die Originalwerte und muss vertraulich behandelt werden.")
         
         # Add GDPR compliance information
         st.info("""
@@ -389,6 +560,7 @@ if st.session_state.uploaded_data is not None:
             
             # Clear pseudonymized data
             st.session_state.pseudonymized_data = None
+            remove_pseudonymized_file()
             
             # Clear the animation
             reset_lock_container.empty()
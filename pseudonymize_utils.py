@@ -1,11 +1,41 @@
 import pandas as pd
 import numpy as np
 import hashlib
+import hmac
+import json
+import os
 import re
-from faker import Faker
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from faker_factory import borrow_faker
+from export_utils import write_csv
 
+# Environment variable with the secret key of the hmac method
+HMAC_SECRET_ENV = "PSEUDONYMIZATION_SECRET"
 
-def pseudonymize_data(df, columns_to_pseudonymize, methods=None, locale="de_DE"):
+# Length of a full SHA-256 digest in hexadecimal characters
+SHA256_HEX_LENGTH = 64
+
+# Number of rows pseudonymize_file reads and writes at once
+DEFAULT_FILE_CHUNKSIZE = 100_000
+
+# Minimum number of distinct values before they are spread over a thread pool
+PARALLEL_MIN_VALUES = 50_000
+
+# Maximum number of rows of one column handled by one worker process task
+PARALLEL_ROWS_PER_TASK = 250_000
+
+
+def pseudonymize_data(
+    df,
+    columns_to_pseudonymize,
+    methods=None,
+    locale="de_DE",
+    seed=None,
+    workers=None,
+    executor=None,
+):
     """
     Pseudonymize specific columns in a DataFrame.
 
@@ -16,6 +46,14 @@ def pseudonymize_data(df, columns_to_pseudonymize, methods=None, locale="de_DE")
         methods (dict, optional): Dictionary with custom pseudonymization configuration.
                                e.g. {'mask': {'show_first': 3, 'show_last': 2, 'char': '*'}}
         locale (str, optional): Locale for Faker when replacing values. Defaults to "de_DE".
+        seed (int, optional): Seed for the fake values of the replace method. Every
+            column gets its own seed derived from it, so the result does not depend
+            on the column order or the number of workers.
+        workers (int, optional): Number of processes to pseudonymize the columns
+            (and row ranges of large columns) in parallel. With a seed, or without
+            random replacement, the result equals the serial result.
+        executor (ProcessPoolExecutor, optional): Process pool to use when
+            workers is given, instead of starting one for this call
 
     Returns:
         pandas.DataFrame: DataFrame with pseudonymized data
@@ -23,13 +61,12 @@ def pseudonymize_data(df, columns_to_pseudonymize, methods=None, locale="de_DE")
     # Create a copy of the dataframe to avoid modifying the original
     pseudonymized_df = df.copy()
     
-    # Initialize Faker with the specified locale
-    fake = Faker(locale)
-    
     # Default methods configuration
     default_methods = {
+        'hash': {'workers': None},
+        'hmac': {'secret': None, 'length': None, 'workers': None},
         'mask': {'show_first': 2, 'show_last': 2, 'char': '*'},
-        'replace': {'preserve_format': True},
+        'replace': {'preserve_format': True, 'consistent': False, 'secret': None, 'mapping': None},
         'offset': {'numeric_offset': 5, 'date_offset_days': 10},
     }
     
@@ -41,44 +78,396 @@ def pseudonymize_data(df, columns_to_pseudonymize, methods=None, locale="de_DE")
             else:
                 default_methods[method] = config
     
-    # Process each column according to the specified pseudonymization method
-    for column, method in columns_to_pseudonymize.items():
-        if column not in df.columns:
-            continue
-            
-        if method == 'hash':
-            pseudonymized_df[column] = pseudonymized_df[column].apply(
-                lambda x: hash_value(x) if pd.notna(x) else x
+    # The consistent replacement memoizes its values in a mapping table
+    replace_config = default_methods['replace']
+    if replace_config.get('consistent') and replace_config.get('mapping') is None:
+        replace_config['mapping'] = {}
+    
+    columns = {
+        column: method
+        for column, method in columns_to_pseudonymize.items()
+        if column in df.columns
+    }
+    
+    if workers and workers > 1 and len(df) > 0 and columns:
+        results = _pseudonymize_in_processes(
+            df, columns, default_methods, locale, seed, workers, executor
+        )
+    else:
+        # Borrow a cached Faker instance for the specified locale
+        with borrow_faker(locale) as fake:
+            # Process each column according to the specified pseudonymization method
+            results = {
+                column: _pseudonymize_column(fake, df[column], column, method, default_methods, seed)
+                for column, method in columns.items()
+            }
+    
+    for column, values in results.items():
+        pseudonymized_df[column] = values
+    
+    return pseudonymized_df
+
+
+def _pseudonymize_column(fake, series, column, method, methods, seed=None, faker_method=None):
+    """
+    Pseudonymize the values of one column.
+
+    Args:
+        fake (Faker): Faker instance for the replace method
+        series (pandas.Series): Values of the column (or of a row range of it)
+        column (str): Column name
+        method (str): Pseudonymization method
+        methods (dict): Complete pseudonymization configuration
+        seed (int, optional): Seed the column seed of the replace method is derived from
+        faker_method (str, optional): Faker method of the replace method,
+            determined from the values if not given
+
+    Returns:
+        pandas.Series: Pseudonymized values (series itself for unknown methods)
+    """
+    if method == 'hash':
+        config = methods['hash']
+        return hash_series(series, workers=config.get('workers'))
+    
+    if method == 'hmac':
+        config = methods['hmac']
+        return hmac_series(
+            series,
+            get_hmac_secret(config),
+            length=config.get('length'),
+            workers=config.get('workers'),
+        )
+    
+    if method == 'mask':
+        config = methods['mask']
+        return mask_series(series, config['show_first'], config['show_last'], config['char'])
+    
+    if method == 'replace':
+        config = methods['replace']
+        preserve = config.get('preserve_format', True)
+    
+        # Determine appropriate faker method based on column name and content
+        if faker_method is None:
+            faker_method = determine_faker_method(column, series)
+    
+        if config.get('consistent'):
+            # Same original value, same fake value (across rows, files and runs)
+            return consistent_replace_series(
+                series,
+                fake,
+                faker_method,
+                get_hmac_secret(config),
+                preserve_format=preserve,
+                mapping=config['mapping'],
             )
-            
-        elif method == 'mask':
-            config = default_methods['mask']
-            pseudonymized_df[column] = pseudonymized_df[column].apply(
-                lambda x: mask_value(x, config['show_first'], config['show_last'], config['char']) if pd.notna(x) else x
+    
+        if seed is not None:
+            fake.seed_instance(_column_seed(seed, column))
+    
+        # Replace values with Faker data
+        return series.apply(
+            lambda x: generate_fake_data(fake, faker_method, x, preserve) if pd.notna(x) else x
+        )
+    
+    if method == 'offset':
+        config = methods['offset']
+    
+        # Attempt to determine the data type and apply appropriate offset
+        if is_numeric_column(series):
+            return series + config['numeric_offset']
+        if is_date_column(series):
+            return series + pd.Timedelta(days=config['date_offset_days'])
+    
+    return series
+
+
+def _column_seed(seed, column):
+    """Derive the Faker seed of one column, independent of the column order"""
+    column_key = zlib.crc32(str(column).encode("utf-8"))
+    seed_sequence = np.random.SeedSequence(seed, spawn_key=(column_key,))
+    return int(seed_sequence.generate_state(1, np.uint64)[0])
+
+
+def _pseudonymize_in_processes(df, columns, methods, locale, seed, workers, executor=None):
+    """
+    Pseudonymize columns on a process pool.
+
+    Every column is one task. Columns with more than PARALLEL_ROWS_PER_TASK
+    rows are split into row ranges, except for random replacement (whose
+    values depend on the order of the rows) and categoricals (whose
+    categories depend on all rows). A task of the consistent replacement
+    only gets the mapping table entries of its own values and only returns
+    the entries it added.
+
+    A given executor is used and left running, otherwise a process pool
+    with workers processes is started and shut down.
+
+    Returns:
+        dict: Pseudonymized Series per column name
+    """
+    faker_methods = {
+        column: determine_faker_method(column, df[column])
+        for column, method in columns.items()
+        if method == 'replace'
+    }
+    consistent = methods['replace'].get('consistent')
+
+    tasks = []
+    for column, method in columns.items():
+        splittable = (
+            (method != 'replace' or consistent)
+            and not isinstance(df[column].dtype, pd.CategoricalDtype)
+        )
+        step = PARALLEL_ROWS_PER_TASK if splittable else len(df)
+        tasks.extend(
+            (column, method, start, min(start + step, len(df)))
+            for start in range(0, len(df), step)
+        )
+
+    parts = {column: [] for column in columns}
+
+    # Keep a bounded number of tasks in flight so memory stays bounded
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    futures = deque()
+
+    def collect():
+        column, method, original, future = futures.popleft()
+        packed, mapping = future.result()
+        parts[column].append(_unpack_series(packed, original))
+        if mapping:
+            table_key = _replacement_table_key(
+                faker_methods[column], locale, methods['replace'].get('preserve_format', True)
             )
-            
-        elif method == 'replace':
-            config = default_methods['replace']
-            preserve = config.get('preserve_format', True)
-            
-            # Determine appropriate faker method based on column name and content
-            faker_method = determine_faker_method(column, df[column])
-            
-            # Replace values with Faker data
-            pseudonymized_df[column] = pseudonymized_df[column].apply(
-                lambda x: generate_fake_data(fake, faker_method, x, preserve) if pd.notna(x) else x
+            methods['replace']['mapping'].setdefault(table_key, {}).update(mapping)
+
+    try:
+        for column, method, start, stop in tasks:
+            original = df[column].iloc[start:stop]
+            future = executor.submit(
+                _pseudonymize_column_in_worker,
+                _pack_series(original),
+                column,
+                method,
+                _task_methods(methods, method, faker_methods.get(column), locale, original),
+                locale,
+                seed,
+                faker_methods.get(column),
             )
-            
-        elif method == 'offset':
-            config = default_methods['offset']
-            
-            # Attempt to determine the data type and apply appropriate offset
-            if is_numeric_column(df[column]):
-                pseudonymized_df[column] = df[column] + config['numeric_offset']
-            elif is_date_column(df[column]):
-                pseudonymized_df[column] = df[column] + pd.Timedelta(days=config['date_offset_days'])
-    
-    return pseudonymized_df
+            futures.append((column, method, original, future))
+            if len(futures) >= 2 * workers:
+                collect()
+
+        while futures:
+            collect()
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            for *_, future in futures:
+                future.cancel()
+
+    return {
+        column: column_parts[0] if len(column_parts) == 1 else pd.concat(column_parts)
+        for column, column_parts in parts.items()
+    }
+
+
+def _task_methods(methods, method, faker_method, locale, values):
+    """Configuration of one worker task, with the mapping table cut down to its values"""
+    config = dict(methods.get(method, {}))
+
+    if method == 'replace' and config.get('consistent'):
+        table_key = _replacement_table_key(
+            faker_method, locale, config.get('preserve_format', True)
+        )
+        known = config['mapping'].get(table_key, {})
+        _, uniques = _factorize_by_text(values.dropna())
+        keys = (str(value) for value in uniques)
+        config['mapping'] = {table_key: {key: known[key] for key in keys if key in known}}
+
+    return {method: config}
+
+
+def _pseudonymize_column_in_worker(packed, column, method, methods, locale, seed, faker_method):
+    """Pseudonymize one column (range) in a worker process, returns (packed result, new mapping entries)"""
+    consistent = method == 'replace' and methods['replace'].get('consistent')
+    if consistent:
+        table_key = _replacement_table_key(
+            faker_method, locale, methods['replace'].get('preserve_format', True)
+        )
+        known = set(methods['replace']['mapping'].get(table_key, {}))
+
+    series = _unpack_series(packed)
+    with borrow_faker(locale) as fake:
+        result = _pseudonymize_column(fake, series, column, method, methods, seed, faker_method)
+
+    mapping = None
+    if consistent:
+        mapping = {
+            key: replacement
+            for key, replacement in methods['replace']['mapping'].get(table_key, {}).items()
+            if key not in known
+        }
+
+    return _pack_series(result), mapping
+
+
+def _pack_series(series):
+    """
+    Prepare a Series for the transfer to another process.
+
+    Numeric, date and text columns are sent as one Arrow IPC buffer instead
+    of pickling every value; other columns (and all columns without
+    pyarrow) are pickled as they are.
+    """
+    arrow_compatible = (
+        is_numeric_column(series)
+        or pd.api.types.is_bool_dtype(series.dtype)
+        or pd.api.types.is_datetime64_any_dtype(series.dtype)
+        or pd.api.types.is_timedelta64_dtype(series.dtype)
+        or pd.api.types.is_string_dtype(series.dtype)
+        and pd.api.types.infer_dtype(series, skipna=True) == 'string'
+    )
+    if not arrow_compatible or isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return series
+
+    try:
+        table = pa.Table.from_pandas(series.to_frame('values'), preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        return series
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue().to_pybytes()
+
+
+def _unpack_series(packed, like=None):
+    """
+    Restore a Series prepared by _pack_series.
+
+    Args:
+        packed: Arrow IPC buffer (bytes) or pickled Series
+        like (pandas.Series, optional): Original values, whose index and name
+            are restored. Arrow has a single kind of missing value, so the
+            original missing values (None, NaN, ...) are put back as well;
+            every method keeps missing values unchanged.
+
+    Returns:
+        pandas.Series: The values
+    """
+    if isinstance(packed, bytes):
+        import pyarrow as pa
+        series = pa.ipc.open_stream(packed).read_all().to_pandas()['values']
+    else:
+        series = packed
+
+    if like is None:
+        return series
+
+    values = series.to_numpy(copy=True) if series.dtype == object else series.array
+    if series.dtype == object:
+        is_null = like.isna().to_numpy()
+        if is_null.any():
+            values[is_null] = like.to_numpy(dtype=object)[is_null]
+
+    return pd.Series(values, index=like.index, name=like.name)
+
+
+def pseudonymize_file(
+    src,
+    dst,
+    columns_to_pseudonymize,
+    methods=None,
+    chunksize=DEFAULT_FILE_CHUNKSIZE,
+    locale="de_DE",
+    workers=None,
+    **read_options,
+):
+    """
+    Pseudonymize a CSV file chunk by chunk.
+
+    The file is read with pd.read_csv(..., chunksize=chunksize); every chunk
+    is pseudonymized with pseudonymize_data and appended to the output as
+    soon as it is done, so the memory use does not depend on the file size.
+    The mapping table of the consistent replacement is shared by all
+    chunks, so equal values get the same replacement in every chunk.
+
+    pd.read_csv infers the dtypes per chunk, e.g. an ID column is int64 in
+    a chunk without blanks and float64 in one with, which would turn "0"
+    into "0.0". The pseudonymized columns (except for the offset method,
+    which needs numbers) are therefore read as text, so the result does not
+    depend on the chunk boundaries.
+
+    Args:
+        src: Path or file-like object of the CSV file to read
+        dst: Path or binary file-like object to write the CSV output to
+        columns_to_pseudonymize (dict): Column names mapped to pseudonymization
+            methods, as for pseudonymize_data
+        methods (dict, optional): Pseudonymization configuration, as for
+            pseudonymize_data
+        chunksize (int): Number of rows per chunk
+        locale (str, optional): Locale for Faker when replacing values
+        workers (int, optional): Number of processes, as for pseudonymize_data.
+            One process pool is shared by all chunks.
+        **read_options: Options passed to pd.read_csv (e.g. sep, encoding).
+            A dtype dict takes precedence over the text columns.
+
+    Returns:
+        int: Number of data rows written
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    # Copy the configuration, so a mapping table created here is shared by
+    # all chunks without changing the caller's dicts
+    methods = {method: dict(config) for method, config in (methods or {}).items()}
+    replace_config = methods.get('replace', {})
+    if replace_config.get('consistent') and replace_config.get('mapping') is None:
+        replace_config['mapping'] = {}
+
+    text_columns = {
+        column: str for column, method in columns_to_pseudonymize.items() if method != 'offset'
+    }
+    dtype = read_options.pop('dtype', None)
+    if dtype is None or isinstance(dtype, dict):
+        read_options['dtype'] = {**text_columns, **(dtype or {})}
+    else:
+        read_options['dtype'] = dtype
+
+    def pseudonymized_chunks(executor):
+        with pd.read_csv(src, chunksize=chunksize, **read_options) as reader:
+            for chunk in reader:
+                yield pseudonymize_data(
+                    chunk,
+                    columns_to_pseudonymize,
+                    methods,
+                    locale=locale,
+                    workers=workers,
+                    executor=executor,
+                )
+
+    def write(dst_file):
+        if not workers or workers <= 1:
+            return write_csv(pseudonymized_chunks(None), dst_file)
+
+        # Start the worker processes once instead of once per chunk
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return write_csv(pseudonymized_chunks(executor), dst_file)
+
+    if hasattr(dst, "write"):
+        return write(dst)
+
+    with open(dst, "wb") as dst_file:
+        return write(dst_file)
 
 
 def hash_value(value):
@@ -88,6 +477,317 @@ def hash_value(value):
     return hashlib.sha256(value.encode()).hexdigest()
 
 
+def hash_series(series, workers=None):
+    """
+    Hash all values of a Series using SHA-256.
+
+    Gives the same result as hash_value per cell, but every distinct value
+    is hashed only once. Missing values are kept unchanged.
+
+    Args:
+        series (pandas.Series): Values to hash
+        workers (int, optional): Number of threads to hash the distinct
+            values with. hashlib releases the GIL only for long values, so
+            this mainly helps with columns of long texts.
+
+    Returns:
+        pandas.Series: Hexadecimal hashes
+    """
+    return map_unique_values(series, _sha256_hexdigests, workers=workers)
+
+
+def _sha256_hexdigests(values):
+    """Hash a list of values using SHA-256, as hash_value does"""
+    sha256 = hashlib.sha256
+    return [sha256(str(value).encode()).hexdigest() for value in values]
+
+
+def get_hmac_secret(config=None):
+    """
+    Get the secret key of the hmac method.
+
+    Args:
+        config (dict, optional): hmac configuration; its 'secret' takes
+            precedence over the HMAC_SECRET_ENV environment variable
+
+    Returns:
+        bytes: Secret key
+
+    Raises:
+        ValueError: If no secret is configured
+    """
+    secret = (config or {}).get('secret') or os.getenv(HMAC_SECRET_ENV)
+    if not secret:
+        raise ValueError(
+            f"hmac requires a secret (config 'secret' or the {HMAC_SECRET_ENV} environment variable)"
+        )
+
+    return secret.encode() if isinstance(secret, str) else bytes(secret)
+
+
+def hmac_value(value, secret, length=None):
+    """
+    Hash a value using HMAC-SHA-256 with a secret key.
+
+    Args:
+        value: Value to hash (converted with str)
+        secret (bytes or str): Secret key
+        length (int, optional): Number of hexadecimal characters to keep
+            (1 to 64, all by default)
+
+    Returns:
+        str: Hexadecimal (truncated) HMAC
+    """
+    return _hmac_hexdigests(secret, length)([value])[0]
+
+
+def hmac_series(series, secret, length=None, workers=None):
+    """
+    Hash all values of a Series using HMAC-SHA-256 with a secret key.
+
+    Without the key, common values cannot be recovered by hashing
+    candidate values (dictionary attack). Every distinct value is hashed
+    only once; missing values are kept unchanged.
+
+    Args:
+        series (pandas.Series): Values to hash
+        secret (bytes or str): Secret key
+        length (int, optional): Number of hexadecimal characters to keep
+            (1 to 64, all by default)
+        workers (int, optional): Number of threads to hash the distinct
+            values with
+
+    Returns:
+        pandas.Series: Hexadecimal (truncated) HMACs
+    """
+    return map_unique_values(series, _hmac_hexdigests(secret, length), workers=workers)
+
+
+def _hmac_hexdigests(secret, length=None):
+    """
+    Create a function that computes the HMACs of a list of values.
+
+    The key is processed once into a keyed HMAC object, which is copied
+    per value instead of hashing the padded key again.
+    """
+    if length is None:
+        length = SHA256_HEX_LENGTH
+    if not 1 <= length <= SHA256_HEX_LENGTH:
+        raise ValueError(f"length must be between 1 and {SHA256_HEX_LENGTH}")
+
+    if isinstance(secret, str):
+        secret = secret.encode()
+    keyed = hmac.new(secret, digestmod=hashlib.sha256)
+
+    def hexdigests(values):
+        results = []
+        for value in values:
+            mac = keyed.copy()
+            mac.update(str(value).encode())
+            results.append(mac.hexdigest()[:length])
+        return results
+
+    return hexdigests
+
+
+def consistent_replace_series(series, faker, method, secret, preserve_format=True, mapping=None):
+    """
+    Replace values with fake data, using the same fake value for equal values.
+
+    The Faker instance is seeded per distinct value with an HMAC of the
+    value, so the replacement only depends on the value, the Faker method,
+    the locale and the secret key. Every distinct value costs one Faker
+    call; values found in the mapping table are taken from there.
+
+    Args:
+        series (pandas.Series): Values to replace
+        faker (Faker): Faker instance (its random state is changed)
+        method (str): Faker method to use
+        secret (bytes or str): Secret key the replacements are derived from
+        preserve_format (bool): Whether to preserve the case of the original values
+        mapping (dict, optional): Mapping table {(faker method, locale,
+            preserve_format): {original value: fake value}}. Only the
+            replacements made with the same settings are reused, new ones
+            are added in place, so it can be saved with
+            replacement_mapping_to_json.
+
+    Returns:
+        pandas.Series: Replaced values; missing values are kept unchanged
+    """
+    if getattr(faker, method, None) is None:
+        return series.copy()
+
+    if isinstance(secret, str):
+        secret = secret.encode()
+    keyed = hmac.new(secret, method.encode() + b"\x00", digestmod=hashlib.sha256)
+    if mapping is None:
+        known = {}
+    else:
+        table_key = _replacement_table_key(method, faker.locales[0], preserve_format)
+        known = mapping.setdefault(table_key, {})
+
+    def replace(values):
+        results = []
+        for value in values:
+            key = str(value)
+            replacement = known.get(key)
+            if replacement is None:
+                mac = keyed.copy()
+                mac.update(key.encode())
+                faker.seed_instance(int.from_bytes(mac.digest()[:8], "big"))
+                replacement = generate_fake_data(faker, method, value, preserve_format)
+                known[key] = replacement
+            results.append(replacement)
+        return results
+
+    return map_unique_values(series, replace)
+
+
+def _replacement_table_key(method, locale, preserve_format):
+    """Key of the replacements made with one Faker method, locale and preserve_format"""
+    return (method, locale, bool(preserve_format))
+
+
+def replacement_mapping_to_json(mapping):
+    """
+    Serialize a mapping table of the consistent replacement.
+
+    Every Faker method, locale and preserve_format setting is written as a
+    table of its own that records these settings. The table contains the
+    original values and must be kept as confidential as the original data.
+
+    Args:
+        mapping (dict): Mapping table {(faker method, locale, preserve_format):
+            {original value: fake value}}
+
+    Returns:
+        str: JSON string
+    """
+    tables = [
+        {
+            "faker_method": method,
+            "locale": locale,
+            "preserve_format": preserve_format,
+            "replacements": replacements,
+        }
+        for (method, locale, preserve_format), replacements in sorted(mapping.items())
+    ]
+    return json.dumps(tables, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def replacement_mapping_from_json(text):
+    """
+    Load a mapping table of the consistent replacement.
+
+    Args:
+        text (str or bytes): JSON string written by replacement_mapping_to_json
+
+    Returns:
+        dict: Mapping table {(faker method, locale, preserve_format):
+            {original value: fake value}}
+
+    Raises:
+        ValueError: If the JSON is not a valid mapping table, e.g. one that
+            does not record the locale and preserve_format of its replacements
+    """
+    tables = json.loads(text)
+
+    def valid(table):
+        return (
+            isinstance(table, dict)
+            and isinstance(table.get("faker_method"), str)
+            and isinstance(table.get("locale"), str)
+            and isinstance(table.get("preserve_format"), bool)
+            and isinstance(table.get("replacements"), dict)
+            and all(isinstance(value, str) for value in table["replacements"].values())
+        )
+
+    if not isinstance(tables, list) or not all(valid(table) for table in tables):
+        raise ValueError(
+            "mapping must be a list of tables with faker_method, locale, "
+            "preserve_format and {original value: fake value} replacements"
+        )
+
+    mapping = {}
+    for table in tables:
+        table_key = _replacement_table_key(
+            table["faker_method"], table["locale"], table["preserve_format"]
+        )
+        mapping.setdefault(table_key, {}).update(table["replacements"])
+
+    return mapping
+
+
+def map_unique_values(series, function, workers=None):
+    """
+    Apply a function once per distinct non-null value of a Series.
+
+    Values count as equal if their text representation is equal, so
+    1, 1.0 and True stay different values. The results are mapped back to
+    all rows; missing values are kept unchanged.
+
+    Args:
+        series (pandas.Series): Values to transform
+        function (callable): Called with a list of distinct values and
+            returning a list of results in the same order
+        workers (int, optional): Number of threads to split the distinct
+            values over (only used from PARALLEL_MIN_VALUES values on)
+
+    Returns:
+        pandas.Series: Transformed values with the index and name of series
+    """
+    is_null = series.isna().to_numpy()
+    if is_null.all():
+        return series.copy()
+
+    values = series[~is_null]
+    codes, uniques = _factorize_by_text(values)
+
+    if workers and workers > 1 and len(uniques) >= PARALLEL_MIN_VALUES:
+        batch_size = -(-len(uniques) // workers)
+        batches = [uniques[i:i + batch_size] for i in range(0, len(uniques), batch_size)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = [result for batch in executor.map(function, batches) for result in batch]
+    else:
+        results = function(uniques)
+
+    mapped = np.empty(len(results), dtype=object)
+    mapped[:] = results
+
+    output = series.to_numpy(dtype=object, copy=True)
+    output[~is_null] = mapped[codes]
+    output = pd.Series(output, index=series.index, name=series.name)
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        output = output.astype('category')
+
+    return output
+
+
+def _factorize_by_text(values):
+    """
+    Factorize non-null values so that equal codes have equal str() values.
+
+    Returns:
+        tuple: (codes, list of one original value per code)
+    """
+    if pd.api.types.is_float_dtype(values.dtype) and isinstance(values.dtype, np.dtype):
+        # Factorize the bit patterns, which keeps 0.0 and -0.0 apart
+        float_values = values.to_numpy()
+        bits = float_values.view(np.dtype(f"i{float_values.dtype.itemsize}"))
+        codes, unique_bits = pd.factorize(bits)
+        return codes, unique_bits.view(float_values.dtype).tolist()
+
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=False) != 'string':
+        # Mixed types: Python equality would merge e.g. 1, 1.0 and True
+        codes, _ = pd.factorize(values.astype(str))
+        _, first_positions = np.unique(codes, return_index=True)
+        return codes, values.iloc[first_positions].tolist()
+
+    codes, uniques = pd.factorize(values)
+    return codes, list(uniques)
+
+
 def mask_value(value, show_first=2, show_last=2, char='*'):
     """
     Mask a value by replacing middle characters with a specified character.
@@ -105,6 +805,194 @@ def mask_value(value, show_first=2, show_last=2, char='*'):
     return value[:show_first] + char * (length - show_first - show_last) + value[-show_last:]
 
 
+def mask_series(series, show_first=2, show_last=2, char='*'):
+    """
+    Mask all values of a Series like mask_value, without a Python call per cell.
+
+    The text values are masked with Arrow: pure ASCII values directly in
+    the data buffer, others with compute kernels (length, slices, repeat,
+    join); without pyarrow a list comprehension is used. Arrow-backed
+    string Series stay Arrow-backed, which avoids creating a Python string
+    per cell. The result equals mask_value per cell, including that
+    show_last=0 keeps the whole value after the mask (value[-0:]). Missing
+    values are kept unchanged.
+
+    Args:
+        series (pandas.Series): Values to mask (non-text values are converted with str)
+        show_first (int): Number of leading characters to keep
+        show_last (int): Number of trailing characters to keep
+        char (str): Character used for masking
+
+    Returns:
+        pandas.Series: Masked values
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categorical.map masks every category only once
+        return series.apply(
+            lambda x: mask_value(x, show_first, show_last, char) if pd.notna(x) else x
+        )
+
+    if isinstance(series.array, pd.arrays.ArrowExtensionArray):
+        masked = _mask_arrow_extension_array(series.array, show_first, show_last, char)
+        if masked is not None:
+            return pd.Series(masked, index=series.index, name=series.name)
+
+    is_null = series.isna().to_numpy()
+    if is_null.all():
+        return series.copy()
+
+    has_nulls = is_null.any()
+    values = series[~is_null] if has_nulls else series
+    is_text = isinstance(values.dtype, pd.StringDtype) or (
+        values.dtype == object and pd.api.types.infer_dtype(values, skipna=False) == 'string'
+    )
+    if not is_text:
+        values = values.astype(object).map(str)
+
+    try:
+        masked = _mask_texts_arrow(values, show_first, show_last, char)
+    except ImportError:
+        masked = None
+    if masked is None:
+        masked = _mask_texts(values.to_numpy(dtype=object), show_first, show_last, char)
+
+    if has_nulls:
+        output = series.to_numpy(dtype=object, copy=True)
+        output[~is_null] = masked
+    else:
+        output = np.asarray(masked, dtype=object)
+
+    return pd.Series(output, index=series.index, name=series.name)
+
+
+def _mask_texts(texts, show_first, show_last, char):
+    """Mask a sequence of strings like mask_value, returns a list"""
+    keep = show_first + show_last
+    return [
+        text if len(text) <= keep
+        else text[:show_first] + char * (len(text) - keep) + text[-show_last:]
+        for text in texts
+    ]
+
+
+def _mask_texts_arrow(texts, show_first, show_last, char):
+    """
+    Mask a Series of strings like mask_value with Arrow compute kernels.
+
+    Returns:
+        numpy.ndarray: Masked strings, None if the values cannot be
+            converted to Arrow (e.g. lone surrogates)
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+
+    try:
+        array = pa.array(texts, type=pa.string(), from_pandas=True)
+    except (pa.ArrowException, UnicodeError):
+        return None
+
+    return _mask_arrow_strings(array, show_first, show_last, char).to_numpy(
+        zero_copy_only=False
+    )
+
+
+def _mask_arrow_extension_array(values, show_first, show_last, char):
+    """Mask an Arrow-backed pandas array of strings, None for other types"""
+    import pyarrow as pa
+
+    array = pa.array(values)
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        return None
+
+    return type(values)(_mask_arrow_strings(array, show_first, show_last, char))
+
+
+def _mask_arrow_strings(array, show_first, show_last, char):
+    """Mask a pyarrow string array like mask_value, returns a pyarrow array"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    masked = _mask_ascii_buffer(array, show_first, show_last, char)
+    if masked is not None:
+        return masked
+
+    keep = show_first + show_last
+    lengths = pc.utf8_length(array)
+    # The join kernel needs all parts as string or all as large_string
+    char = pa.scalar(char, type=array.type)
+    middle = pc.binary_repeat(char, pc.max_element_wise(pc.subtract(lengths, keep), 0))
+    head = pc.utf8_slice_codeunits(array, 0, show_first)
+    # value[-0:] is the whole value, as in mask_value
+    tail = pc.utf8_slice_codeunits(array, -show_last) if show_last else array
+
+    return pc.if_else(
+        pc.greater(lengths, keep),
+        pc.binary_join_element_wise(head, middle, tail, pa.scalar("", type=array.type)),
+        array,
+    )
+
+
+def _mask_ascii_buffer(array, show_first, show_last, char):
+    """
+    Mask a pure ASCII string array by overwriting its data buffer.
+
+    With one byte per character and a one byte mask character every value
+    keeps its length, so the offsets and validity buffers are reused and
+    the masked byte ranges are set with NumPy.
+
+    Returns:
+        pyarrow.Array: Masked strings, None if the values or the mask
+            character are not ASCII or show_last is 0 (which lengthens values)
+    """
+    import pyarrow as pa
+
+    if len(char) != 1 or not char.isascii() or show_last == 0 or len(array) == 0:
+        return None
+
+    validity, offsets_buffer, data_buffer = array.buffers()
+    if data_buffer is None:
+        return None
+
+    offset_type = np.int64 if pa.types.is_large_string(array.type) else np.int32
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)
+    offsets = offsets[array.offset:array.offset + len(array) + 1]
+    data = np.frombuffer(data_buffer, dtype=np.uint8)
+
+    values = data[offsets[0]:offsets[-1]]
+    if values.size and values.max() >= 0x80:
+        return None
+
+    # Most bytes are masked: fill all values with the mask character and
+    # copy back the kept bytes, one vectorized step per kept position
+    keep = show_first + show_last
+    starts = offsets[:-1]
+    stops = offsets[1:]
+    lengths = stops - starts
+    masked = lengths > keep
+
+    result = data.copy()
+    result[offsets[0]:offsets[-1]] = ord(char)
+
+    kept_positions = [starts[masked] + k for k in range(show_first)]
+    kept_positions += [stops[masked] - k for k in range(1, show_last + 1)]
+    # Values that are too short to mask are kept completely
+    short_starts = starts[~masked]
+    short_lengths = lengths[~masked]
+    kept_positions += [short_starts[short_lengths > k] + k for k in range(keep)]
+    for positions in kept_positions:
+        result[positions] = data[positions]
+
+    return pa.Array.from_buffers(
+        array.type,
+        len(array),
+        [validity, offsets_buffer, pa.py_buffer(result)],
+        null_count=array.null_count,
+        offset=array.offset,
+    )
+
+
 def determine_faker_method(column_name, series):
     """
     Determine the most appropriate Faker method based on column name and content.
@@ -212,6 +1100,7 @@ def get_pseudonymization_methods():
     """
     return {
         'hash': 'Wandelt den Originalwert in einen SHA-256 Hash-Wert um (nicht umkehrbar)',
+        'hmac': 'Wandelt den Originalwert mit einem geheimen Schlüssel in einen HMAC-SHA-256 Hash-Wert um (ohne Schlüssel nicht per Wörterbuch rückrechenbar)',
         'mask': 'Maskiert einen Teil des Wertes (z.B. "John Doe" → "Jo*****oe")',
         'replace': 'Ersetzt den Wert durch realistische Fake-Daten',
         'offset': 'Verschiebt numerische oder Datumswerte um einen festen Betrag'
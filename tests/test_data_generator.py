@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
-from data_generator import generate_data
+import data_generator
+from data_generator import generate_data, generate_data_iter, build_profile_report
 from field_definitions import field_definitions
 
 def test_generate_data_empty_fields():
@@ -85,4 +86,234 @@ def test_generate_data_invalid_field():
     df = generate_data(selected_fields)
     
     assert isinstance(df, pd.DataFrame)
-    assert df.empty  # No valid fields, so DataFrame should be empty
\ No newline at end of file
+    assert df.empty  # No valid fields, so DataFrame should be empty
+
+def test_generate_data_uses_batch_generators():
+    """Test that fields with a batch generator produce valid columns"""
+    selected_fields = {
+        "password": {"length": 8, "include_special": False, "include_digits": True},
+        "date_of_birth": {"min_age": 18, "max_age": 90},
+        "uuid": {},
+        "gender": {},
+        "state": {},
+    }
+
+    df = generate_data(selected_fields, num_records=50, locale="de_DE", seed=42)
+
+    assert len(df) == 50
+    assert all(len(value) == 8 and value.isalnum() for value in df["Passwort"])
+    assert all(len(value) == 10 for value in df["Geburtsdatum"])
+    assert all(len(value) == 36 for value in df["UUID"])
+    assert set(df["Geschlecht"]) <= {"männlich", "weiblich", "divers"}
+    assert df["Bundesland"].notna().all()
+
+    # The batch generators must be seeded as well
+    df2 = generate_data(selected_fields, num_records=50, locale="de_DE", seed=42)
+    pd.testing.assert_frame_equal(df, df2)
+
+def test_generic_regions_are_numbered_across_blocks(monkeypatch):
+    """Test that the generic region numbers continue in every block"""
+    monkeypatch.setattr(data_generator, "BLOCK_SIZE", 4)
+
+    df = generate_data({"state": {}}, num_records=10, locale="fr_FR", seed=1)
+
+    assert df["Bundesland"].tolist() == [f"Region {i}" for i in range(1, 11)]
+
+def test_generate_data_iter_matches_eager_path(monkeypatch):
+    """Test that chunked generation is identical to generate_data for a fixed seed"""
+    # Use small blocks so the dataset spans several of them
+    monkeypatch.setattr(data_generator, "BLOCK_SIZE", 7)
+    selected_fields = {
+        "username": {"with_numbers": False},
+        "email": {},
+        "password": {"length": 10},
+        "city": {"permutate": True},
+    }
+
+    expected = generate_data(selected_fields, num_records=30, seed=123)
+
+    for chunk_size in (1, 4, 7, 10, 30, 100):
+        chunks = list(
+            generate_data_iter(selected_fields, num_records=30, chunk_size=chunk_size, seed=123)
+        )
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+def test_generate_data_iter_chunk_sizes():
+    """Test the number, size and index of the yielded chunks"""
+    chunks = list(generate_data_iter({"uuid": {}}, num_records=25, chunk_size=10, seed=1))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[1].index[0] == 10
+    assert chunks[2].index[-1] == 24
+
+def test_generate_data_iter_empty():
+    """Test that no chunks are produced without fields or records"""
+    assert list(generate_data_iter({}, num_records=10)) == []
+    assert list(generate_data_iter({"email": {}}, num_records=0)) == []
+
+    with pytest.raises(ValueError):
+        list(generate_data_iter({"email": {}}, num_records=10, chunk_size=0))
+
+def test_generate_data_parallel_matches_serial(monkeypatch):
+    """Test that generating the blocks in worker processes gives the same result"""
+    monkeypatch.setattr(data_generator, "BLOCK_SIZE", 5)
+    selected_fields = {
+        "full_name": {},
+        "password": {"length": 8},
+        "uuid": {},
+    }
+
+    serial = generate_data(selected_fields, num_records=23, seed=7)
+    parallel = generate_data(selected_fields, num_records=23, seed=7, workers=2)
+    pd.testing.assert_frame_equal(parallel, serial)
+
+    chunks = generate_data_iter(
+        selected_fields, num_records=23, chunk_size=4, seed=7, workers=3
+    )
+    pd.testing.assert_frame_equal(pd.concat(chunks), serial)
+
+def test_generate_data_compact_dtypes(monkeypatch):
+    """Test that low-cardinality fields become categoricals with compact_dtypes"""
+    monkeypatch.setattr(data_generator, "BLOCK_SIZE", 20)
+    selected_fields = {
+        "gender": {},
+        "state": {"permutate": True},
+        "country": {},
+        "currency_code": {},
+        "color": {},
+        "email": {},
+    }
+
+    df = generate_data(selected_fields, num_records=50, seed=5, compact_dtypes=True)
+    plain = generate_data(selected_fields, num_records=50, seed=5)
+
+    for column in ["Geschlecht", "Bundesland", "Land", "Währungscode", "Farbe"]:
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+        assert df[column].astype(object).tolist() == plain[column].astype(object).tolist()
+    assert not isinstance(df["E-Mail"].dtype, pd.CategoricalDtype)
+
+    # The chunks share their categories, so concatenating keeps the dtype
+    chunks = generate_data_iter(
+        selected_fields, num_records=50, chunk_size=15, seed=5, compact_dtypes=True
+    )
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+def test_generate_data_compact_dtypes_unknown_states():
+    """Test that states without a known value set stay plain strings"""
+    df = generate_data({"state": {}}, num_records=5, locale="fr_FR", compact_dtypes=True)
+
+    assert not isinstance(df["Bundesland"].dtype, pd.CategoricalDtype)
+
+def test_generate_data_permutation_groups():
+    """Test that fields in one permutation group share their permutation"""
+    original = generate_data(
+        {"password": {"length": 10}, "uuid": {}, "email": {}}, num_records=40, seed=11
+    )
+    grouped = generate_data(
+        {
+            "password": {"length": 10, "permutate": True, "permutation_group": "login"},
+            "uuid": {"permutate": True, "permutation_group": "login"},
+            "email": {},
+        },
+        num_records=40,
+        seed=11,
+    )
+
+    def pairs(df):
+        return set(zip(df["Passwort"], df["UUID"]))
+
+    # The rows were shuffled, but password and UUID stay together
+    assert grouped["Passwort"].tolist() != original["Passwort"].tolist()
+    assert pairs(grouped) == pairs(original)
+    assert grouped["E-Mail"].tolist() == original["E-Mail"].tolist()
+
+    # Without a shared group the fields are shuffled independently
+    independent = generate_data(
+        {
+            "password": {"length": 10, "permutate": True},
+            "uuid": {"permutate": True},
+            "email": {},
+        },
+        num_records=40,
+        seed=11,
+    )
+    assert sorted(independent["UUID"]) == sorted(original["UUID"])
+    assert pairs(independent) != pairs(original)
+
+def test_generate_data_arrow_output(monkeypatch):
+    """Test that the arrow output contains the same data as the DataFrame"""
+    pa = pytest.importorskip("pyarrow")
+    monkeypatch.setattr(data_generator, "BLOCK_SIZE", 8)
+    selected_fields = {"full_name": {}, "password": {"length": 6}, "gender": {}}
+
+    df = generate_data(selected_fields, num_records=20, seed=2, compact_dtypes=True)
+    table = generate_data(
+        selected_fields, num_records=20, seed=2, compact_dtypes=True, output="arrow"
+    )
+
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 20
+    assert pa.types.is_dictionary(table.schema.field("Geschlecht").type)
+    pd.testing.assert_frame_equal(table.to_pandas(), df)
+
+    chunks = list(
+        generate_data_iter(selected_fields, num_records=20, chunk_size=6, seed=2, output="arrow")
+    )
+    assert [chunk.num_rows for chunk in chunks] == [6, 6, 6, 2]
+    assert pa.concat_tables(chunks).equals(
+        generate_data(selected_fields, num_records=20, seed=2, output="arrow")
+    )
+
+def test_generate_data_invalid_output():
+    """Test that unknown output formats are rejected"""
+    with pytest.raises(ValueError):
+        generate_data({"email": {}}, output="excel")
+
+def test_generate_data_profile(monkeypatch):
+    """Test that the profile hook measures every field of every block"""
+    monkeypatch.setattr(data_generator, "BLOCK_SIZE", 10)
+    selected_fields = {"email": {}, "gender": {}}
+
+    records = []
+    df = generate_data(selected_fields, num_records=25, seed=3, profile=records.append)
+
+    assert len(records) == 6
+    assert {record["block"] for record in records} == {0, 1, 2}
+    assert all(record["seconds"] >= 0 and record["bytes"] > 0 for record in records)
+    pd.testing.assert_frame_equal(df, generate_data(selected_fields, num_records=25, seed=3))
+
+    report = build_profile_report(records)
+    assert report["field"].tolist() == ["email", "gender"]
+    assert report["rows"].tolist() == [25, 25]
+    assert report["time_share"].sum() == pytest.approx(1.0)
+
+    parallel_records = []
+    generate_data(
+        selected_fields, num_records=25, seed=3, workers=2, profile=parallel_records.append
+    )
+    assert build_profile_report(parallel_records)["rows"].tolist() == [25, 25]
+
+def test_build_profile_report_empty():
+    """Test that an empty profile gives an empty report with all columns"""
+    report = build_profile_report([])
+    assert report.empty
+    assert "rows_per_second" in report.columns
+
+def test_generate_data_max_lengths():
+    """Test that fields with a known maximum length are described in attrs."""
+    selected_fields = {
+        "uuid": {},
+        "password": {"length": 20},
+        "email": {},
+        "username": {"with_numbers": False, "max_length": 9},
+    }
+    df = generate_data(selected_fields, num_records=50, seed=4)
+
+    assert df.attrs["max_lengths"] == {"UUID": 36, "Passwort": 20, "Benutzername": 9}
+    for column, max_length in df.attrs["max_lengths"].items():
+        assert df[column].str.len().max() <= max_length
+
+    chunks = list(generate_data_iter(selected_fields, num_records=50, chunk_size=20, seed=4))
+    assert all(chunk.attrs["max_lengths"] == df.attrs["max_lengths"] for chunk in chunks)
+    assert generate_data({"email": {}}, num_records=5).attrs == {}
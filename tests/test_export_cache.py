@@ -0,0 +1,80 @@
+import sys
+import pytest
+import pandas as pd
+from export_cache import (
+    cached_export, clear_export_cache, dataset_fingerprint, get_export_cache_size
+)
+from export_utils import export_to_bytes, export_to_csv, export_to_json, write_csv
+
+@pytest.fixture(autouse=True)
+def empty_export_cache():
+    """Start every test with an empty export cache."""
+    clear_export_cache()
+    yield
+    clear_export_cache()
+
+@pytest.fixture
+def sample_dataframe():
+    """Create a sample DataFrame for testing the export cache."""
+    return pd.DataFrame({
+        "Benutzername": ["user1", "user2", "user3"],
+        "Geschlecht": ["männlich", "weiblich", "divers"],
+    })
+
+def test_dataset_fingerprint(sample_dataframe):
+    """Test that the fingerprint changes with values, columns and dtypes only."""
+    fingerprint = dataset_fingerprint(sample_dataframe)
+
+    assert dataset_fingerprint(sample_dataframe.copy()) == fingerprint
+
+    changed = sample_dataframe.copy()
+    changed.loc[1, "Benutzername"] = "user9"
+    assert dataset_fingerprint(changed) != fingerprint
+    assert dataset_fingerprint(sample_dataframe.rename(columns={"Geschlecht": "Gender"})) != fingerprint
+    assert dataset_fingerprint(sample_dataframe.astype({"Geschlecht": "category"})) != fingerprint
+
+def test_cached_export_reuses_artifacts(sample_dataframe):
+    """Test that identical exports are served from the cache."""
+    calls = []
+
+    def counting_export(df, **options):
+        calls.append(options)
+        return export_to_csv(df)
+
+    first = cached_export(sample_dataframe, counting_export)
+    second = cached_export(sample_dataframe.copy(), counting_export)
+    assert first is second
+    assert len(calls) == 1
+
+    cached_export(sample_dataframe, counting_export, separator=";")
+    assert len(calls) == 2
+
+    csv_bytes = cached_export(sample_dataframe, export_to_bytes, writer=write_csv, compression=None)
+    assert csv_bytes.decode("utf-8") == export_to_csv(sample_dataframe)
+    assert get_export_cache_size()[0] == 3
+
+def test_cached_export_evicts_least_recently_used():
+    """Test that the cache stays within its byte budget."""
+    frames = [pd.DataFrame({"Wert": [f"{i}" * 1000]}) for i in range(3)]
+    artifact_size = sys.getsizeof(export_to_json(frames[0]))
+    max_bytes = 2 * artifact_size + artifact_size // 2
+
+    first = cached_export(frames[0], export_to_json, max_bytes=max_bytes)
+    second = cached_export(frames[1], export_to_json, max_bytes=max_bytes)
+    cached_export(frames[0], export_to_json, max_bytes=max_bytes)
+    cached_export(frames[2], export_to_json, max_bytes=max_bytes)
+
+    count, total_bytes = get_export_cache_size()
+    assert count == 2
+    assert total_bytes <= max_bytes
+
+    # frames[1] was evicted, frames[0] was used more recently
+    assert cached_export(frames[0], export_to_json, max_bytes=max_bytes) is first
+    assert cached_export(frames[1], export_to_json, max_bytes=max_bytes) is not second
+
+def test_cached_export_skips_large_artifacts(sample_dataframe):
+    """Test that artifacts above the budget are returned but not cached."""
+    result = cached_export(sample_dataframe, export_to_json, max_bytes=10)
+
+    assert result == export_to_json(sample_dataframe)
+    assert get_export_cache_size() == (0, 0)
@@ -2,9 +2,16 @@ import pytest
 import pandas as pd
 import json
 import re
+import numpy as np
+import gzip
+import io
+import itertools
+import sqlite3
 from export_utils import (
-    export_to_csv, export_to_json, export_to_sql,
-    sanitize_table_name, format_value_for_sql
+    export_to_csv, export_to_json, export_to_sql, export_to_tsv, write_csv,
+    export_to_parquet, export_to_arrow_ipc, export_to_ndjson, write_ndjson,
+    iter_sql_lines, write_sql, get_max_text_length, export_to_xlsx,
+    sanitize_table_name, format_value_for_sql, format_sql_rows, rebatch_frames
 )
 
 @pytest.fixture
@@ -116,4 +123,387 @@ def test_export_to_sql_numeric_data():
     assert "2.0" in sql_output
     assert "20.7" in sql_output
     assert "3.0" in sql_output
-    assert "30.9" in sql_output
\ No newline at end of file
+    assert "30.9" in sql_output
+
+def _split_chunks(df, chunk_size):
+    """Split a DataFrame into chunks like generate_data_iter does."""
+    return [df.iloc[i:i + chunk_size] for i in range(0, len(df), chunk_size)]
+
+def _without_timestamp(sql_output):
+    """Remove the generation timestamp line from a SQL script."""
+    return [line for line in sql_output.split("\n") if not line.startswith("-- Generiert am")]
+
+def test_exports_accept_chunks():
+    """Test that all exporters produce the same output for chunks and a DataFrame."""
+    df = pd.DataFrame({
+        "Name": [f"user{i}" for i in range(250)],
+        "Wert": [i * 1.5 for i in range(250)],
+    })
+    chunks = _split_chunks(df, 37)
+
+    assert export_to_csv(iter(chunks)) == export_to_csv(df)
+    assert export_to_json(iter(chunks)) == export_to_json(df)
+    assert _without_timestamp(export_to_sql(iter(chunks))) == _without_timestamp(export_to_sql(df))
+
+def test_exports_accept_empty_chunk_iterable():
+    """Test exporters with an iterable that yields no chunks."""
+    assert export_to_csv(iter([])) == ""
+    assert export_to_json(iter([])) == "[]"
+    assert "CREATE TABLE IF NOT EXISTS testdaten" in export_to_sql(iter([]))
+
+def test_rebatch_frames():
+    """Test regrouping of chunks into fixed size batches."""
+    df = pd.DataFrame({"a": range(23)})
+    batches = list(rebatch_frames(_split_chunks(df, 6), 10))
+
+    assert [len(batch) for batch in batches] == [10, 10, 3]
+    assert pd.concat(batches)["a"].tolist() == list(range(23))
+
+def test_exports_handle_categorical_columns():
+    """Test that categorical columns export like plain string columns."""
+    plain = pd.DataFrame({
+        "Geschlecht": ["männlich", "weiblich", "divers", "weiblich"],
+        "Land": ["Deutschland", "O'Land", "Deutschland", "Frankreich"],
+    })
+    compact = plain.astype("category")
+
+    assert export_to_csv(compact) == export_to_csv(plain)
+    assert export_to_json(compact) == export_to_json(plain)
+    assert _without_timestamp(export_to_sql(compact)) == _without_timestamp(export_to_sql(plain))
+
+def test_write_csv_streams_chunks():
+    """Test that write_csv writes chunks to a binary file like export_to_csv."""
+    df = pd.DataFrame({
+        "Name": [f"Müller {i}" for i in range(120)],
+        "Wert": [i * 0.5 for i in range(120)],
+    })
+
+    buffer = io.BytesIO()
+    rows = write_csv(iter(_split_chunks(df, 25)), buffer)
+
+    assert rows == 120
+    assert not buffer.closed
+    assert buffer.getvalue().decode("utf-8") == export_to_csv(df) == df.to_csv(index=False)
+
+def test_write_csv_compression(sample_dataframe):
+    """Test gzip and zstd compressed CSV output."""
+    buffer = io.BytesIO()
+    write_csv(sample_dataframe, buffer, compression="gzip")
+    assert gzip.decompress(buffer.getvalue()).decode("utf-8") == export_to_csv(sample_dataframe)
+
+    with pytest.raises(ValueError):
+        write_csv(sample_dataframe, io.BytesIO(), compression="bz2")
+
+    zstandard = pytest.importorskip("zstandard")
+    buffer = io.BytesIO()
+    write_csv(sample_dataframe, buffer, compression="zstd")
+    decompressed = zstandard.ZstdDecompressor().decompressobj().decompress(buffer.getvalue())
+    assert decompressed.decode("utf-8") == export_to_csv(sample_dataframe)
+
+@pytest.mark.parametrize("df", [
+    pd.DataFrame({"Name": ["O'Brien", "a;b", None, "Müller"], "Wert": [1, 2, 3, 4]}),
+    pd.DataFrame({"Anzahl": [1, -2, 3]}),
+    pd.DataFrame({"Anzahl": [1, 2, 3], "Preis": [1.5, np.nan, 1e20]}),
+    pd.DataFrame({"Aktiv": [True, False, True], "Name": ["a", "b", "c"]}),
+    pd.DataFrame({"Datum": pd.to_datetime(["2020-01-01", "2021-06-30", None])}),
+    pd.DataFrame({"Gemischt": [1, "a", 2.5, None, True]}),
+    pd.DataFrame({"Land": pd.Categorical(["DE", "FR", "DE"])}),
+])
+def test_format_sql_rows_matches_row_wise_formatting(df):
+    """Test that the column-wise formatting equals formatting every cell of iterrows."""
+    expected = [
+        f"({', '.join(format_value_for_sql(row[col]) for col in df.columns)})"
+        for _, row in df.iterrows()
+    ]
+    assert format_sql_rows(df) == expected
+
+def test_export_to_sql_batch_size():
+    """Test the number of rows per INSERT statement."""
+    df = pd.DataFrame({"a": range(25)})
+
+    sql_output = export_to_sql(df, batch_size=10)
+    assert sql_output.count("INSERT INTO") == 3
+    assert _without_timestamp(export_to_sql(iter(_split_chunks(df, 7)), batch_size=10)) == _without_timestamp(sql_output)
+
+    with pytest.raises(ValueError):
+        export_to_sql(df, batch_size=0)
+
+@pytest.fixture
+def special_dataframe():
+    """Create a DataFrame with values that need escaping in bulk-load formats."""
+    return pd.DataFrame({
+        "Name": ["Tab\there", "Back\\slash", None, "Zeilen\numbruch", "O'Brien"],
+        "Anzahl": [1, 2, 3, 4, 5],
+        "Preis": [1.5, np.nan, 2.0, 3.25, 4.0],
+    })
+
+def test_export_to_sql_postgresql(special_dataframe):
+    """Test the COPY FROM STDIN block of the PostgreSQL dialect."""
+    sql_output = export_to_sql(special_dataframe, "test_table", dialect="postgresql")
+
+    assert "anzahl INTEGER" in sql_output
+    assert "INSERT INTO" not in sql_output
+
+    copy_block = sql_output.split("COPY test_table (name, anzahl, preis) FROM STDIN;\n")[1]
+    assert copy_block.split("\n") == [
+        "Tab\\there\t1\t1.5",
+        "Back\\\\slash\t2\t\\N",
+        "\\N\t3\t2.0",
+        "Zeilen\\numbruch\t4\t3.25",
+        "O'Brien\t5\t4.0",
+        "\\.",
+        "",
+    ]
+
+def test_export_to_sql_mysql(special_dataframe):
+    """Test the LOAD DATA script and the tab-separated data file of the MySQL dialect."""
+    sql_output = export_to_sql(
+        special_dataframe, "test_table", dialect="mysql", data_file_name="daten.tsv"
+    )
+
+    assert "LOAD DATA LOCAL INFILE 'daten.tsv'" in sql_output
+    assert "INTO TABLE test_table" in sql_output
+    assert "(name, anzahl, preis);" in sql_output
+    assert "INSERT INTO" not in sql_output
+
+    lines = export_to_tsv(special_dataframe).split("\n")
+    assert len(lines) == 6 and lines[-1] == ""
+    assert lines[2] == "\\N\t3\t2.0"
+    assert export_to_tsv(iter(_split_chunks(special_dataframe, 2))) == export_to_tsv(special_dataframe)
+
+def test_export_to_sql_sqlite(special_dataframe):
+    """Test that the SQLite script loads all rows in one transaction."""
+    df = pd.concat([special_dataframe] * 300, ignore_index=True)
+    sql_output = export_to_sql(df, "test_table", dialect="sqlite")
+
+    assert sql_output.count("BEGIN TRANSACTION;") == 1
+    assert sql_output.rstrip().endswith("COMMIT;")
+    assert sql_output.count("INSERT INTO") == 3
+
+    connection = sqlite3.connect(":memory:")
+    try:
+        connection.executescript(sql_output)
+        rows = connection.execute("SELECT name, anzahl FROM test_table").fetchall()
+    finally:
+        connection.close()
+
+    assert len(rows) == 1500
+    assert rows[0] == ("Tab\there", 1)
+    assert rows[4] == ("O'Brien", 5)
+
+def test_export_to_sql_invalid_dialect(sample_dataframe):
+    """Test that unknown dialects are rejected."""
+    with pytest.raises(ValueError):
+        export_to_sql(sample_dataframe, dialect="oracle")
+
+@pytest.fixture
+def chunked_categorical_dataframe():
+    """Create a DataFrame with a categorical column and chunks with differing categories."""
+    df = pd.DataFrame({
+        "Name": ["a", "b", None, "a", "c", "d", "b"],
+        "Anzahl": range(7),
+        "Land": pd.Categorical(["DE", "FR", "DE", "IT", None, "FR", "ES"]),
+    })
+    chunks = [
+        chunk.assign(Land=chunk["Land"].cat.remove_unused_categories())
+        for chunk in _split_chunks(df, 3)
+    ]
+    return df, chunks
+
+def test_export_to_parquet(chunked_categorical_dataframe):
+    """Test that chunks are streamed into row groups of one Parquet file."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    df, chunks = chunked_categorical_dataframe
+
+    parquet_file = pq.ParquetFile(io.BytesIO(export_to_parquet(iter(chunks))))
+    assert parquet_file.metadata.num_row_groups == 3
+
+    result = parquet_file.read().to_pandas()
+    assert result["Name"].tolist() == df["Name"].tolist()
+    assert result["Anzahl"].tolist() == list(range(7))
+    assert result["Land"].astype(object).where(result["Land"].notna(), None).tolist() == [
+        "DE", "FR", "DE", "IT", None, "FR", "ES"
+    ]
+
+    regrouped = pq.ParquetFile(io.BytesIO(export_to_parquet(df, compression="zstd", row_group_size=2)))
+    assert regrouped.metadata.num_row_groups == 4
+    assert regrouped.metadata.row_group(0).column(0).compression == "ZSTD"
+
+    with pytest.raises(ValueError):
+        export_to_parquet(df, compression="rar")
+
+@pytest.mark.parametrize("dictionary_encode", [False, True])
+def test_export_to_arrow_ipc(chunked_categorical_dataframe, dictionary_encode):
+    """Test that chunks are streamed into record batches of one Arrow IPC file."""
+    pa = pytest.importorskip("pyarrow")
+    df, chunks = chunked_categorical_dataframe
+
+    ipc_data = export_to_arrow_ipc(iter(chunks), compression="lz4", dictionary_encode=dictionary_encode)
+    reader = pa.ipc.open_file(io.BytesIO(ipc_data))
+    assert reader.num_record_batches == 3
+    assert pa.types.is_dictionary(reader.schema.field("Land").type)
+    assert pa.types.is_dictionary(reader.schema.field("Name").type) == dictionary_encode
+
+    table = reader.read_all()
+    assert table.column("Name").to_pylist() == ["a", "b", None, "a", "c", "d", "b"]
+    assert table.column("Land").to_pylist() == ["DE", "FR", "DE", "IT", None, "FR", "ES"]
+
+def test_export_to_arrow_ipc_dictionary_growth():
+    """Test growing dictionaries across batches and unencoded high-cardinality strings."""
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "Schluessel": [f"key-{i // 3}" for i in range(3000)],
+        "Kennung": [f"id-{i}" for i in range(3000)],
+    })
+
+    ipc_data = export_to_arrow_ipc(_split_chunks(df, 1000), dictionary_encode=True)
+    reader = pa.ipc.open_file(io.BytesIO(ipc_data))
+    assert pa.types.is_dictionary(reader.schema.field("Schluessel").type)
+    assert pa.types.is_string(reader.schema.field("Kennung").type)
+
+    table = reader.read_all()
+    assert table.column("Schluessel").to_pylist() == df["Schluessel"].tolist()
+    assert table.column("Kennung").to_pylist() == df["Kennung"].tolist()
+
+@pytest.mark.parametrize("export", [export_to_parquet, export_to_arrow_ipc])
+def test_binary_exports_later_chunk_with_wider_dtype(export):
+    """Test that a later float chunk is cast to int64 if lossless, else named in the error."""
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    first = pd.DataFrame({"Anzahl": [1, 2]})
+
+    data = io.BytesIO(export([first, pd.DataFrame({"Anzahl": [3.0, np.nan]})]))
+    table = pq.read_table(data) if export is export_to_parquet else pa.ipc.open_file(data).read_all()
+    assert table.column("Anzahl").type == pa.int64()
+    assert table.column("Anzahl").to_pylist() == [1, 2, 3, None]
+
+    with pytest.raises(ValueError, match="'Anzahl'.*double.*int64"):
+        export([first, pd.DataFrame({"Anzahl": [3.5, 4.0]})])
+
+@pytest.mark.parametrize("export", [export_to_parquet, export_to_arrow_ipc])
+def test_binary_exports_first_chunk_with_null_column(export):
+    """Test that an all-null first chunk column gives an error naming the column."""
+    pytest.importorskip("pyarrow")
+    first = pd.DataFrame({"Name": [None, None], "Anzahl": [1, 2]})
+    later = pd.DataFrame({"Name": ["Max", None], "Anzahl": [3, 4]})
+
+    with pytest.raises(ValueError, match="'Name'.*string.*null"):
+        export([first, later])
+
+def test_binary_exports_accept_empty_chunk_iterable():
+    """Test Parquet and Arrow IPC exports without any chunk."""
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    assert pq.read_table(io.BytesIO(export_to_parquet(iter([])))).num_rows == 0
+    assert pa.ipc.open_file(io.BytesIO(export_to_arrow_ipc(iter([])))).num_record_batches == 0
+
+def test_export_to_xlsx(monkeypatch, chunked_categorical_dataframe):
+    """Test that chunks are streamed into one Excel sheet with a single header."""
+    openpyxl = pytest.importorskip("openpyxl")
+    # Convert the rows of a chunk in slices smaller than the chunk
+    monkeypatch.setattr("export_utils.XLSX_CONVERT_ROWS", 2)
+    df, chunks = chunked_categorical_dataframe
+
+    workbook = openpyxl.load_workbook(io.BytesIO(export_to_xlsx(iter(chunks))))
+    assert workbook.sheetnames == ["Daten"]
+    assert list(workbook["Daten"].values) == [
+        ("Name", "Anzahl", "Land"),
+        ("a", 0, "DE"), ("b", 1, "FR"), (None, 2, "DE"), ("a", 3, "IT"),
+        ("c", 4, None), ("d", 5, "FR"), ("b", 6, "ES"),
+    ]
+
+    result = pd.read_excel(io.BytesIO(export_to_xlsx(df)))
+    assert result["Anzahl"].tolist() == list(range(7))
+
+def test_export_to_xlsx_splits_sheets(monkeypatch, sample_dataframe):
+    """Test that a full sheet is continued on a new sheet with the header."""
+    openpyxl = pytest.importorskip("openpyxl")
+    monkeypatch.setattr("export_utils.XLSX_MAX_ROWS", 3)
+
+    workbook = openpyxl.load_workbook(io.BytesIO(export_to_xlsx(sample_dataframe)))
+    assert workbook.sheetnames == ["Daten", "Daten 2"]
+    assert [row[0] for row in workbook["Daten"].values] == ["Benutzername", "user1", "user2"]
+    assert [row[0] for row in workbook["Daten 2"].values] == ["Benutzername", "user3"]
+
+    empty = openpyxl.load_workbook(io.BytesIO(export_to_xlsx(iter([]))))
+    assert empty.sheetnames == ["Daten"]
+
+def test_export_to_ndjson(sample_dataframe):
+    """Test that every line of the JSON Lines export is one compact record."""
+    ndjson_output = export_to_ndjson(sample_dataframe)
+
+    lines = ndjson_output.split("\n")
+    assert lines[-1] == ""
+    records = [json.loads(line) for line in lines[:-1]]
+    assert records == json.loads(export_to_json(sample_dataframe))
+    assert " " not in lines[0]
+
+    chunks = iter(_split_chunks(sample_dataframe, 2) + [sample_dataframe.iloc[:0]])
+    assert export_to_ndjson(chunks) == ndjson_output
+    assert export_to_ndjson(iter([])) == ""
+
+def test_write_ndjson_compression(sample_dataframe):
+    """Test gzip compressed JSON Lines output."""
+    buffer = io.BytesIO()
+    assert write_ndjson(sample_dataframe, buffer, compression="gzip") == 3
+    assert gzip.decompress(buffer.getvalue()).decode("utf-8") == export_to_ndjson(sample_dataframe)
+
+@pytest.mark.parametrize("dialect", ["generic", "postgresql", "mysql", "sqlite"])
+def test_iter_sql_lines_matches_export_to_sql(special_dataframe, dialect):
+    """Test that the SQL lines join to the exported script."""
+    lines = list(iter_sql_lines(special_dataframe, "test_table", batch_size=2, dialect=dialect))
+
+    assert all(line.endswith("\n") for line in lines)
+    assert _without_timestamp("".join(lines)) == _without_timestamp(
+        export_to_sql(special_dataframe, "test_table", batch_size=2, dialect=dialect)
+    )
+
+def test_iter_sql_lines_is_lazy():
+    """Test that taking the first lines does not consume all chunks."""
+    consumed = []
+
+    def chunks():
+        for index in range(1000):
+            consumed.append(index)
+            yield pd.DataFrame({"a": range(index * 100, index * 100 + 100)})
+
+    preview = list(itertools.islice(iter_sql_lines(chunks()), 20))
+
+    assert len(preview) == 20
+    assert len(consumed) < 1000
+
+    with pytest.raises(ValueError):
+        iter_sql_lines(chunks(), dialect="oracle")
+
+def test_write_sql(sample_dataframe):
+    """Test that write_sql writes the script of export_to_sql."""
+    buffer = io.BytesIO()
+    write_sql(sample_dataframe, buffer, table_name="test_table", compression="gzip")
+
+    sql_output = gzip.decompress(buffer.getvalue()).decode("utf-8")
+    assert _without_timestamp(sql_output) == _without_timestamp(export_to_sql(sample_dataframe, "test_table"))
+
+@pytest.mark.parametrize("column", [
+    pd.Series(["a" * 300, "b", "c"]),
+    pd.Series(["a", None, np.nan]),
+    pd.Series([1, "x" * 260, 2.5]),
+    pd.Series(pd.Categorical(["x" * 300, None])),
+    pd.Series(pd.Categorical(["a"], categories=["a", "z" * 400])),
+    pd.Series(pd.array(["q" * 280, None], dtype="string")),
+    pd.Series(pd.to_datetime(["2020-01-01", None])),
+])
+def test_get_max_text_length_matches_text_copy(column):
+    """Test that the single-pass length equals the length of the text copy."""
+    assert get_max_text_length(column) == column.astype(str).str.len().max()
+
+def test_export_to_sql_uses_known_max_lengths():
+    """Test that VARCHAR lengths come from df.attrs without measuring."""
+    df = pd.DataFrame({"Passwort": ["abc", "defg"], "Notiz": ["x" * 300, "y"]})
+    assert "passwort VARCHAR(255)" in export_to_sql(df)
+    assert "notiz VARCHAR(300)" in export_to_sql(df)
+
+    df.attrs["max_lengths"] = {"Passwort": 400}
+    sql_output = export_to_sql(df)
+    assert "passwort VARCHAR(400)" in sql_output
+    assert "notiz VARCHAR(300)" in sql_output
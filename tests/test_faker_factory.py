@@ -0,0 +1,58 @@
+import pytest
+from faker import Faker
+import faker_factory
+from faker_factory import borrow_faker, clear_faker_cache
+
+@pytest.fixture(autouse=True)
+def empty_faker_cache():
+    """Start every test with an empty Faker cache."""
+    clear_faker_cache()
+    yield
+    clear_faker_cache()
+
+def test_borrow_faker_reuses_instances():
+    """Test that a returned instance is handed out again."""
+    with borrow_faker("de_DE") as fake:
+        first = fake
+        assert fake.locales == ["de_DE"]
+
+    with borrow_faker("de_DE") as fake:
+        assert fake is first
+
+    with borrow_faker("en_US") as fake:
+        assert fake is not first
+
+def test_borrow_faker_is_exclusive():
+    """Test that nested borrows for the same locale get different instances."""
+    with borrow_faker("de_DE") as outer:
+        with borrow_faker("de_DE") as inner:
+            assert inner is not outer
+
+def test_borrow_faker_seed_is_isolated():
+    """Test that seeding a borrowed instance does not leak to the next caller."""
+    with borrow_faker("de_DE", seed=42) as fake:
+        seeded_names = [fake.name() for _ in range(3)]
+
+    with borrow_faker("de_DE", seed=42) as fake:
+        assert [fake.name() for _ in range(3)] == seeded_names
+
+    # Without a seed the instance uses the shared random state again
+    Faker.seed(1)
+    with borrow_faker("de_DE") as fake:
+        first_run = [fake.name() for _ in range(3)]
+    Faker.seed(1)
+    with borrow_faker("de_DE") as fake:
+        second_run = [fake.name() for _ in range(3)]
+
+    assert first_run == second_run
+    Faker.seed(None)
+
+def test_borrow_faker_evicts_least_recently_used_locale(monkeypatch):
+    """Test the LRU eviction of cached locales."""
+    monkeypatch.setattr(faker_factory, "MAX_CACHED_LOCALES", 2)
+
+    for locale in ["de_DE", "en_US", "fr_FR"]:
+        with borrow_faker(locale):
+            pass
+
+    assert list(faker_factory._idle_fakers) == ["en_US", "fr_FR"]
@@ -1,11 +1,16 @@
 import pytest
 from faker import Faker
+import numpy as np
 import string
 import random
+import uuid
+from datetime import date
 from field_definitions import (
     generate_username, generate_password, generate_full_name,
     generate_street_address, generate_credit_card, generate_date_of_birth,
-    generate_phone_number, field_definitions
+    generate_phone_number, generate_username_batch, generate_password_batch,
+    generate_date_of_birth_batch, generate_uuid_batch, generate_gender_batch,
+    generate_state_batch, GERMAN_STATES, field_definitions
 )
 
 @pytest.fixture
@@ -13,6 +18,11 @@ def fake():
     """Create a Faker instance for testing."""
     return Faker('de_DE')
 
+@pytest.fixture
+def rng():
+    """Create a seeded NumPy random generator for batch generators."""
+    return np.random.default_rng(42)
+
 @pytest.fixture
 def set_seed():
     """Set random seed for reproducible testing."""
@@ -154,4 +164,98 @@ def test_field_definitions_structure():
         assert "params" in field_def
         
         # Check that params include permutate option
-        assert "permutate" in field_def["params"]
\ No newline at end of file
+        assert "permutate" in field_def["params"]
+
+def test_generate_username_batch(fake, rng):
+    """Test batch username generation."""
+    usernames = generate_username_batch(fake, {"with_numbers": True}, 5, rng)
+    assert len(usernames) == 5
+    assert all(isinstance(name, str) for name in usernames)
+
+    config = {"min_length": 4, "max_length": 8, "with_numbers": False}
+    usernames = generate_username_batch(fake, config, 200, rng)
+    assert len(usernames) == 200
+    assert all(4 <= len(name) <= 8 for name in usernames)
+    assert all(name.isalpha() and name.islower() for name in usernames)
+
+def test_generate_password_batch(fake, rng):
+    """Test batch password generation."""
+    config = {"length": 10, "include_special": False, "include_digits": False}
+    passwords = generate_password_batch(fake, config, 100, rng)
+    assert len(passwords) == 100
+    assert all(len(password) == 10 for password in passwords)
+    assert all(password.isalpha() for password in passwords)
+
+    config = {"length": 16, "include_special": True, "include_digits": True}
+    passwords = generate_password_batch(fake, config, 100, rng)
+    allowed = set(string.ascii_letters + string.digits + string.punctuation)
+    assert all(len(password) == 16 for password in passwords)
+    assert all(set(password) <= allowed for password in passwords)
+
+def test_generate_date_of_birth_batch(fake, rng):
+    """Test batch date of birth generation."""
+    config = {"min_age": 25, "max_age": 35}
+    dates = generate_date_of_birth_batch(fake, config, 500, rng)
+    assert len(dates) == 500
+
+    today = date.today()
+    for value in dates:
+        dob = date.fromisoformat(str(value))
+        age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
+        assert 25 <= age <= 35
+
+    with pytest.raises(ValueError):
+        generate_date_of_birth_batch(fake, {"min_age": 50, "max_age": 20}, 1, rng)
+
+def test_generate_uuid_batch(fake, rng):
+    """Test batch UUID generation."""
+    uuids = generate_uuid_batch(fake, {}, 100, rng)
+    assert len(uuids) == 100
+    for value in uuids:
+        parsed = uuid.UUID(str(value))
+        assert parsed.version == 4
+        assert str(parsed) == value
+    assert len(set(uuids)) == 100
+
+def test_generate_gender_and_state_batch(fake, rng):
+    """Test batch generation of locale dependent fields."""
+    genders = generate_gender_batch(fake, {}, 50, rng)
+    assert set(genders) <= {"männlich", "weiblich", "divers"}
+    genders = generate_gender_batch(Faker("en_US"), {}, 50, rng)
+    assert set(genders) <= {"male", "female", "other"}
+
+    states = generate_state_batch(fake, {}, 50, rng)
+    assert set(states) <= set(GERMAN_STATES)
+    states = generate_state_batch(Faker("fr_FR"), {}, 3, rng)
+    assert list(states) == ["Region 1", "Region 2", "Region 3"]
+    states = generate_state_batch(Faker("fr_FR"), {}, 2, rng, start=10)
+    assert list(states) == ["Region 11", "Region 12"]
+
+def test_batch_generators_are_reproducible(fake):
+    """Test that batch generators only depend on the passed random generator."""
+    for field_def in field_definitions.values():
+        batch_function = field_def.get("batch_generator")
+        if batch_function is None or batch_function is generate_username_batch:
+            continue
+        first = batch_function(fake, {}, 20, np.random.default_rng(7))
+        second = batch_function(fake, {}, 20, np.random.default_rng(7))
+        assert list(first) == list(second)
+
+@pytest.mark.parametrize("locale", ["de_DE", "en_US", "ja_JP"])
+def test_max_lengths_hold_for_generated_values(locale):
+    """Test that generated values never exceed the max_length of their field."""
+    from data_generator import generate_data, get_max_lengths
+
+    selected_fields = {
+        field_name: {}
+        for field_name, field_def in field_definitions.items()
+        if "max_length" in field_def
+    }
+    selected_fields["username"] = {"with_numbers": False}
+
+    df = generate_data(selected_fields, num_records=200, locale=locale, seed=5)
+    max_lengths = get_max_lengths(selected_fields)
+
+    assert set(max_lengths) == set(df.columns)
+    for column, max_length in max_lengths.items():
+        assert df[column].str.len().max() <= max_length
@@ -1,10 +1,25 @@
+import copy
+import hashlib
+import hmac
+import io
+import numpy as np
 import pandas as pd
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from faker import Faker
 from pseudonymize_utils import (
     pseudonymize_data,
+    pseudonymize_file,
     hash_value,
+    hash_series,
+    hmac_series,
+    hmac_value,
+    get_hmac_secret,
+    consistent_replace_series,
+    replacement_mapping_to_json,
+    replacement_mapping_from_json,
     mask_value,
+    mask_series,
     determine_faker_method,
     generate_fake_data,
     is_numeric_column,
@@ -636,4 +651,325 @@ def test_error_handling_in_pseudonymize_functions():
     # If it returns an empty string, great. If not, it should be a valid non-empty string
     if empty_string_result != "":
         assert isinstance(empty_string_result, str)
-        assert len(empty_string_result) > 0
\ No newline at end of file
+        assert len(empty_string_result) > 0
+
+@pytest.mark.parametrize("series", [
+    pd.Series(["a", 1, 1.0, True, None, "1", "a"]),
+    pd.Series([0.0, -0.0, 1.5, None, 1e20, 1.5]),
+    pd.Series(np.float32([1.5, 2.5, 0.1, 1.5, np.nan])),
+    pd.Series(np.float16([1.5, 2.5, 0.1])),
+    pd.Series(pd.to_datetime(["2020-01-01", None, "2020-01-01"])),
+    pd.Series(pd.array([1, None, 1], dtype="Int64")),
+    pd.Series(pd.Categorical(["x", None, "y", "x"])),
+])
+def test_hash_series_matches_hash_value(series):
+    """Test that hashing distinct values once gives the per-cell result."""
+    expected = [hash_value(x) if pd.notna(x) else None for x in series]
+    result = hash_series(series)
+
+    assert result.index.equals(series.index)
+    assert [x if pd.notna(x) else None for x in result] == expected
+
+
+def test_hash_series_with_workers(monkeypatch):
+    """Test that hashing on a thread pool gives the same result."""
+    monkeypatch.setattr("pseudonymize_utils.PARALLEL_MIN_VALUES", 2)
+    series = pd.Series([f"value {i % 7}" for i in range(50)])
+
+    assert hash_series(series, workers=3).equals(hash_series(series))
+
+    df = pd.DataFrame({"name": series})
+    result = pseudonymize_data(df, {"name": "hash"}, {"hash": {"workers": 3}})
+    assert result["name"].tolist() == [hash_value(x) for x in series]
+
+
+def test_hmac_series():
+    """Test keyed hashing, truncation and that missing values are kept."""
+    series = pd.Series(["Max", None, "Max", 42])
+    expected = hmac.new(b"geheim", b"Max", hashlib.sha256).hexdigest()
+
+    result = hmac_series(series, "geheim")
+    assert result[0] == result[2] == expected == hmac_value("Max", b"geheim")
+    assert pd.isna(result[1])
+    assert result[3] == hmac.new(b"geheim", b"42", hashlib.sha256).hexdigest()
+
+    assert hmac_series(series, "anders")[0] != expected
+    assert hmac_series(series, "geheim", length=16)[0] == expected[:16]
+    with pytest.raises(ValueError):
+        hmac_series(series, "geheim", length=0)
+
+
+def test_pseudonymize_data_hmac_secret(monkeypatch, sample_data):
+    """Test that the hmac secret comes from the config or the environment."""
+    monkeypatch.delenv("PSEUDONYMIZATION_SECRET", raising=False)
+    with pytest.raises(ValueError):
+        pseudonymize_data(sample_data, {"name": "hmac"})
+
+    configured = pseudonymize_data(
+        sample_data, {"name": "hmac"}, {"hmac": {"secret": "geheim", "length": 20}}
+    )
+    assert configured["name"].tolist() == [
+        hmac.new(b"geheim", name.encode(), hashlib.sha256).hexdigest()[:20]
+        for name in sample_data["name"]
+    ]
+
+    monkeypatch.setenv("PSEUDONYMIZATION_SECRET", "geheim")
+    assert get_hmac_secret() == b"geheim"
+    from_env = pseudonymize_data(sample_data, {"name": "hmac"}, {"hmac": {"length": 20}})
+    assert from_env["name"].equals(configured["name"])
+
+
+def test_pseudonymize_data_consistent_replace():
+    """Test that equal values get the same fake value in every run."""
+    df = pd.DataFrame({"name": ["Max Muster", "Eva Klein", "Max Muster", None]})
+    config = {"replace": {"consistent": True, "secret": "geheim"}}
+
+    result = pseudonymize_data(df, {"name": "replace"}, config)
+    assert result["name"][0] == result["name"][2] != "Max Muster"
+    assert result["name"][1] != result["name"][0]
+    assert pd.isna(result["name"][3])
+
+    # Another file with the same secret maps the values identically
+    other = pd.DataFrame({"kunde_name": ["Eva Klein", "Max Muster"]})
+    other_result = pseudonymize_data(other, {"kunde_name": "replace"}, config)
+    assert other_result["kunde_name"].tolist() == [result["name"][1], result["name"][0]]
+
+    other_secret = {"replace": {"consistent": True, "secret": "anders"}}
+    assert not pseudonymize_data(df, {"name": "replace"}, other_secret)["name"].equals(result["name"])
+
+
+def test_consistent_replace_mapping_roundtrip():
+    """Test that a saved mapping table is reused instead of generating values."""
+    fake = Faker("de_DE")
+    series = pd.Series(["Max Muster", "Eva Klein", "Max Muster"])
+    mapping = {}
+
+    result = consistent_replace_series(series, fake, "name", "geheim", mapping=mapping)
+    assert mapping == {("name", "de_DE", True): {"Max Muster": result[0], "Eva Klein": result[1]}}
+
+    loaded = replacement_mapping_from_json(replacement_mapping_to_json(mapping))
+    assert loaded == mapping
+    loaded[("name", "de_DE", True)]["Eva Klein"] = "Erika Mustermann"
+    reused = consistent_replace_series(series, fake, "name", "anderer Schlüssel", mapping=loaded)
+    assert reused.tolist() == [result[0], "Erika Mustermann", result[0]]
+
+    # Replacements made with other settings are kept apart
+    consistent_replace_series(series, fake, "name", "geheim", preserve_format=False, mapping=loaded)
+    consistent_replace_series(series, Faker("fr_FR"), "name", "geheim", mapping=loaded)
+    assert set(loaded) == {("name", "de_DE", True), ("name", "de_DE", False), ("name", "fr_FR", True)}
+    assert loaded[("name", "de_DE", True)]["Eva Klein"] == "Erika Mustermann"
+
+    with pytest.raises(ValueError):
+        replacement_mapping_from_json('[{"faker_method": "name", "replacements": {"Max": "Tom"}}]')
+    with pytest.raises(ValueError):
+        # A table without its settings
+        replacement_mapping_from_json('{"name": {"Max": "Tom"}}')
+
+
+def test_pseudonymize_file_matches_pseudonymize_data(tmp_path):
+    """Test that chunked file pseudonymization equals the in-memory result."""
+    df = pd.DataFrame({
+        "name": ["Max Muster", "Eva Klein", "Max Muster", None, "Eva Klein"],
+        "email": ["max@example.com", "eva@example.com", "max@example.com", "x@y.de", None],
+        "betrag": [10, 20, 30, 40, 50],
+    })
+    src = tmp_path / "daten.csv"
+    df.to_csv(src, sep=";", index=False)
+
+    columns = {"name": "replace", "email": "hmac", "betrag": "offset"}
+    methods = {"replace": {"consistent": True, "secret": "geheim"}, "hmac": {"secret": "geheim"}}
+
+    dst = tmp_path / "pseudonymisiert.csv"
+    rows = pseudonymize_file(src, dst, columns, methods, chunksize=2, sep=";")
+    assert rows == 5
+    assert "mapping" not in methods["replace"]  # caller's configuration is unchanged
+
+    expected = pseudonymize_data(pd.read_csv(src, sep=";"), columns, methods)
+    pd.testing.assert_frame_equal(pd.read_csv(dst), expected)
+
+
+def test_pseudonymize_file_ignores_chunk_dtypes(tmp_path):
+    """Test that a blank in a later chunk does not change the pseudonyms of numbers."""
+    src = tmp_path / "daten.csv"
+    src.write_text("id,name\n0,Max\n1,Eva\n2,Tom\n0,Max\n,Eva\n")
+    columns = {"id": "hash", "name": "hash"}
+
+    results = []
+    for chunksize in (3, 100):
+        dst = tmp_path / f"pseudonymisiert_{chunksize}.csv"
+        pseudonymize_file(src, dst, columns, chunksize=chunksize)
+        results.append(pd.read_csv(dst, dtype=str))
+
+    pd.testing.assert_frame_equal(results[0], results[1])
+    assert results[0]["id"].tolist()[:4] == [hash_value(i) for i in ["0", "1", "2", "0"]]
+    assert pd.isna(results[0]["id"][4])
+
+
+def test_pseudonymize_file_shares_mapping_across_chunks():
+    """Test that a given mapping table is used and extended by all chunks."""
+    src = io.StringIO("name\nMax Muster\nEva Klein\nMax Muster\n")
+    dst = io.BytesIO()
+    mapping = {("name", "de_DE", True): {"Max Muster": "Erika Mustermann"}}
+
+    pseudonymize_file(
+        src, dst, {"name": "replace"},
+        {"replace": {"consistent": True, "secret": "geheim", "mapping": mapping}},
+        chunksize=1,
+    )
+
+    result = pd.read_csv(io.BytesIO(dst.getvalue()))
+    eva = mapping[("name", "de_DE", True)]["Eva Klein"]
+    assert result["name"].tolist() == ["Erika Mustermann", eva, "Erika Mustermann"]
+
+
+def test_pseudonymize_data_workers_match_serial(monkeypatch):
+    """Test that the process pool gives the serial result for a fixed seed and key."""
+    monkeypatch.setattr("pseudonymize_utils.PARALLEL_ROWS_PER_TASK", 4)
+    df = pd.DataFrame({
+        "name": ["Max Muster", "Eva Klein", None, "Max Muster", "Eva Klein"] * 2,
+        "email": ["max@example.com", None, "eva@example.com", "x@y.de", "max@example.com"] * 2,
+        "mixed": [1, "1", 1.0, True, None] * 2,
+        "betrag": range(10),
+        "datum": pd.date_range("2020-01-01", periods=10),
+        "land": pd.Categorical(["DE", "FR"] * 5),
+    })
+    columns = {
+        "name": "replace", "email": "hmac", "mixed": "hash",
+        "betrag": "offset", "datum": "offset", "land": "mask",
+    }
+    methods = {"hmac": {"secret": "geheim"}}
+
+    serial = pseudonymize_data(df, columns, methods, seed=42)
+    parallel = pseudonymize_data(df, columns, methods, seed=42, workers=2)
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert parallel.equals(pseudonymize_data(df, columns, methods, seed=42, workers=3))
+
+
+def test_pseudonymize_data_workers_collect_mapping(monkeypatch):
+    """Test that replacements made in worker processes end up in the mapping table."""
+    monkeypatch.setattr("pseudonymize_utils.PARALLEL_ROWS_PER_TASK", 2)
+    df = pd.DataFrame({"name": ["Max Muster", "Eva Klein", "Max Muster", "Tom Maier"]})
+    serial_mapping = {}
+    parallel_mapping = {}
+
+    serial = pseudonymize_data(
+        df, {"name": "replace"},
+        {"replace": {"consistent": True, "secret": "geheim", "mapping": serial_mapping}},
+    )
+    parallel = pseudonymize_data(
+        df, {"name": "replace"},
+        {"replace": {"consistent": True, "secret": "geheim", "mapping": parallel_mapping}},
+        workers=2,
+    )
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert parallel_mapping == serial_mapping
+    assert len(parallel_mapping[("name", "de_DE", True)]) == 3
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool standing in for a process pool, records its tasks and results."""
+
+    instances = 0
+
+    def __init__(self, max_workers=None):
+        super().__init__(max_workers=max_workers)
+        RecordingExecutor.instances += 1
+        self.tasks = []
+
+    def submit(self, function, *args):
+        # Copy the arguments like pickling for a worker process would
+        args = copy.deepcopy(args)
+        future = super().submit(function, *copy.deepcopy(args))
+        self.tasks.append((args, future))
+        return future
+
+
+def test_pseudonymize_data_workers_exchange_only_needed_mapping_entries(monkeypatch):
+    """Test that a task only gets the mapping entries of its values and returns new ones."""
+    monkeypatch.setattr("pseudonymize_utils.PARALLEL_ROWS_PER_TASK", 1)
+    df = pd.DataFrame({"name": ["Max Muster", "Eva Klein"]})
+    table_key = ("name", "de_DE", True)
+    mapping = {table_key: {"Max Muster": "Erika Mustermann", "Anna Alt": "Berta Neu"}}
+
+    with RecordingExecutor(max_workers=2) as executor:
+        result = pseudonymize_data(
+            df, {"name": "replace"},
+            {"replace": {"consistent": True, "secret": "geheim", "mapping": mapping}},
+            workers=2, executor=executor,
+        )
+        # A given executor is left running
+        assert executor.submit(len, "abc").result() == 3
+
+    sent = [args[3]["replace"]["mapping"] for args, _ in executor.tasks[:2]]
+    assert sent == [{table_key: {"Max Muster": "Erika Mustermann"}}, {table_key: {}}]
+    returned = [future.result()[1] for _, future in executor.tasks[:2]]
+    assert returned == [{}, {"Eva Klein": result["name"][1]}]
+    assert mapping[table_key]["Eva Klein"] == result["name"][1]
+
+
+def test_pseudonymize_file_workers_share_one_pool(monkeypatch):
+    """Test that all chunks of a file are pseudonymized on the same pool."""
+    monkeypatch.setattr("pseudonymize_utils.ProcessPoolExecutor", RecordingExecutor)
+    monkeypatch.setattr(RecordingExecutor, "instances", 0)
+    src = io.StringIO("name\nMax Muster\nEva Klein\nMax Muster\n")
+    dst = io.BytesIO()
+
+    rows = pseudonymize_file(src, dst, {"name": "hash"}, chunksize=1, workers=2)
+
+    assert rows == 3
+    assert RecordingExecutor.instances == 1
+    result = pd.read_csv(io.BytesIO(dst.getvalue()))
+    assert result["name"].tolist() == [hash_value(name) for name in ["Max Muster", "Eva Klein", "Max Muster"]]
+
+
+@pytest.mark.parametrize("show_first,show_last,char", [(2, 2, "*"), (3, 0, "*"), (0, 3, "#"), (10, 10, "*")])
+@pytest.mark.parametrize("use_arrow", [True, False])
+def test_mask_series_matches_mask_value(monkeypatch, show_first, show_last, char, use_arrow):
+    """Test that vectorized masking equals mask_value per cell (incl. show_last=0)."""
+    if use_arrow:
+        pytest.importorskip("pyarrow")
+    else:
+        def no_pyarrow(*args):
+            raise ImportError("pyarrow")
+        monkeypatch.setattr("pseudonymize_utils._mask_texts_arrow", no_pyarrow)
+
+    series = pd.Series(
+        ["john.doe@example.com", "ab", "abcde", None, "äöüßxyz😀", "", "\ud800 surrogat", 12345, 1.5],
+        index=range(10, 19),
+        name="email",
+    )
+    expected = series.apply(lambda x: mask_value(x, show_first, show_last, char) if pd.notna(x) else x)
+
+    pd.testing.assert_series_equal(mask_series(series, show_first, show_last, char), expected)
+
+
+@pytest.mark.parametrize("show_first,show_last,char", [(2, 2, "*"), (0, 3, "#"), (3, 0, "*"), (1, 1, "xy")])
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]", "large_string[pyarrow]"])
+def test_mask_series_ascii_values(show_first, show_last, char, dtype):
+    """Test masking pure ASCII values, also Arrow-backed and sliced, against mask_value."""
+    pytest.importorskip("pyarrow")
+    values = ["max@example.com", "ab", None, "abcde", "", "x" * 40, "12345"]
+    full = pd.Series(["padding"] + values, dtype=dtype)
+    # A slice starts at an offset into the Arrow buffers
+    series = full.iloc[1:]
+    expected = [mask_value(x, show_first, show_last, char) if x is not None else x for x in values]
+
+    result = mask_series(series, show_first, show_last, char)
+
+    assert result.dtype == series.dtype
+    assert result.index.equals(series.index)
+    assert [None if pd.isna(x) else x for x in result] == expected
+
+def test_mask_series_keeps_dtype_specific_behavior():
+    """Test masking of categoricals, string dtype and missing values."""
+    categorical = pd.Series(pd.Categorical(["abcdef", "uvwxyz", None, "abcdef"]))
+    result = mask_series(categorical)
+    assert isinstance(result.dtype, pd.CategoricalDtype)
+    assert result.tolist()[:2] == ["ab**ef", "uv**yz"]
+    assert pd.isna(result[2])
+
+    strings = pd.Series(pd.array(["abcdefg", None], dtype="string"))
+    assert mask_series(strings, 1, 1, "#").tolist() == ["a#####g", pd.NA]
+
+    empty = pd.Series([], dtype=object)
+    assert mask_series(empty).empty
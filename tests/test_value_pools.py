@@ -0,0 +1,79 @@
+import pytest
+import numpy as np
+import pandas as pd
+from data_generator import generate_data
+from value_pools import (
+    get_value_pool, get_pool_probabilities, sample_value_pool, clear_value_pools
+)
+
+@pytest.fixture(autouse=True)
+def empty_pool_cache():
+    """Start every test with an empty pool cache."""
+    clear_value_pools()
+    yield
+    clear_value_pools()
+
+def test_get_value_pool_is_cached():
+    """Test that a pool is built once per locale, method and size."""
+    values, counts = get_value_pool("de_DE", "city", pool_size=500)
+
+    assert counts.sum() == 500
+    assert len(values) == len(set(values))
+    assert get_value_pool("de_DE", "city", pool_size=500)[0] is values
+    assert get_value_pool("en_US", "city", pool_size=500)[0] is not values
+
+def test_get_value_pool_is_deterministic():
+    """Test that rebuilding a pool gives the same values."""
+    first = get_value_pool("de_DE", "currency_code", pool_size=300)
+    clear_value_pools()
+    second = get_value_pool("de_DE", "currency_code", pool_size=300)
+
+    assert first[0].tolist() == second[0].tolist()
+    assert first[1].tolist() == second[1].tolist()
+
+def test_get_value_pool_invalid_method():
+    """Test that unknown Faker methods raise an AttributeError."""
+    with pytest.raises(AttributeError):
+        get_value_pool("de_DE", "no_such_method", pool_size=10)
+
+def test_get_pool_probabilities_with_weights():
+    """Test that weights change the distribution of the pool."""
+    values = np.array(["a", "b", "c"], dtype=object)
+    counts = np.array([2, 1, 1])
+
+    _, probabilities = get_pool_probabilities(values, counts)
+    assert probabilities.tolist() == [0.5, 0.25, 0.25]
+
+    weighted_values, probabilities = get_pool_probabilities(
+        values, counts, weights={"a": 0, "d": 2}
+    )
+    assert weighted_values.tolist() == ["a", "b", "c", "d"]
+    assert probabilities.tolist() == [0.0, 0.25, 0.25, 0.5]
+
+    with pytest.raises(ValueError):
+        get_pool_probabilities(values, counts, weights={"a": 0, "b": 0, "c": 0})
+
+def test_sample_value_pool():
+    """Test sampling from a pool."""
+    values, _ = get_value_pool("de_DE", "color_name", pool_size=200)
+    sample = sample_value_pool("de_DE", "color_name", 1000, np.random.default_rng(1), pool_size=200)
+
+    assert len(sample) == 1000
+    assert set(sample) <= set(values)
+
+    repeated = sample_value_pool("de_DE", "color_name", 1000, np.random.default_rng(1), pool_size=200)
+    assert sample.tolist() == repeated.tolist()
+
+def test_generate_data_uses_value_pools():
+    """Test that pooled fields in generate_data respect the pool configuration."""
+    selected_fields = {
+        "country": {"pool_size": 100, "pool_weights": {"Atlantis": 1000000}},
+        "company": {},
+    }
+    df = generate_data(selected_fields, num_records=200, seed=3)
+
+    assert len(df) == 200
+    assert (df["Land"] == "Atlantis").mean() > 0.9
+    assert df["Unternehmen"].notna().all()
+
+    pd.testing.assert_frame_equal(df, generate_data(selected_fields, num_records=200, seed=3))
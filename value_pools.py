@@ -0,0 +1,133 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from faker_factory import borrow_faker
+
+# Number of Faker calls used to build a value pool
+DEFAULT_POOL_SIZE = 10_000
+
+# Pools are built with a fixed seed so they are identical in every process
+POOL_SEED = 0
+
+# Cache of built pools, keyed by (locale, method, pool_size)
+_value_pools = {}
+_value_pools_lock = threading.Lock()
+
+
+def get_value_pool(locale, method, pool_size=DEFAULT_POOL_SIZE):
+    """
+    Get the value pool of a Faker method, building and caching it on first use.
+
+    The pool is built by calling the Faker method pool_size times. Values that
+    Faker returns more often get a higher count, so sampling by count keeps
+    the original distribution.
+
+    Args:
+        locale (str): Faker locale
+        method (str): Name of the Faker method (e.g. "city")
+        pool_size (int): Number of Faker calls used to build the pool
+
+    Returns:
+        tuple: (values, counts) as NumPy arrays with the unique pool values
+            and how often each of them was drawn
+
+    Raises:
+        AttributeError: If the Faker method does not exist for the locale
+    """
+    key = (locale, method, pool_size)
+
+    pool = _value_pools.get(key)
+    if pool is not None:
+        return pool
+
+    with _value_pools_lock:
+        # Another thread might have built the pool in the meantime
+        pool = _value_pools.get(key)
+        if pool is None:
+            with borrow_faker(locale, seed=POOL_SEED) as fake:
+                faker_method = getattr(fake, method)
+                samples = [faker_method() for _ in range(pool_size)]
+
+            values, counts = np.unique(np.asarray(samples, dtype=object), return_counts=True)
+            pool = (values, counts)
+            _value_pools[key] = pool
+
+    return pool
+
+
+def get_pool_probabilities(values, counts, weights=None):
+    """
+    Compute the sampling probabilities of the pool values.
+
+    Args:
+        values (numpy.ndarray): Unique pool values
+        counts (numpy.ndarray): Number of times each value was drawn
+        weights (dict, optional): Relative weight per value. The weight is
+            multiplied with the count of the value; values that are not in
+            the pool are added with a count of one. Unlisted values keep a
+            weight of 1.
+
+    Returns:
+        tuple: (values, probabilities) as NumPy arrays
+    """
+    counts = counts.astype(float)
+
+    if weights:
+        known_values = set(values.tolist())
+        missing = [value for value in weights if value not in known_values]
+        if missing:
+            values = np.concatenate([values, np.asarray(missing, dtype=object)])
+            counts = np.concatenate([counts, np.ones(len(missing))])
+
+        counts = counts * np.array([weights.get(value, 1.0) for value in values.tolist()])
+
+    total = counts.sum()
+    if total <= 0:
+        raise ValueError("pool weights must contain at least one positive weight")
+
+    return values, counts / total
+
+
+def sample_value_pool(
+    locale,
+    method,
+    n,
+    rng,
+    pool_size=DEFAULT_POOL_SIZE,
+    weights=None,
+    as_categorical=False,
+):
+    """
+    Sample n values of a Faker method from its cached value pool.
+
+    Args:
+        locale (str): Faker locale
+        method (str): Name of the Faker method (e.g. "city")
+        n (int): Number of values to sample
+        rng (numpy.random.Generator): Random generator used for sampling
+        pool_size (int): Number of Faker calls used to build the pool
+        weights (dict, optional): Relative weight per value, see
+            get_pool_probabilities
+        as_categorical (bool): Return a pandas.Categorical whose categories
+            are the pool values instead of an object array
+
+    Returns:
+        numpy.ndarray or pandas.Categorical: The n sampled values
+    """
+    values, counts = get_value_pool(locale, method, pool_size)
+    values, probabilities = get_pool_probabilities(values, counts, weights)
+
+    codes = rng.choice(len(values), size=n, p=probabilities)
+    if as_categorical:
+        # The sampled indices are the category codes, no strings are copied
+        return pd.Categorical.from_codes(codes, categories=values)
+
+    return values[codes]
+
+
+def clear_value_pools():
+    """Remove all cached value pools"""
+    with _value_pools_lock:
+        _value_pools.clear()